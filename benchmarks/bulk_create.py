@@ -0,0 +1,109 @@
+"""Benchmarks QueryBuilder.bulk_create.
+
+Measures how fast each grammar compiles large bulk inserts into batched statements,
+then inserts rows into a throw-away SQLite database one statement per row and
+through bulk_create.
+
+    python -m benchmarks.bulk_create
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+from timeit import default_timer as timer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DB_CONFIG_PATH", "config/test-database")
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import (
+    MSSQLGrammar,
+    MySQLGrammar,
+    PostgresGrammar,
+    SQLiteGrammar,
+)
+
+GRAMMARS = {
+    "mysql": MySQLGrammar,
+    "postgres": PostgresGrammar,
+    "sqlite": SQLiteGrammar,
+    "mssql": MSSQLGrammar,
+}
+
+
+def make_rows(amount):
+    return [
+        {"name": f"user {index}", "email": f"user{index}@example.com", "age": index}
+        for index in range(amount)
+    ]
+
+
+def compile_batches(grammar, rows):
+    builder = QueryBuilder(grammar, table="users")
+    size = builder.get_bulk_batch_size(len(rows[0]))
+    statements = {}
+    for offset in range(0, len(rows), size):
+        batch = rows[offset : offset + size]
+        if len(batch) not in statements:
+            statements[len(batch)] = (
+                grammar(columns=batch, table="users")
+                .compile("bulk_create", qmark=True)
+                .to_sql()
+            )
+    return size
+
+
+def insert_row_by_row(database, rows):
+    connection = sqlite3.connect(database)
+    for row in rows:
+        connection.execute(
+            "INSERT INTO users (age, email, name) VALUES (?, ?, ?)",
+            (row["age"], row["email"], row["name"]),
+        )
+        connection.commit()
+    connection.close()
+
+
+def insert_in_bulk(database, rows):
+    details = {"default": "bench", "bench": {"driver": "sqlite", "database": database}}
+    QueryBuilder(
+        SQLiteGrammar, connection="bench", table="users", connection_details=details
+    ).on("bench").bulk_create(rows, transaction=True)
+
+
+def run(sizes=(10_000, 100_000)):
+    for size in sizes:
+        rows = make_rows(size)
+        for name, grammar in GRAMMARS.items():
+            start = timer()
+            batch = compile_batches(grammar, rows)
+            elapsed = timer() - start
+            print(
+                f"compile {name:>8} {size:>7} rows in batches of {batch:>5}: "
+                f"{elapsed:.3f}s, {size / elapsed:,.0f} rows/s"
+            )
+
+    rows = make_rows(sizes[0])
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "bench.sqlite3")
+        sqlite3.connect(database).execute(
+            "CREATE TABLE users (age INTEGER, email VARCHAR, name VARCHAR)"
+        )
+
+        start = timer()
+        insert_row_by_row(database, rows)
+        single = timer() - start
+
+        start = timer()
+        insert_in_bulk(database, rows)
+        bulk = timer() - start
+
+    print(
+        f"insert sqlite {len(rows)} rows: row by row {single:.3f}s, "
+        f"bulk_create {bulk:.3f}s, {single / bulk:.1f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    run()
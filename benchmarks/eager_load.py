@@ -0,0 +1,94 @@
+"""Benchmarks stitching eager loaded relationships onto their parent models.
+
+Stitches a has_one and a has_many relationship onto a growing number of parents,
+once scanning the related result per parent (the previous Collection.where path)
+and once through the related index built by map_related. The scan grows with
+parents x related rows while the index grows linearly.
+
+    python -m benchmarks.eager_load
+"""
+
+import os
+import sys
+from timeit import default_timer as timer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DB_CONFIG_PATH", "config/test-database")
+
+from src.masoniteorm.models import Model
+from src.masoniteorm.relationships import has_many, has_one
+
+
+class Article(Model):
+    __timestamps__ = False
+
+
+class Profile(Model):
+    __timestamps__ = False
+
+
+class User(Model):
+    __timestamps__ = False
+
+    @has_one("user_id", "id")
+    def profile(self):
+        return Profile
+
+    @has_many("id", "user_id")
+    def articles(self):
+        return Article
+
+
+def make_models(parents, articles_per_parent=3):
+    users = User.hydrate([{"id": index} for index in range(parents)])
+    profiles = Profile.hydrate(
+        [{"id": index, "user_id": index} for index in range(parents)]
+    )
+    articles = Article.hydrate(
+        [
+            {"id": index, "user_id": index % parents}
+            for index in range(parents * articles_per_parent)
+        ]
+    )
+    return users, profiles, articles
+
+
+def stitch_by_scanning(users, profiles, articles):
+    for user in users:
+        user.add_relation(
+            {
+                "profile": profiles.where("user_id", user.id).first(),
+                "articles": articles.where("user_id", user.id),
+            }
+        )
+
+
+def stitch_by_index(users, profiles, articles):
+    for key, related, result in (
+        ("profile", User.profile, profiles),
+        ("articles", User.articles, articles),
+    ):
+        index = related.map_related(result)
+        for user in users:
+            related.register_related(key, user, index)
+
+
+def measure(callback, *models):
+    start = timer()
+    callback(*models)
+    return timer() - start
+
+
+def run(sizes=(100, 200, 400, 800)):
+    for size in sizes:
+        users, profiles, articles = make_models(size)
+        scanned = measure(stitch_by_scanning, users, profiles, articles)
+        indexed = measure(stitch_by_index, users, profiles, articles)
+        print(
+            f"stitch {size:>6} parents: scan {scanned:.3f}s, "
+            f"index {indexed:.3f}s, {scanned / indexed:.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    run()
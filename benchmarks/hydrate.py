@@ -0,0 +1,72 @@
+"""Benchmarks Model.hydrate over large result sets.
+
+Compares booting a model per row (the previous hydration path) with the bulk
+hydration path that defers booting until a model first uses its builder.
+
+    python -m benchmarks.hydrate
+"""
+
+import os
+import sys
+from timeit import default_timer as timer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DB_CONFIG_PATH", "config/test-database")
+
+from src.masoniteorm.models import Model
+
+
+class User(Model):
+    __dates__ = ["verified_at"]
+
+
+def make_rows(amount):
+    return [
+        {
+            "id": index,
+            "name": f"user {index}",
+            "email": f"user{index}@example.com",
+            "verified_at": None,
+            "created_at": "2020-11-28 11:42:07",
+            "updated_at": None,
+        }
+        for index in range(amount)
+    ]
+
+
+def hydrate_booting_every_row(rows):
+    models = []
+    for row in rows:
+        model = User()
+        model.__attributes__.update(
+            {
+                key: model.get_new_date(value)
+                if value and key in model.get_dates()
+                else value
+                for key, value in row.items()
+            }
+        )
+        model.__original_attributes__.update(row)
+        models.append(model)
+    return models
+
+
+def measure(callback, rows):
+    start = timer()
+    callback(rows)
+    return timer() - start
+
+
+def run(sizes=(10_000, 100_000)):
+    for size in sizes:
+        rows = make_rows(size)
+        booted = measure(hydrate_booting_every_row, rows)
+        bulk = measure(User.hydrate, rows)
+        print(
+            f"hydrate {size:>7} rows: booting {booted:.3f}s, bulk {bulk:.3f}s, "
+            f"{booted / bulk:.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -64,6 +64,7 @@ setup(
     # simple. Or you can use find_packages().
     packages=[
         "masoniteorm",
+        "masoniteorm.cache",
         "masoniteorm.collection",
         "masoniteorm.commands",
         "masoniteorm.connections",
@@ -91,7 +92,8 @@ setup(
     # $ pip install -e .[dev,test]
     # $ pip install your-package[dev,test]
     extras_require={
-        "test": ["coverage", "pytest"],
+        "test": ["coverage", "pytest", "aiosqlite"],
+        "async": ["aiosqlite"],
     },
     # If there are data files included in your packages that need to be
     # installed, specify them here.  If using Python 2.6 or less, then these
@@ -0,0 +1,112 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+from .ResultCache import ResultCache
+
+
+class MemoryResultCache(ResultCache):
+    """An in-process LRU result cache bounded by a number of entries and by the size of
+    the pickled rows it holds. The least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024):
+        """MemoryResultCache initializer
+
+        Keyword Arguments:
+            max_entries {int} -- The maximum number of entries kept. (default: {1024})
+            max_bytes {int} -- The maximum size of the pickled rows kept. A result larger
+                    than this is never stored. (default: {64 MiB})
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._generations = {}
+        self._bytes = 0
+        self._stats["evictions"] = 0
+
+    def read(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            payload, expires_at, _ = entry
+            if expires_at is not None and expires_at <= monotonic():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return payload
+
+    def write(self, key, payload, ttl, tags, generations=None):
+        if len(payload) > self.max_bytes or not self.max_entries:
+            return False
+
+        expires_at = monotonic() + ttl if ttl else None
+        with self._lock:
+            if generations and any(
+                self._generations.get(tag, 0) != generation
+                for tag, generation in generations.items()
+            ):
+                return False
+
+            self._remove(key)
+            self._entries[key] = (payload, expires_at, tags)
+            self._bytes += len(payload)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._count("evictions")
+
+            return key in self._entries
+
+    def read_generations(self, tags):
+        with self._lock:
+            return {tag: self._generations.get(tag, 0) for tag in tags}
+
+    def delete_tagged(self, tags):
+        forgotten = 0
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for key in self._tags.get(tag, set()).copy():
+                    self._remove(key)
+                    forgotten += 1
+
+        return forgotten
+
+    def forget(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def flush(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def stats(self):
+        stats = super().stats()
+        with self._lock:
+            stats.update({"entries": len(self._entries), "bytes": self._bytes})
+        return stats
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        payload, _, tags = entry
+        self._bytes -= len(payload)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
@@ -0,0 +1,169 @@
+import hashlib
+import pickle
+import threading
+
+
+class ResultCache:
+    """Base class of the backends storing the raw rows of queries run with
+    QueryBuilder.remember.
+
+    Rows are pickled when stored and unpickled when read so every hit gets its own copy.
+    Each entry carries tags. The tables of a query are tagged automatically, so the
+    writes run through the query builder on a table can forget every result read from it.
+
+    Every tag has a generation, bumped each time the tag is invalidated. Rows read while
+    one of their tags was invalidated are not stored, since they may predate the write.
+    """
+
+    MISSING = object()
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    @staticmethod
+    def make_key(connection, sql, bindings, results="*"):
+        """Gets the key of a query result.
+
+        Arguments:
+            connection {string} -- The connection name.
+            sql {string} -- The compiled qmark SQL.
+            bindings {tuple} -- The query bindings.
+
+        Keyword Arguments:
+            results {str|1} -- "*" for every row or 1 for the first one. (default: {"*"})
+
+        Returns:
+            string
+        """
+        fingerprint = repr((connection, sql, tuple(bindings), results))
+        return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def table_tag(connection, table):
+        """Gets the tag added to the results read from a table.
+
+        Arguments:
+            connection {string} -- The connection name.
+            table {string} -- The table name.
+
+        Returns:
+            string
+        """
+        return f"table:{connection}:{table}"
+
+    def get(self, key, default=None):
+        """Gets the rows stored under a key.
+
+        Arguments:
+            key {string} -- The cache key.
+
+        Keyword Arguments:
+            default {any} -- Returned when nothing is stored or the entry expired. (default: {None})
+
+        Returns:
+            list|dict|None
+        """
+        payload = self.read(key)
+        if payload is None:
+            self._count("misses")
+            return default
+
+        self._count("hits")
+        return pickle.loads(payload)
+
+    def put(self, key, rows, ttl=None, tags=(), generations=None):
+        """Stores the rows of a query.
+
+        Arguments:
+            key {string} -- The cache key.
+            rows {list|dict|None} -- The raw rows returned by the connection.
+
+        Keyword Arguments:
+            ttl {int|float} -- Seconds the rows are kept for. None keeps them until they
+                    are evicted or invalidated. (default: {None})
+            tags {list} -- The tags of the entry. (default: {()})
+            generations {dict} -- The generations of the tags read before the query ran.
+                    The rows are not stored if one of them changed since. (default: {None})
+
+        Returns:
+            bool -- Whether the rows were stored.
+        """
+        stored = self.write(
+            key,
+            pickle.dumps(rows, pickle.HIGHEST_PROTOCOL),
+            ttl,
+            tuple(tags),
+            generations,
+        )
+        if stored:
+            self._count("stores")
+        return stored
+
+    def get_generations(self, tags):
+        """Gets the generation of each tag, to be given to put once the query ran.
+
+        Arguments:
+            tags {list} -- The tags.
+
+        Returns:
+            dict -- The generations keyed by tag.
+        """
+        return self.read_generations(tuple(tags))
+
+    def invalidate_tags(self, tags):
+        """Forgets every entry carrying one of the tags.
+
+        Arguments:
+            tags {list} -- The tags.
+
+        Returns:
+            int -- The number of entries forgotten.
+        """
+        forgotten = self.delete_tagged(tuple(tags))
+        if forgotten:
+            self._count("invalidations", forgotten)
+        return forgotten
+
+    def stats(self):
+        """Returns a snapshot of the cache statistics.
+
+        Returns:
+            dict
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, stat, amount=1):
+        with self._stats_lock:
+            self._stats[stat] += amount
+
+    def read(self, key):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the read method."
+        )
+
+    def write(self, key, payload, ttl, tags, generations=None):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the write method."
+        )
+
+    def read_generations(self, tags):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the read_generations method."
+        )
+
+    def delete_tagged(self, tags):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the delete_tagged method."
+        )
+
+    def forget(self, key):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the forget method."
+        )
+
+    def flush(self):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the flush method."
+        )
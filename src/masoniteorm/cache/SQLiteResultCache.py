@@ -0,0 +1,204 @@
+import sqlite3
+import threading
+from time import time
+
+from .ResultCache import ResultCache
+
+
+class SQLiteResultCache(ResultCache):
+    """A result cache stored in a SQLite database file, so cached results survive restarts
+    and are shared by every process using the same file.
+
+    When more than max_entries results are stored the ones stored first are evicted.
+    The generations of the tags are kept in the same file, so a process does not store
+    rows read while another process invalidated them.
+    """
+
+    def __init__(self, path, max_entries=10000, table="masonite_result_cache"):
+        """SQLiteResultCache initializer
+
+        Arguments:
+            path {string} -- The path of the database file.
+
+        Keyword Arguments:
+            max_entries {int} -- The maximum number of entries kept. (default: {10000})
+            table {string} -- The table holding the entries. Tags are kept in the same
+                    table name suffixed with "_tags" and their generations in the table
+                    name suffixed with "_generations". (default: {"masonite_result_cache"})
+        """
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.table = table
+        self._lock = threading.Lock()
+        self._stats["evictions"] = 0
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS "{table}" (
+                "key" TEXT PRIMARY KEY,
+                "payload" BLOB NOT NULL,
+                "expires_at" REAL,
+                "stored_at" REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS "{table}_tags" (
+                "tag" TEXT NOT NULL,
+                "key" TEXT NOT NULL,
+                PRIMARY KEY ("tag", "key")
+            );
+            CREATE INDEX IF NOT EXISTS "{table}_tags_key" ON "{table}_tags" ("key");
+            CREATE TABLE IF NOT EXISTS "{table}_generations" (
+                "tag" TEXT PRIMARY KEY,
+                "generation" INTEGER NOT NULL
+            );
+            """
+        )
+
+    def read(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                f'SELECT "payload", "expires_at" FROM "{self.table}" WHERE "key" = ?',
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            payload, expires_at = row
+            if expires_at is not None and expires_at <= time():
+                self._delete('"key" = ?', (key,))
+                return None
+
+            return payload
+
+    def write(self, key, payload, ttl, tags, generations=None):
+        if not self.max_entries:
+            return False
+
+        now = time()
+        with self._lock:
+            # Locks the file so no process invalidates a tag between the check and the write
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                if generations and self._read_generations(generations) != generations:
+                    self._connection.execute("ROLLBACK")
+                    return False
+
+                self._delete('"key" = ?', (key,))
+                self._connection.execute(
+                    f'INSERT INTO "{self.table}" '
+                    '("key", "payload", "expires_at", "stored_at") VALUES (?, ?, ?, ?)',
+                    (key, payload, now + ttl if ttl else None, now),
+                )
+                self._connection.executemany(
+                    f'INSERT OR IGNORE INTO "{self.table}_tags" ("tag", "key") '
+                    "VALUES (?, ?)",
+                    [(tag, key) for tag in tags],
+                )
+
+                (size,) = self._connection.execute(
+                    f'SELECT COUNT(*) FROM "{self.table}"'
+                ).fetchone()
+                if size > self.max_entries:
+                    self._delete(
+                        f'"key" IN (SELECT "key" FROM "{self.table}" '
+                        'ORDER BY "stored_at" LIMIT ?)',
+                        (size - self.max_entries,),
+                    )
+                    self._count("evictions", size - self.max_entries)
+
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        return True
+
+    def read_generations(self, tags):
+        with self._lock:
+            return self._read_generations(tags)
+
+    def delete_tagged(self, tags):
+        if not tags:
+            return 0
+
+        placeholders = ", ".join("?" for _ in tags)
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.executemany(
+                    f'INSERT OR IGNORE INTO "{self.table}_generations" ("tag", "generation") '
+                    "VALUES (?, 0)",
+                    [(tag,) for tag in tags],
+                )
+                self._connection.execute(
+                    f'UPDATE "{self.table}_generations" SET "generation" = "generation" + 1 '
+                    f'WHERE "tag" IN ({placeholders})',
+                    tags,
+                )
+                forgotten = self._delete(
+                    f'"key" IN (SELECT "key" FROM "{self.table}_tags" '
+                    f'WHERE "tag" IN ({placeholders}))',
+                    tags,
+                )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        return forgotten
+
+    def forget(self, key):
+        with self._lock:
+            self._delete('"key" = ?', (key,))
+
+    def flush(self):
+        with self._lock:
+            self._connection.execute(f'DELETE FROM "{self.table}"')
+            self._connection.execute(f'DELETE FROM "{self.table}_tags"')
+
+    def close(self):
+        """Closes the connection to the database file."""
+        with self._lock:
+            self._connection.close()
+
+    def stats(self):
+        stats = super().stats()
+        with self._lock:
+            (stats["entries"],) = self._connection.execute(
+                f'SELECT COUNT(*) FROM "{self.table}"'
+            ).fetchone()
+        return stats
+
+    def _read_generations(self, tags):
+        generations = dict.fromkeys(tags, 0)
+        if generations:
+            placeholders = ", ".join("?" for _ in generations)
+            generations.update(
+                self._connection.execute(
+                    f'SELECT "tag", "generation" FROM "{self.table}_generations" '
+                    f'WHERE "tag" IN ({placeholders})',
+                    tuple(generations),
+                ).fetchall()
+            )
+        return generations
+
+    def _delete(self, condition, bindings):
+        keys = [
+            key
+            for (key,) in self._connection.execute(
+                f'SELECT "key" FROM "{self.table}" WHERE {condition}', tuple(bindings)
+            ).fetchall()
+        ]
+        if not keys:
+            return 0
+
+        placeholders = ", ".join("?" for _ in keys)
+        self._connection.execute(
+            f'DELETE FROM "{self.table}" WHERE "key" IN ({placeholders})', keys
+        )
+        self._connection.execute(
+            f'DELETE FROM "{self.table}_tags" WHERE "key" IN ({placeholders})', keys
+        )
+        return len(keys)
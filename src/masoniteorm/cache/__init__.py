@@ -0,0 +1,3 @@
+from .ResultCache import ResultCache
+from .MemoryResultCache import MemoryResultCache
+from .SQLiteResultCache import SQLiteResultCache
@@ -0,0 +1,280 @@
+from timeit import default_timer as timer
+
+from ..exceptions import QueryException
+from .BaseConnection import BaseConnection
+from .ConnectionResolver import ConnectionResolver
+from .ReplicaRouter import ReplicaRouter
+
+
+class AsyncBaseConnection(BaseConnection):
+    """Base class of the connections awaiting I/O through an asyncio driver.
+
+    Async connections take the same connection details as their blocking counterparts
+    and are used by the AsyncQueryBuilder. Every method touching the database is a
+    coroutine.
+    """
+
+    def __init__(
+        self,
+        host=None,
+        database=None,
+        user=None,
+        port=None,
+        password=None,
+        prefix=None,
+        full_details=None,
+        options=None,
+        name=None,
+    ):
+        self.host = host
+        if port:
+            self.port = int(port)
+        else:
+            self.port = port
+        self.database = database
+        self.user = user
+        self.password = password
+        self.prefix = prefix
+        self.full_details = full_details or {}
+        self.options = options or {}
+        self._cursor = None
+        self.transaction_level = 0
+        self.open = 0
+        self.schema = None
+        if name:
+            self.name = name
+
+    async def make_connection(self):
+        """This sets the connection on the connection class"""
+        if self.has_global_connection():
+            return self.get_global_connection()
+
+        self._connection = await self.acquire_connection()
+
+        await self.enable_disable_foreign_keys()
+
+        self.open = 1
+
+        return self
+
+    async def create_connection(self):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the create_connection method."
+        )
+
+    async def close_physical_connection(self, connection):
+        await connection.close()
+
+    def get_connection_pool(self):
+        """Gets the pool shared by every async connection with the same name on the running event loop.
+
+        Returns:
+            masoniteorm.connections.AsyncConnectionPool|None -- None when pooling is disabled for this connection.
+        """
+        if not self.full_details.get("connection_pooling_enabled"):
+            return None
+
+        return ConnectionResolver().get_async_connection_pool(self)
+
+    async def acquire_connection(self):
+        """Borrows a physical connection from the pool or creates a new one when pooling is disabled."""
+        pool = self.get_connection_pool()
+        if pool:
+            connection = await pool.acquire()
+        else:
+            connection = await self.create_connection()
+
+        ReplicaRouter.checkout(self.name, self.full_details)
+        return connection
+
+    async def close_connection(self):
+        """Gives the physical connection back to the pool or closes it when pooling is disabled.
+        A held connection stays open until it is released.
+        """
+        if self._connection is None or self._held:
+            return
+
+        pool = self.get_connection_pool()
+        if pool:
+            await pool.release(self._connection)
+        else:
+            await self.close_physical_connection(self._connection)
+
+        ReplicaRouter.checkin(self.name, self.full_details)
+        self._connection = None
+        self.open = 0
+
+    async def hold(self):
+        """Keeps the physical connection open after every query until release is called.
+
+        Returns:
+            self
+        """
+        if not self.open:
+            await self.make_connection()
+
+        self._held = True
+        return self
+
+    async def release(self):
+        """Stops holding the physical connection and closes it, or gives it back to the pool.
+
+        Returns:
+            self
+        """
+        self._held = False
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def ping_connection(self, connection):
+        """Checks a pooled connection is still usable before it is handed out.
+
+        Arguments:
+            connection {object} -- A physical connection.
+
+        Returns:
+            bool
+        """
+        await self.execute(connection, "SELECT 1", (), results=1)
+        return True
+
+    async def reset_connection(self, connection):
+        """Rolls back anything left open on a physical connection before it goes back to the pool.
+
+        Arguments:
+            connection {object} -- A physical connection.
+        """
+        pass
+
+    def has_global_connection(self):
+        return self.name in ConnectionResolver().get_async_global_connections()
+
+    def get_global_connection(self):
+        return ConnectionResolver().get_async_global_connections()[self.name]
+
+    async def execute(self, connection, query, bindings, results="*"):
+        """Runs a query on a physical connection through the driver.
+
+        Arguments:
+            connection {object} -- A physical connection.
+            query {string} -- A query using the placeholder style of the driver.
+            bindings {tuple} -- A tuple of bindings.
+
+        Keyword Arguments:
+            results {str|1} -- "*" to fetch every row or 1 to fetch the first one. (default: {"*"})
+
+        Returns:
+            list|dict|None
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement the execute method."
+        )
+
+    async def statement(self, query, bindings=(), results="*"):
+        """Wrapper around running a query on the connection. Helpful for logging output.
+
+        Arguments:
+            query {string} -- A query using the placeholder style of the driver.
+
+        Keyword Arguments:
+            bindings {tuple} -- Tuple of query bindings. (default: {()})
+            results {str|1} -- "*" to fetch every row or 1 to fetch the first one. (default: {"*"})
+
+        Returns:
+            list|dict|None
+        """
+        start = timer()
+        result = await self.execute(self._connection, query, tuple(bindings), results)
+        end = "{:.2f}".format(timer() - start)
+
+        if self.full_details and self.full_details.get("log_queries", False):
+            self.log(query, bindings, query_time=end)
+
+        return result
+
+    async def query(self, query, bindings=(), results="*"):
+        """Make the actual query that will reach the database and come back with a result.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Keyword Arguments:
+            results {str|1} -- If the results is equal to an asterisks it will fetch every row
+                    else it will return a single record. (default: {"*"})
+
+        Returns:
+            dict|list|None -- Returns a dictionary of results or None
+        """
+        if self._dry:
+            return {}
+
+        if not self.open:
+            await self.make_connection()
+
+        try:
+            if isinstance(query, list):
+                for q in query:
+                    await self.statement(self.format_qmark(q), ())
+                return
+
+            return await self.statement(
+                self.format_qmark(query), bindings or (), results
+            )
+        except Exception as e:
+            raise QueryException(str(e)) from e
+        finally:
+            if self.get_transaction_level() <= 0:
+                await self.close_connection()
+
+    def get_transaction_level(self):
+        return self.transaction_level
+
+    def get_cursor(self):
+        return self._cursor
+
+    async def begin(self):
+        if self.get_transaction_level() == 0:
+            await self.execute(self._connection, "BEGIN", ())
+        self.transaction_level += 1
+        return self
+
+    async def commit(self):
+        if self.get_transaction_level() == 1:
+            await self.execute(self._connection, "COMMIT", ())
+
+        self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def rollback(self):
+        if self.get_transaction_level() == 1:
+            await self.execute(self._connection, "ROLLBACK", ())
+
+        self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def enable_disable_foreign_keys(self):
+        foreign_keys = self.full_details.get("foreign_keys")
+        platform = self.get_default_platform()()
+
+        if foreign_keys:
+            await self.execute(
+                self._connection, platform.enable_foreign_key_constraints(), ()
+            )
+        elif foreign_keys is not None:
+            await self.execute(
+                self._connection, platform.disable_foreign_key_constraints(), ()
+            )
+
+    def select_many(self, query, bindings, amount):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support streaming results."
+        )
@@ -0,0 +1,143 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from .AsyncConnectionPool import AsyncConnectionPool
+
+# The async connections in a transaction, per asyncio task
+_async_connections = ContextVar("masoniteorm_async_connections", default={})
+
+
+class AsyncConnectionResolver:
+    """The asyncio side of the ConnectionResolver: the async pools and transactions.
+
+    It relies on Python 3.7 asyncio features, so the ConnectionResolver only imports this
+    module the first time an async API is used.
+    """
+
+    _connection_pools = {}
+
+    def __init__(self, resolver):
+        """AsyncConnectionResolver initializer
+
+        Arguments:
+            resolver {masoniteorm.connections.ConnectionResolver} -- The resolver holding the connection details.
+        """
+        self.resolver = resolver
+
+    def get_global_connections(self):
+        return _async_connections.get()
+
+    def get_connection_pool(self, connection):
+        """Gets the async pool for a connection on the running event loop, creating it the
+        first time the connection name is used on that loop.
+
+        Arguments:
+            connection {masoniteorm.connections.AsyncBaseConnection} -- The async connection class instance.
+
+        Returns:
+            masoniteorm.connections.AsyncConnectionPool
+        """
+        loop = asyncio.get_running_loop()
+        key = (
+            connection.name,
+            getattr(connection, "schema", None),
+            connection.host,
+            connection.port,
+            connection.database,
+            id(loop),
+        )
+        pool = self._connection_pools.get(key)
+        if pool and pool.loop is loop:
+            return pool
+
+        details = connection.full_details
+        pool = AsyncConnectionPool(
+            connection.create_connection,
+            min_size=details.get("connection_pooling_min_size") or 0,
+            max_size=details.get("connection_pooling_max_size") or 100,
+            timeout=details.get("connection_pooling_timeout", 30),
+            max_idle=details.get("connection_pooling_max_idle"),
+            max_lifetime=details.get("connection_pooling_max_lifetime"),
+            validator=(
+                connection.ping_connection
+                if details.get("connection_pooling_validate", True)
+                else None
+            ),
+            reset=connection.reset_connection,
+            closer=connection.close_physical_connection,
+        )
+        self.__class__._connection_pools[key] = pool
+
+        return pool
+
+    async def close_connection_pools(self):
+        """Closes the idle connections of every async pool of the running event loop and forgets them."""
+        loop = asyncio.get_running_loop()
+        pools = {
+            key: pool
+            for key, pool in self._connection_pools.items()
+            if pool.loop is loop
+        }
+        self.__class__._connection_pools = {
+            key: pool
+            for key, pool in self._connection_pools.items()
+            if key not in pools
+        }
+
+        for pool in pools.values():
+            await pool.close()
+
+    async def begin_transaction(self, name=None):
+        """Starts a transaction on an async connection shared by every AsyncQueryBuilder
+        query on that connection name in the current asyncio task.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+
+        Returns:
+            masoniteorm.connections.AsyncBaseConnection
+        """
+        if name is None:
+            name = self.resolver.get_connection_details()["default"]
+
+        driver = self.resolver.get_connection_details()[name].get("driver")
+
+        connection = await self.resolver.connection_factory.make_async(driver)(
+            **self.resolver.get_connection_information(name), name=name
+        ).make_connection()
+        await connection.begin()
+
+        _async_connections.set({**_async_connections.get(), name: connection})
+
+        return connection
+
+    def _pop_global_connection(self, name):
+        if name is None:
+            name = self.resolver.get_connection_details()["default"]
+
+        connections = dict(_async_connections.get())
+        connection = connections.pop(name)
+        _async_connections.set(connections)
+        return connection
+
+    async def commit(self, name=None):
+        await self._pop_global_connection(name).commit()
+
+    async def rollback(self, name=None):
+        await self._pop_global_connection(name).rollback()
+
+    @asynccontextmanager
+    async def transaction(self, name=None):
+        connection = await self.begin_transaction(name)
+        try:
+            yield connection
+        except BaseException:
+            await self.rollback(name)
+            raise
+
+        try:
+            await self.commit(name)
+        except Exception:
+            await connection.rollback()
+            raise
@@ -0,0 +1,78 @@
+from ..exceptions import DriverNotFound
+from ..query.grammars import MySQLGrammar
+from ..query.processors import MySQLPostProcessor
+from ..schema.platforms import MySQLPlatform
+from .AsyncBaseConnection import AsyncBaseConnection
+
+
+class AsyncMySQLConnection(AsyncBaseConnection):
+    """Async MYSQL Connection class using aiomysql."""
+
+    name = "mysql"
+
+    async def create_connection(self):
+        try:
+            import aiomysql
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'aiomysql' package "
+                "installed to make an async connection to MySQL. "
+                "Please install it using 'pip install aiomysql'"
+            )
+        import pendulum
+        import pymysql.converters
+
+        pymysql.converters.conversions[pendulum.DateTime] = (
+            pymysql.converters.escape_datetime
+        )
+
+        return await aiomysql.connect(
+            cursorclass=aiomysql.DictCursor,
+            autocommit=True,
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            port=self.port or 3306,
+            db=self.database,
+            **self.options
+        )
+
+    async def close_physical_connection(self, connection):
+        await connection.ensure_closed()
+
+    async def ping_connection(self, connection):
+        await connection.ping(reconnect=False)
+        return True
+
+    async def reset_connection(self, connection):
+        from pymysql.constants.SERVER_STATUS import SERVER_STATUS_IN_TRANS
+
+        if connection.server_status & SERVER_STATUS_IN_TRANS:
+            await connection.rollback()
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return MySQLGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return MySQLPlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return MySQLPostProcessor
+
+    def get_database_name(self):
+        return self.database
+
+    def format_qmark(self, query):
+        return query.replace("'?'", "%s")
+
+    async def execute(self, connection, query, bindings, results="*"):
+        async with connection.cursor() as cursor:
+            self._cursor = cursor
+            await cursor.execute(query, bindings or None)
+            if results == 1:
+                return await cursor.fetchone()
+
+            return list(await cursor.fetchall())
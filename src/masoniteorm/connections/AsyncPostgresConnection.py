@@ -0,0 +1,71 @@
+import re
+
+from ..exceptions import DriverNotFound
+from ..query.grammars import PostgresGrammar
+from ..query.processors import PostgresPostProcessor
+from ..schema.platforms import PostgresPlatform
+from .AsyncBaseConnection import AsyncBaseConnection
+
+
+class AsyncPostgresConnection(AsyncBaseConnection):
+    """Async Postgres Connection class using asyncpg."""
+
+    name = "postgres"
+
+    async def create_connection(self):
+        try:
+            import asyncpg
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'asyncpg' package installed to make an async connection to Postgres. Please install it using 'pip install asyncpg'"
+            )
+
+        schema = self.schema or self.full_details.get("schema")
+
+        return await asyncpg.connect(
+            database=self.database,
+            user=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            ssl=self.options.get("sslmode"),
+            server_settings={"search_path": schema} if schema else None,
+        )
+
+    async def reset_connection(self, connection):
+        if connection.is_in_transaction():
+            await connection.execute("ROLLBACK")
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return PostgresGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return PostgresPlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return PostgresPostProcessor
+
+    def get_database_name(self):
+        return self.database
+
+    def format_qmark(self, query):
+        """asyncpg only understands numbered placeholders like $1.
+
+        Arguments:
+            query {string} -- A qmarked query.
+
+        Returns:
+            string
+        """
+        counter = iter(range(1, query.count("'?'") + 1))
+        return re.sub(r"'\?'", lambda match: f"${next(counter)}", query)
+
+    async def execute(self, connection, query, bindings, results="*"):
+        if results == 1:
+            row = await connection.fetchrow(query, *bindings)
+            return dict(row or {})
+
+        return [dict(row) for row in await connection.fetch(query, *bindings)]
@@ -0,0 +1,66 @@
+from ..exceptions import DriverNotFound
+from ..query.grammars import SQLiteGrammar
+from ..query.processors import SQLitePostProcessor
+from ..schema.platforms import SQLitePlatform
+from .AsyncBaseConnection import AsyncBaseConnection
+from .SQLiteConnection import regexp
+
+
+class AsyncSQLiteConnection(AsyncBaseConnection):
+    """Async SQLite Connection class using aiosqlite."""
+
+    name = "sqlite"
+
+    async def create_connection(self):
+        try:
+            import aiosqlite
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'aiosqlite' package installed to make an async connection to SQLite. Please install it using 'pip install aiosqlite'"
+            )
+        import sqlite3
+
+        connection = await aiosqlite.connect(self.database, isolation_level=None)
+        await connection.create_function("REGEXP", 2, regexp)
+
+        connection.row_factory = sqlite3.Row
+
+        return connection
+
+    def get_connection_pool(self):
+        # Every connection to an in memory database is a brand new database.
+        if self.database == ":memory:":
+            return None
+
+        return super().get_connection_pool()
+
+    async def reset_connection(self, connection):
+        if connection.in_transaction:
+            await connection.rollback()
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return SQLiteGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return SQLitePlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return SQLitePostProcessor
+
+    def get_database_name(self):
+        return self.database
+
+    async def execute(self, connection, query, bindings, results="*"):
+        self._cursor = cursor = await connection.execute(query, bindings)
+        try:
+            rows = [dict(row) for row in await cursor.fetchall()]
+        finally:
+            await cursor.close()
+
+        if results == 1:
+            return rows[0] if rows else None
+
+        return rows
@@ -1,12 +1,15 @@
 import logging
 from timeit import default_timer as timer
 from .ConnectionResolver import ConnectionResolver
+from .PreparedStatementCache import PreparedStatementCache
+from .ReplicaRouter import ReplicaRouter
 
 
 class BaseConnection:
     _connection = None
     _cursor = None
     _dry = False
+    _held = False
 
     def dry(self):
         self._dry = True
@@ -40,17 +43,188 @@ class BaseConnection:
                 f"Must set the _cursor attribute on the {self.__class__.__name__} class before calling the 'statement' method."
             )
 
-        self._cursor.execute(query, bindings)
+        if self.uses_prepared_statements(query):
+            self.execute_prepared(query, bindings)
+        else:
+            self._cursor.execute(query, bindings)
         end = "{:.2f}".format(timer() - start)
 
         if self.full_details and self.full_details.get("log_queries", False):
             self.log(query, bindings, query_time=end)
 
+    def uses_prepared_statements(self, query):
+        """Checks if a query runs through a prepared statement. Prepared statements are
+        enabled with the "prepared_statements" connection setting and only used for
+        selects, inserts, updates and deletes.
+
+        Arguments:
+            query {string} -- The query to execute.
+
+        Returns:
+            bool
+        """
+        if not self.full_details.get("prepared_statements") or self._connection is None:
+            return False
+
+        return query.lstrip()[:6].upper() in ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+    def get_prepared_statements(self):
+        """Gets the prepared statements of the current physical connection.
+
+        Returns:
+            masoniteorm.connections.PreparedStatementCache
+        """
+        return PreparedStatementCache.for_connection(
+            self._connection,
+            name=self.name,
+            max_size=self.full_details.get("prepared_statements_max_size") or 100,
+            deallocate=self.deallocate_statement,
+        )
+
+    def execute_prepared(self, query, bindings):
+        """Executes a query through a statement prepared on the physical connection.
+        Drivers without prepared statements execute the query on the cursor.
+
+        Arguments:
+            query {string} -- The query to execute.
+            bindings {tuple} -- Tuple of query bindings.
+        """
+        self._cursor.execute(query, bindings)
+
+    @staticmethod
+    def deallocate_statement(connection, handle):
+        """Releases a prepared statement evicted from the cache of a physical connection.
+        The cache outlives the connection class instance that created it, so only the
+        physical connection is used.
+
+        Arguments:
+            connection {object} -- The physical connection the statement was prepared on.
+            handle {object} -- The handle stored when the statement was prepared.
+        """
+        pass
+
+    def close_physical_connection(self, connection):
+        PreparedStatementCache.forget(connection)
+        connection.close()
+
+    def get_row_count(self):
+        """Gets the number of rows affected by the last statement, as reported by the driver.
+
+        Returns:
+            int
+        """
+        if self._cursor is None or self._cursor.rowcount is None:
+            return 0
+
+        return max(self._cursor.rowcount, 0)
+
+    def get_connection_pool(self):
+        """Gets the pool shared by every connection with the same name.
+
+        Returns:
+            masoniteorm.connections.ConnectionPool|None -- None when pooling is disabled for this connection.
+        """
+        if not self.full_details.get("connection_pooling_enabled"):
+            return None
+
+        return ConnectionResolver().get_connection_pool(self)
+
+    def acquire_connection(self):
+        """Borrows a physical connection from the pool or creates a new one when pooling is disabled."""
+        pool = self.get_connection_pool()
+        if pool:
+            connection = pool.acquire()
+        else:
+            connection = self.create_connection()
+
+        ReplicaRouter.checkout(self.name, self.full_details)
+        return connection
+
+    def close_connection(self):
+        """Gives the physical connection back to the pool or closes it when pooling is disabled.
+        A held connection stays open until it is released.
+        """
+        if self._connection is None or self._held:
+            return
+
+        pool = self.get_connection_pool()
+        if pool:
+            pool.release(self._connection)
+        else:
+            self.close_physical_connection(self._connection)
+
+        ReplicaRouter.checkin(self.name, self.full_details)
+        self._connection = None
+        self.open = 0
+
+    def hold(self):
+        """Keeps the physical connection open after every query until release is called,
+        so the queries run on this connection stop paying the connect overhead.
+
+        Returns:
+            self
+        """
+        if not self.open:
+            self.make_connection()
+
+        self._held = True
+        return self
+
+    def release(self):
+        """Stops holding the physical connection and closes it, or gives it back to the pool.
+        Inside a transaction it is closed when the transaction ends.
+
+        Returns:
+            self
+        """
+        self._held = False
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
+
+        return self
+
+    def is_held(self):
+        return self._held
+
+    def ping_connection(self, connection):
+        """Checks a pooled connection is still usable before it is handed out.
+
+        Arguments:
+            connection {object} -- A physical connection.
+
+        Returns:
+            bool
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+        return True
+
+    def reset_connection(self, connection):
+        """Puts a physical connection back in autocommit mode before it goes back to the pool.
+
+        Arguments:
+            connection {object} -- A physical connection.
+        """
+        if not connection.autocommit:
+            connection.rollback()
+            connection.autocommit = True
+
     def has_global_connection(self):
-        return self.name in ConnectionResolver().get_global_connections()
+        return (
+            self.name in ConnectionResolver().get_global_connections()
+            or self.name in ConnectionResolver().get_held_connections()
+        )
 
     def get_global_connection(self):
-        return ConnectionResolver().get_global_connections()[self.name]
+        connections = ConnectionResolver().get_global_connections()
+        if self.name in connections:
+            return connections[self.name]
+
+        return ConnectionResolver().get_held_connections()[self.name]
 
     def enable_query_log(self):
         self.full_details["log_queries"] = True
@@ -66,16 +240,58 @@ class BaseConnection:
         return self
 
     def select_many(self, query, bindings, amount):
-        self.set_cursor()
-        self.statement(query)
+        """Streams the results of a query in batches using an unbuffered cursor.
+
+        Only one batch is held in memory at a time. The connection is released once
+        every row has been read or the generator is closed.
+
+        Arguments:
+            query {string} -- A qmarked query.
+            bindings {tuple} -- A tuple of bindings.
+            amount {int} -- The number of rows fetched per batch.
+
+        Returns:
+            generator -- Yields lists of rows.
+        """
         if not self.open:
             self.make_connection()
 
-        result = self.format_cursor_results(self._cursor.fetchmany(amount))
-        while result:
-            yield result
+        self._cursor = self.get_stream_cursor(amount)
+
+        try:
+            self.statement(self.format_qmark(query), bindings or ())
 
             result = self.format_cursor_results(self._cursor.fetchmany(amount))
+            while result:
+                yield result
+
+                result = self.format_cursor_results(self._cursor.fetchmany(amount))
+        finally:
+            self.close_stream_cursor()
+            if self.get_transaction_level() <= 0:
+                self.close_connection()
+
+    def get_stream_cursor(self, amount):
+        """Gets a cursor that fetches rows from the server as they are read.
+
+        Arguments:
+            amount {int} -- The number of rows fetched per batch.
+        """
+        return self._connection.cursor()
+
+    def close_stream_cursor(self):
+        self._cursor.close()
+
+    def format_qmark(self, query):
+        """Replaces the qmark placeholders with the placeholder style of the driver.
+
+        Arguments:
+            query {string} -- A qmarked query.
+
+        Returns:
+            string
+        """
+        return query.replace("'?'", "?")
 
     def enable_disable_foreign_keys(self):
         foreign_keys = self.full_details.get("foreign_keys")
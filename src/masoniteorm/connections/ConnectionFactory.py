@@ -1,10 +1,12 @@
 from ..config import load_config
+from ..exceptions import DriverNotFound
 
 
 class ConnectionFactory:
     """Class for controlling the registration and creation of connection types."""
 
     _connections = {}
+    _async_connections = {}
 
     def __init__(self, config_path=None):
         self.config_path = config_path
@@ -23,6 +25,39 @@ class ConnectionFactory:
         cls._connections.update({key: connection})
         return cls
 
+    @classmethod
+    def register_async(cls, key, connection):
+        """Registers the async counterpart of a connection, used by the AsyncQueryBuilder
+
+        Arguments:
+            key {key} -- The driver name of the blocking connection
+            connection {masoniteorm.connections.AsyncBaseConnection} -- An async connection class.
+
+        Returns:
+            cls
+        """
+        cls._async_connections.update({key: connection})
+        return cls
+
+    def make_async(self, key):
+        """Makes the async connection registered for a driver
+
+        Arguments:
+            key {string} -- The driver name
+
+        Raises:
+            DriverNotFound: Raised when the driver has no async connection
+
+        Returns:
+            masoniteorm.connection.AsyncBaseConnection -- An async connection class.
+        """
+        connection = self._async_connections.get(key)
+
+        if connection:
+            return connection
+
+        raise DriverNotFound(f"The '{key}' driver has no async connection")
+
     def make(self, key):
         """Makes already registered connections
 
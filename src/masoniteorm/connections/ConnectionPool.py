@@ -0,0 +1,330 @@
+import threading
+from collections import deque
+from time import monotonic
+
+from ..exceptions import ConnectionPoolTimeout
+
+
+class ConnectionPool:
+    """A thread safe, bounded pool of physical database connections.
+
+    A pool is created per connection name by the ConnectionResolver and is shared by
+    every connection class instance using that name. Connections are created lazily
+    through the creator callable and handed out to one borrower at a time.
+    """
+
+    def __init__(
+        self,
+        creator,
+        min_size=0,
+        max_size=100,
+        timeout=30,
+        max_idle=None,
+        max_lifetime=None,
+        validator=None,
+        reset=None,
+        closer=None,
+    ):
+        """ConnectionPool initializer
+
+        Arguments:
+            creator {callable} -- Returns a new physical connection.
+
+        Keyword Arguments:
+            min_size {int} -- Connections created on first use and kept through idle eviction. (default: {0})
+            max_size {int} -- The maximum number of open connections. (default: {100})
+            timeout {int|float} -- Seconds to wait for a free connection before raising. (default: {30})
+            max_idle {int|float} -- Seconds a connection may sit idle before being closed. (default: {None})
+            max_lifetime {int|float} -- Seconds after which a connection is recycled. (default: {None})
+            validator {callable} -- Returns True if a connection is still usable. Called on borrow. (default: {None})
+            reset {callable} -- Called with a connection when it is given back to the pool. (default: {None})
+            closer {callable} -- Closes a physical connection. (default: {None})
+        """
+        self.creator = creator
+        self.min_size = min(min_size or 0, max_size)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.validator = validator
+        self.reset = reset
+        self.closer = closer or (lambda connection: connection.close())
+
+        self._lock = threading.Condition()
+        self._idle = deque()
+        self._created_at = {}
+        self._size = 0
+        self._in_use = 0
+        self._filled = False
+
+        self._stats = {
+            "created": 0,
+            "closed": 0,
+            "acquired": 0,
+            "released": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "validation_failures": 0,
+            "evicted_idle": 0,
+            "recycled": 0,
+        }
+
+    def acquire(self, timeout=None):
+        """Borrows a connection from the pool, waiting for one to be released if the pool is full.
+
+        Keyword Arguments:
+            timeout {int|float} -- Overrides the pool timeout for this call. (default: {None})
+
+        Raises:
+            ConnectionPoolTimeout: Raised when no connection became available in time.
+
+        Returns:
+            object -- A physical connection.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = monotonic() + timeout
+
+        self._fill()
+
+        while True:
+            connection, create = self._checkout(deadline)
+
+            if create:
+                connection = self._create()
+                with self._lock:
+                    self._stats["acquired"] += 1
+                return connection
+
+            if self._is_expired(connection, monotonic()):
+                with self._lock:
+                    self._stats["recycled"] += 1
+                    self._in_use -= 1
+                self._discard(connection)
+                continue
+
+            if self._validate(connection):
+                with self._lock:
+                    self._stats["acquired"] += 1
+                return connection
+
+            with self._lock:
+                self._stats["validation_failures"] += 1
+                self._in_use -= 1
+            self._discard(connection)
+
+    def release(self, connection):
+        """Gives a borrowed connection back to the pool.
+
+        Arguments:
+            connection {object} -- A connection previously returned by acquire.
+        """
+        if connection is None:
+            return
+
+        with self._lock:
+            known = id(connection) in self._created_at
+
+        if not known:
+            self._close(connection)
+            return
+
+        try:
+            if self.reset:
+                self.reset(connection)
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+            self._discard(connection)
+            return
+
+        now = monotonic()
+        with self._lock:
+            self._in_use -= 1
+            self._stats["released"] += 1
+            if self._is_expired(connection, now):
+                self._stats["recycled"] += 1
+                expired = True
+            else:
+                self._idle.append((connection, now))
+                expired = False
+            self._lock.notify()
+
+        if expired:
+            self._discard(connection)
+
+        self.prune()
+
+    def discard(self, connection):
+        """Closes a borrowed connection instead of giving it back to the pool.
+        Useful when a connection is known to be broken.
+
+        Arguments:
+            connection {object} -- A connection previously returned by acquire.
+        """
+        with self._lock:
+            if id(connection) in self._created_at:
+                self._in_use -= 1
+
+        self._discard(connection)
+
+    def prune(self):
+        """Closes idle connections that exceeded the max idle time or the max lifetime.
+        The pool never evicts below its minimum size for being idle.
+        """
+        now = monotonic()
+        evicted = []
+
+        with self._lock:
+            kept = deque()
+            for connection, last_used in self._idle:
+                if self._is_expired(connection, now):
+                    self._stats["recycled"] += 1
+                    evicted.append(connection)
+                elif (
+                    self.max_idle is not None
+                    and now - last_used > self.max_idle
+                    and self._size - len(evicted) > self.min_size
+                ):
+                    self._stats["evicted_idle"] += 1
+                    evicted.append(connection)
+                else:
+                    kept.append((connection, last_used))
+            self._idle = kept
+
+        for connection in evicted:
+            self._discard(connection)
+
+        return self
+
+    def close(self):
+        """Closes every idle connection held by the pool."""
+        with self._lock:
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._filled = False
+
+        for connection in idle:
+            self._discard(connection)
+
+        return self
+
+    def stats(self):
+        """Returns a snapshot of the pool statistics.
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(
+                {
+                    "size": self._size,
+                    "idle": len(self._idle),
+                    "in_use": self._in_use,
+                    "min_size": self.min_size,
+                    "max_size": self.max_size,
+                }
+            )
+        return stats
+
+    def _fill(self):
+        with self._lock:
+            if self._filled:
+                return
+            self._filled = True
+            missing = max(self.min_size - self._size, 0)
+            self._size += missing
+
+        now = monotonic()
+        for index in range(missing):
+            try:
+                connection = self._create(in_use=False)
+            except Exception:
+                with self._lock:
+                    self._size -= missing - index - 1
+                    self._filled = False
+                raise
+
+            with self._lock:
+                self._idle.append((connection, now))
+                self._lock.notify()
+
+    def _checkout(self, deadline):
+        """Pops an idle connection or reserves a slot for a new one.
+
+        Returns:
+            tuple -- The idle connection (or None) and whether a new connection should be created.
+        """
+        waited = False
+        with self._lock:
+            while True:
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                    self._in_use += 1
+                    return connection, False
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    self._in_use += 1
+                    return None, True
+
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise ConnectionPoolTimeout(
+                        f"Timed out waiting for a connection. The pool is at its maximum size of {self.max_size}."
+                    )
+
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                self._lock.wait(remaining)
+
+    def _create(self, in_use=True):
+        try:
+            connection = self.creator()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                if in_use:
+                    self._in_use -= 1
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._created_at[id(connection)] = monotonic()
+            self._stats["created"] += 1
+
+        return connection
+
+    def _validate(self, connection):
+        if not self.validator:
+            return True
+
+        try:
+            return bool(self.validator(connection))
+        except Exception:
+            return False
+
+    def _is_expired(self, connection, now):
+        if self.max_lifetime is None:
+            return False
+        created_at = self._created_at.get(id(connection), now)
+        return now - created_at > self.max_lifetime
+
+    def _discard(self, connection):
+        with self._lock:
+            if self._created_at.pop(id(connection), None) is not None:
+                self._size -= 1
+            self._lock.notify()
+
+        self._close(connection)
+
+    def _close(self, connection):
+        try:
+            self.closer(connection)
+        except Exception:
+            pass
+
+        with self._lock:
+            self._stats["closed"] += 1
@@ -1,9 +1,17 @@
+import threading
 from contextlib import contextmanager
 
+from .ConnectionPool import ConnectionPool
+from .PreparedStatementCache import PreparedStatementCache
+from .ReplicaRouter import ReplicaRouter
+
 
 class ConnectionResolver:
     _connection_details = {}
     _connections = {}
+    _connection_pools = {}
+    _connection_pools_lock = threading.Lock()
+    _held_connections = threading.local()
     _morph_map = {}
 
     def __init__(self, config_path=None):
@@ -12,6 +20,9 @@ class ConnectionResolver:
             PostgresConnection,
             MySQLConnection,
             MSSQLConnection,
+            AsyncSQLiteConnection,
+            AsyncPostgresConnection,
+            AsyncMySQLConnection,
         )
 
         self.config_path = config_path
@@ -22,6 +33,9 @@ class ConnectionResolver:
         self.register(PostgresConnection)
         self.register(MySQLConnection)
         self.register(MSSQLConnection)
+        self.register_async(AsyncSQLiteConnection)
+        self.register_async(AsyncPostgresConnection)
+        self.register_async(AsyncMySQLConnection)
 
     def morph_map(self, map):
         self._morph_map = map
@@ -41,12 +55,120 @@ class ConnectionResolver:
     def get_global_connections(self):
         return self._connections
 
+    def get_held_connections(self):
+        """Gets the connections held open on the current thread, keyed by connection name.
+
+        Returns:
+            dict
+        """
+        connections = getattr(self._held_connections, "connections", None)
+        if connections is None:
+            connections = self._held_connections.connections = {}
+
+        return connections
+
     def remove_global_connection(self, name=None):
         self._connections.pop(name)
 
     def register(self, connection):
         self.connection_factory.register(connection.name, connection)
 
+    def register_async(self, connection):
+        self.connection_factory.register_async(connection.name, connection)
+
+    def get_async_resolver(self):
+        """Gets the resolver of the async pools and transactions. Its module is imported on
+        first use since it needs Python 3.7 or later.
+
+        Returns:
+            masoniteorm.connections.AsyncConnectionResolver
+        """
+        from .AsyncConnectionResolver import AsyncConnectionResolver
+
+        return AsyncConnectionResolver(self)
+
+    def get_async_global_connections(self):
+        return self.get_async_resolver().get_global_connections()
+
+    def get_connection_pool(self, connection):
+        """Gets the pool for a connection, creating it the first time the connection name is used.
+
+        Pools are keyed per connection name (and schema) so two configured databases
+        using the same driver never share physical connections, and per host so each
+        host of a connection with read and write host groups gets its own pool.
+
+        Arguments:
+            connection {masoniteorm.connections.BaseConnection} -- The connection class instance.
+
+        Returns:
+            masoniteorm.connections.ConnectionPool
+        """
+        key = (
+            connection.name,
+            getattr(connection, "schema", None),
+            connection.host,
+            connection.port,
+            connection.database,
+        )
+        pool = self._connection_pools.get(key)
+        if pool:
+            return pool
+
+        with self._connection_pools_lock:
+            pool = self._connection_pools.get(key)
+            if pool:
+                return pool
+
+            details = connection.full_details
+            pool = ConnectionPool(
+                connection.create_connection,
+                min_size=details.get("connection_pooling_min_size") or 0,
+                max_size=details.get("connection_pooling_max_size") or 100,
+                timeout=details.get("connection_pooling_timeout", 30),
+                max_idle=details.get("connection_pooling_max_idle"),
+                max_lifetime=details.get("connection_pooling_max_lifetime"),
+                validator=(
+                    connection.ping_connection
+                    if details.get("connection_pooling_validate", True)
+                    else None
+                ),
+                reset=connection.reset_connection,
+                closer=connection.close_physical_connection,
+            )
+            self.__class__._connection_pools[key] = pool
+
+        return pool
+
+    def get_async_connection_pool(self, connection):
+        """Gets the async pool for a connection on the running event loop.
+
+        Arguments:
+            connection {masoniteorm.connections.AsyncBaseConnection} -- The async connection class instance.
+
+        Returns:
+            masoniteorm.connections.AsyncConnectionPool
+        """
+        return self.get_async_resolver().get_connection_pool(connection)
+
+    async def close_async_connection_pools(self):
+        """Closes the idle connections of every async pool of the running event loop and forgets them."""
+        await self.get_async_resolver().close_connection_pools()
+        return self
+
+    def get_connection_pools(self):
+        return self._connection_pools
+
+    def close_connection_pools(self):
+        """Closes the idle connections of every pool and forgets the pools."""
+        with self._connection_pools_lock:
+            pools = list(self._connection_pools.values())
+            self.__class__._connection_pools = {}
+
+        for pool in pools:
+            pool.close()
+
+        return self
+
     def begin_transaction(self, name=None):
         if name is None:
             name = self.get_connection_details()["default"]
@@ -55,7 +177,7 @@ class ConnectionResolver:
 
         connection = (
             self.connection_factory.make(driver)(
-                **self.get_connection_information(name)
+                **self.get_connection_information(name), name=name
             )
             .make_connection()
             .begin()
@@ -94,17 +216,243 @@ class ConnectionResolver:
             self.rollback(name)
             raise
 
-    def get_connection_information(self, name):
-        details = self.get_connection_details()
+    async def begin_async_transaction(self, name=None):
+        """Starts a transaction on an async connection shared by every AsyncQueryBuilder
+        query on that connection name in the current asyncio task.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+
+        Returns:
+            masoniteorm.connections.AsyncBaseConnection
+        """
+        return await self.get_async_resolver().begin_transaction(name)
+
+    async def commit_async(self, name=None):
+        await self.get_async_resolver().commit(name)
+
+    async def rollback_async(self, name=None):
+        await self.get_async_resolver().rollback(name)
+
+    def async_transaction(self, name=None):
+        """Runs the AsyncQueryBuilder queries of the block in one transaction, committed when
+        the block exits and rolled back if it raises.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+
+        Returns:
+            async context manager -- Yields the masoniteorm.connections.AsyncBaseConnection.
+        """
+        return self.get_async_resolver().transaction(name)
+
+    def hold_connection(self, name=None):
+        """Opens a connection that every query on that connection name runs on, on the
+        current thread, until release_connection is called. Transactions started in the
+        meantime run on it too.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+
+        Returns:
+            masoniteorm.connections.BaseConnection
+        """
+        if name is None:
+            name = self.get_connection_details()["default"]
+
+        held = self.get_held_connections()
+        if name in held:
+            return held[name]
+
+        driver = self.get_connection_details()[name].get("driver")
+
+        connection = (
+            self.connection_factory.make(driver)(
+                **self.get_connection_information(name), name=name
+            )
+            .make_connection()
+            .hold()
+        )
+        held[name] = connection
+
+        return connection
+
+    def release_connection(self, name=None):
+        """Closes the connection held open for a connection name, or gives it back to the pool.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+        """
+        if name is None:
+            name = self.get_connection_details()["default"]
+
+        connection = self.get_held_connections().pop(name, None)
+        if connection:
+            connection.release()
+
+        return self
+
+    @contextmanager
+    def connection(self, name=None):
+        """Holds one connection open for every query run inside the block, for example
+        for the length of a request, and releases it when the block exits.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+
+        Returns:
+            masoniteorm.connections.BaseConnection
+        """
+        if name is None:
+            name = self.get_connection_details()["default"]
+
+        held = name in self.get_held_connections()
+        connection = self.hold_connection(name)
+        try:
+            yield connection
+        finally:
+            if not held:
+                self.release_connection(name)
+
+    @contextmanager
+    def session(self):
+        """Starts a unit of work. Models saved or registered inside the block are written
+        when the block exits, as grouped bulk statements inside one transaction per connection.
+        Nothing is written if the block raises.
+
+        Returns:
+            masoniteorm.connections.UnitOfWork
+        """
+        from .UnitOfWork import UnitOfWork
+
+        session = UnitOfWork(self).begin()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+
+        session.commit()
+
+    @contextmanager
+    def identity_map(self):
+        """Shares one model instance per model class and primary key across every query
+        run inside the block, for example for the length of a request.
+
+        Returns:
+            masoniteorm.models.IdentityMap
+        """
+        from ..models.IdentityMap import IdentityMap
+
+        with IdentityMap() as identity_map:
+            yield identity_map
+
+    @contextmanager
+    def detect_lazy_loads(self, threshold=2, strict=False):
+        """Reports relationships lazily loaded over and over inside the block, the
+        typical N+1 query pattern.
+
+        Keyword Arguments:
+            threshold {int} -- How many lazy loads of the same relationship are reported. (default: {2})
+            strict {bool} -- Raise LazyLoadingViolation instead of logging a warning. (default: {False})
+
+        Returns:
+            masoniteorm.models.LazyLoadDetector
+        """
+        from ..models.LazyLoading import LazyLoadDetector
+
+        with LazyLoadDetector(threshold=threshold, strict=strict) as detector:
+            yield detector
+
+    @contextmanager
+    def batch_lazy_loads(self):
+        """Loads a relationship lazily accessed on a model for every model of the
+        collection it was hydrated in, in a single query.
+        """
+        from ..models.LazyLoading import BatchLazyLoading
+
+        with BatchLazyLoading() as batch:
+            yield batch
+
+    @contextmanager
+    def sticky_scope(self):
+        """Forgets the writes made on sticky connections by the current thread when the
+        block starts and when it exits, for example around a request. Inside the block the
+        reads of a sticky connection go to its write host once it has been written to.
+        """
+        ReplicaRouter.forget_writes()
+        try:
+            yield self
+        finally:
+            ReplicaRouter.forget_writes()
+
+    def forget_writes(self, name=None):
+        """Sends the reads of sticky connections on the current thread back to their read hosts.
+
+        Keyword Arguments:
+            name {string} -- Only forget the writes of this connection. (default: {None})
+
+        Returns:
+            self
+        """
+        ReplicaRouter.forget_writes(name)
+        return self
+
+    def get_replica_stats(self, name=None):
+        """Gets the number of queries routed to each host of a connection configured with
+        read and write host groups, and the number of connections open on them.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+
+        Returns:
+            dict -- Keyed by group, then by the index of the host in the group.
+        """
+        if not name:
+            name = self.get_connection_details()["default"]
+
+        return ReplicaRouter.stats(name)
+
+    def get_prepared_statement_stats(self, name=None):
+        """Gets the prepared statement hits, misses and evictions of a connection, summed
+        over its physical connections, and the number of statements currently prepared.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+
+        Returns:
+            dict
+        """
+        if not name:
+            name = self.get_connection_details()["default"]
+
+        return PreparedStatementCache.totals(name)
+
+    def get_connection_information(self, name, read=False):
+        """Gets the settings a connection class is created with. Connections configured
+        with read and write host groups use a write host unless read is set.
+
+        Arguments:
+            name {string} -- The connection name.
+
+        Keyword Arguments:
+            read {bool} -- Route to a read host. (default: {False})
+
+        Returns:
+            dict
+        """
+        details = ReplicaRouter.route(
+            name, self.get_connection_details().get(name, {}), read=read
+        )
         return {
-            "host": details.get(name, {}).get("host"),
-            "database": details.get(name, {}).get("database"),
-            "user": details.get(name, {}).get("user"),
-            "port": details.get(name, {}).get("port"),
-            "password": details.get(name, {}).get("password"),
-            "prefix": details.get(name, {}).get("prefix"),
-            "options": details.get(name, {}).get("options", {}),
-            "full_details": details.get(name, {}),
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
 
     def get_schema_builder(self, connection="default", schema=None):
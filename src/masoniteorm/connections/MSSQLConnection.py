@@ -6,9 +6,6 @@ from ..query.processors import MSSQLPostProcessor
 from ..exceptions import QueryException
 
 
-CONNECTION_POOL = []
-
-
 class MSSQLConnection(BaseConnection):
     """MSSQL Connection class."""
 
@@ -55,6 +52,16 @@ class MSSQLConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
+        self._connection = self.acquire_connection()
+
+        self.enable_disable_foreign_keys()
+
+        self.open = 1
+        return self
+
+    def create_connection(self):
+        import pyodbc
+
         driver = self.options.get("driver", "ODBC Driver 17 for SQL Server")
         integrated_security = self.options.get("integrated_security")
         connection_timeout = str(self.options.get("connection_timeout", "30"))
@@ -65,16 +72,11 @@ class MSSQLConnection(BaseConnection):
         if instance:
             instance = "\\" + instance
 
-        self._connection = pyodbc.connect(
+        return pyodbc.connect(
             f"DRIVER={driver};SERVER={self.host}{instance if instance else ''},{self.port};Connection Timeout={connection_timeout};DATABASE={self.database}{f';Integrated Security={integrated_security}' if integrated_security else ''};UID={self.user};PWD={self.password}{f';Trusted_Connection={trusted_connection}' if trusted_connection else ''}{f';Authentication={authentication}' if authentication else ''}",
             autocommit=True,
         )
 
-        self.enable_disable_foreign_keys()
-
-        self.open = 1
-        return self
-
     def get_database_name(self):
         return self.database
 
@@ -100,6 +102,8 @@ class MSSQLConnection(BaseConnection):
             self._connection.autocommit = True
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def begin(self):
         """MSSQL Transaction"""
@@ -114,6 +118,8 @@ class MSSQLConnection(BaseConnection):
             self._connection.autocommit = True
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def get_transaction_level(self):
         """Transaction"""
@@ -122,6 +128,22 @@ class MSSQLConnection(BaseConnection):
     def get_cursor(self):
         return self._cursor
 
+    def execute_prepared(self, query, bindings):
+        """pyodbc prepares a statement once and reuses it as long as the same SQL is
+        executed again on the same cursor, so each query keeps its own cursor.
+        """
+        statements = self.get_prepared_statements()
+        cursor = statements.get(query)
+        if cursor is None:
+            cursor = statements.put(query, self._connection.cursor())
+
+        self._cursor = cursor
+        cursor.execute(query, bindings)
+
+    @staticmethod
+    def deallocate_statement(connection, handle):
+        handle.close()
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -148,6 +170,7 @@ class MSSQLConnection(BaseConnection):
                     return
                 query = query.replace("'?'", "?")
                 self.statement(query, bindings)
+                cursor = self._cursor
                 if results == 1:
                     if not cursor.description:
                         return {}
@@ -164,7 +187,7 @@ class MSSQLConnection(BaseConnection):
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self._connection.close()
+                self.close_connection()
 
     def format_cursor_results(self, cursor_result):
         columnNames = [column[0] for column in self.get_cursor().description]
@@ -5,8 +5,6 @@ from ..schema.platforms import MySQLPlatform
 from ..query.processors import MySQLPostProcessor
 from ..exceptions import QueryException
 
-CONNECTION_POOL = []
-
 
 class MySQLConnection(BaseConnection):
     """MYSQL Connection class."""
@@ -36,7 +34,6 @@ class MySQLConnection(BaseConnection):
         self.password = password
         self.prefix = prefix
         self.full_details = full_details or {}
-        self.connection_pool_size = full_details.get("connection_pooling_max_size", 100)
         self.options = options or {}
         self._cursor = None
         self.open = 0
@@ -53,20 +50,12 @@ class MySQLConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
-        # Check if there is an available connection in the pool
-        self._connection = self.create_connection()
+        self._connection = self.acquire_connection()
         self.enable_disable_foreign_keys()
 
-        return self
+        self.open = 1
 
-    def close_connection(self):
-        if (
-            self.full_details.get("connection_pooling_enabled")
-            and len(CONNECTION_POOL) < self.connection_pool_size
-        ):
-            CONNECTION_POOL.append(self._connection)
-        self.open = 0
-        self._connection = None
+        return self
 
     def create_connection(self, autocommit=True):
 
@@ -85,45 +74,26 @@ class MySQLConnection(BaseConnection):
             pymysql.converters.escape_datetime
         )
 
-        # Initialize the connection pool if the option is set
-        initialize_size = self.full_details.get("connection_pooling_min_size")
-        if initialize_size and len(CONNECTION_POOL) < initialize_size:
-            for _ in range(initialize_size - len(CONNECTION_POOL)):
-                connection = pymysql.connect(
-                    cursorclass=pymysql.cursors.DictCursor,
-                    autocommit=autocommit,
-                    host=self.host,
-                    user=self.user,
-                    password=self.password,
-                    port=self.port,
-                    database=self.database,
-                    **self.options
-                )
-                CONNECTION_POOL.append(connection)
-
-        if (
-            self.full_details.get("connection_pooling_enabled")
-            and CONNECTION_POOL
-            and len(CONNECTION_POOL) > 0
-        ):
-            connection = CONNECTION_POOL.pop()
-        else:
-            connection = pymysql.connect(
-                cursorclass=pymysql.cursors.DictCursor,
-                autocommit=autocommit,
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                port=self.port,
-                database=self.database,
-                **self.options
-            )
+        return pymysql.connect(
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=autocommit,
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            port=self.port,
+            database=self.database,
+            **self.options
+        )
 
-        connection.close = self.close_connection
+    def ping_connection(self, connection):
+        connection.ping(reconnect=False)
+        return True
 
-        self.open = 1
+    def reset_connection(self, connection):
+        from pymysql.constants.SERVER_STATUS import SERVER_STATUS_IN_TRANS
 
-        return connection
+        if connection.server_status & SERVER_STATUS_IN_TRANS:
+            connection.rollback()
 
     def reconnect(self):
         self._connection.connect()
@@ -149,8 +119,7 @@ class MySQLConnection(BaseConnection):
         self._connection.commit()
         self.transaction_level -= 1
         if self.get_transaction_level() <= 0:
-            self.open = 0
-            self._connection.close()
+            self.close_connection()
 
     def dry(self):
         """Transaction"""
@@ -168,8 +137,7 @@ class MySQLConnection(BaseConnection):
         self._connection.rollback()
         self.transaction_level -= 1
         if self.get_transaction_level() <= 0:
-            self.open = 0
-            self._connection.close()
+            self.close_connection()
 
     def get_transaction_level(self):
         """Transaction"""
@@ -178,6 +146,18 @@ class MySQLConnection(BaseConnection):
     def get_cursor(self):
         return self._cursor
 
+    def get_stream_cursor(self, amount):
+        import pymysql
+
+        return self._connection.cursor(pymysql.cursors.SSDictCursor)
+
+    def format_qmark(self, query):
+        return query.replace("'?'", "%s")
+
+    def uses_prepared_statements(self, query):
+        # pymysql only speaks the text protocol, statements cannot be prepared
+        return False
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that
         will reach the database and come back with a result.
@@ -201,10 +181,7 @@ class MySQLConnection(BaseConnection):
             return {}
 
         if not self.open:
-            if self._connection is None:
-                self._connection = self.create_connection()
-
-            self._connection.connect()
+            self.make_connection()
 
         self._cursor = self._connection.cursor()
 
@@ -227,5 +204,4 @@ class MySQLConnection(BaseConnection):
         finally:
             self._cursor.close()
             if self.get_transaction_level() <= 0:
-                self.open = 0
-                self._connection.close()
+                self.close_connection()
@@ -1,3 +1,6 @@
+import re
+from itertools import count
+
 from ..exceptions import DriverNotFound
 from .BaseConnection import BaseConnection
 from ..query.grammars import PostgresGrammar
@@ -6,9 +9,6 @@ from ..query.processors import PostgresPostProcessor
 from ..exceptions import QueryException
 
 
-CONNECTION_POOL = []
-
-
 class PostgresConnection(BaseConnection):
     """Postgres Connection class."""
 
@@ -37,7 +37,6 @@ class PostgresConnection(BaseConnection):
 
         self.prefix = prefix
         self.full_details = full_details or {}
-        self.connection_pool_size = full_details.get("connection_pooling_max_size", 100)
         self.options = options or {}
         self._cursor = None
         self.transaction_level = 0
@@ -58,7 +57,7 @@ class PostgresConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
-        self._connection = self.create_connection()
+        self._connection = self.acquire_connection()
 
         self._connection.autocommit = True
 
@@ -71,57 +70,22 @@ class PostgresConnection(BaseConnection):
     def create_connection(self):
         import psycopg2
 
-        # Initialize the connection pool if the option is set
-        initialize_size = self.full_details.get("connection_pooling_min_size")
-        if (
-            self.full_details.get("connection_pooling_enabled")
-            and initialize_size
-            and len(CONNECTION_POOL) < initialize_size
-        ):
-            for _ in range(initialize_size - len(CONNECTION_POOL)):
-                connection = psycopg2.connect(
-                    database=self.database,
-                    user=self.user,
-                    password=self.password,
-                    host=self.host,
-                    port=self.port,
-                    sslmode=self.options.get("sslmode"),
-                    sslcert=self.options.get("sslcert"),
-                    sslkey=self.options.get("sslkey"),
-                    sslrootcert=self.options.get("sslrootcert"),
-                    options=(
-                        f"-c search_path={self.schema or self.full_details.get('schema')}"
-                        if self.schema or self.full_details.get("schema")
-                        else ""
-                    ),
-                )
-                CONNECTION_POOL.append(connection)
-
-        if (
-            self.full_details.get("connection_pooling_enabled")
-            and CONNECTION_POOL
-            and len(CONNECTION_POOL) > 0
-        ):
-            connection = CONNECTION_POOL.pop()
-        else:
-            connection = psycopg2.connect(
-                database=self.database,
-                user=self.user,
-                password=self.password,
-                host=self.host,
-                port=self.port,
-                sslmode=self.options.get("sslmode"),
-                sslcert=self.options.get("sslcert"),
-                sslkey=self.options.get("sslkey"),
-                sslrootcert=self.options.get("sslrootcert"),
-                options=(
-                    f"-c search_path={self.schema or self.full_details.get('schema')}"
-                    if self.schema or self.full_details.get("schema")
-                    else ""
-                ),
-            )
-
-        return connection
+        return psycopg2.connect(
+            database=self.database,
+            user=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            sslmode=self.options.get("sslmode"),
+            sslcert=self.options.get("sslcert"),
+            sslkey=self.options.get("sslkey"),
+            sslrootcert=self.options.get("sslrootcert"),
+            options=(
+                f"-c search_path={self.schema or self.full_details.get('schema')}"
+                if self.schema or self.full_details.get("schema")
+                else ""
+            ),
+        )
 
     def get_database_name(self):
         return self.database
@@ -141,17 +105,6 @@ class PostgresConnection(BaseConnection):
     def reconnect(self):
         pass
 
-    def close_connection(self):
-        if (
-            self.full_details.get("connection_pooling_enabled")
-            and len(CONNECTION_POOL) < self.connection_pool_size
-        ):
-            CONNECTION_POOL.append(self._connection)
-        else:
-            self._connection.close()
-
-        self._connection = None
-
     def commit(self):
         """Transaction"""
         if self.get_transaction_level() == 1:
@@ -159,6 +112,8 @@ class PostgresConnection(BaseConnection):
             self._connection.autocommit = True
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def begin(self):
         """Postgres Transaction"""
@@ -173,11 +128,88 @@ class PostgresConnection(BaseConnection):
             self._connection.autocommit = True
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
 
     def get_transaction_level(self):
         """Transaction"""
         return self.transaction_level
 
+    def get_stream_cursor(self, amount):
+        import uuid
+
+        from psycopg2.extras import RealDictCursor
+
+        # Named (server side) cursors only live inside a transaction
+        self._stream_autocommit = self._connection.autocommit
+        self._connection.autocommit = False
+
+        cursor = self._connection.cursor(
+            name=f"masoniteorm_{uuid.uuid4().hex}", cursor_factory=RealDictCursor
+        )
+        cursor.itersize = amount
+        return cursor
+
+    def close_stream_cursor(self):
+        self._cursor.close()
+        if self._stream_autocommit:
+            self._connection.commit()
+            self._connection.autocommit = True
+
+    def format_qmark(self, query):
+        return query.replace("'?'", "%s")
+
+    def execute_prepared(self, query, bindings):
+        """Executes a query through a server side prepared statement, prepared with
+        PREPARE the first time the query runs on the physical connection.
+        """
+        statements = self.get_prepared_statements()
+        name = statements.get(query)
+        if name is None:
+            name = statements.next_name()
+            prepared = self.to_positional(query) if bindings else query
+            self._cursor.execute(f"PREPARE {name} AS {prepared}")
+            statements.put(query, name)
+
+        try:
+            if bindings:
+                placeholders = ", ".join("%s" for _ in bindings)
+                self._cursor.execute(f"EXECUTE {name} ({placeholders})", bindings)
+            else:
+                self._cursor.execute(f"EXECUTE {name}")
+        except Exception as e:
+            # The statement was deallocated behind our back, for example by DISCARD ALL
+            if getattr(e, "pgcode", None) == "26000":
+                statements.discard(query)
+            raise
+
+    @staticmethod
+    def deallocate_statement(connection, handle):
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"DEALLOCATE {handle}")
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def to_positional(query):
+        """Turns the %s placeholders of a query into the $1, $2... parameters of PREPARE.
+
+        Arguments:
+            query {string} -- A query using the placeholder style of psycopg2.
+
+        Returns:
+            string
+        """
+        position = count(1)
+
+        def replace(match):
+            if match.group(0) == "%%":
+                return "%"
+            return f"${next(position)}"
+
+        return re.sub(r"%%|%s", replace, query)
+
     def set_cursor(self):
         from psycopg2.extras import RealDictCursor
 
@@ -222,6 +254,4 @@ class PostgresConnection(BaseConnection):
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self.open = 0
                 self.close_connection()
-                # self._connection.close()
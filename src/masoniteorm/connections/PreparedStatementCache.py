@@ -0,0 +1,175 @@
+import logging
+import threading
+from collections import OrderedDict
+from itertools import count
+
+
+class PreparedStatementCache:
+    """A bounded LRU of the statements prepared on one physical connection.
+
+    Handles are keyed by the SQL sent to the driver. What a handle is depends on the
+    driver: the name of a server side prepared statement or a cursor reusing its prepared
+    statement. The least recently used handle is deallocated when the cache is full.
+
+    Caches are registered per physical connection and forgotten when the physical
+    connection is closed. Statistics are also kept per connection name so they outlive
+    the physical connections.
+    """
+
+    _caches = {}
+    _totals = {}
+    _lock = threading.Lock()
+
+    def __init__(self, name=None, max_size=100, deallocate=None, connection=None):
+        """PreparedStatementCache initializer
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+            max_size {int} -- The maximum number of statements kept prepared. (default: {100})
+            deallocate {callable} -- Called with the physical connection and a handle
+                    evicted from the cache. (default: {None})
+            connection {object} -- The physical connection the statements are prepared on. (default: {None})
+        """
+        self.connection = connection
+        self.name = name
+        self.max_size = max_size
+        self.deallocate = deallocate
+        self._handles = OrderedDict()
+        self._names = count(1)
+        self._stats = self._empty_stats()
+
+    @classmethod
+    def for_connection(cls, connection, name=None, max_size=100, deallocate=None):
+        """Gets the cache of a physical connection, creating it on first use.
+
+        Arguments:
+            connection {object} -- A physical connection.
+
+        Keyword Arguments:
+            name {string} -- The connection name. (default: {None})
+            max_size {int} -- The maximum number of statements kept prepared. (default: {100})
+            deallocate {callable} -- Called with the physical connection and a handle
+                    evicted from the cache. (default: {None})
+
+        Returns:
+            masoniteorm.connections.PreparedStatementCache
+        """
+        with cls._lock:
+            cache = cls._caches.get(id(connection))
+            if cache is None:
+                cache = cls._caches[id(connection)] = cls(
+                    name=name,
+                    max_size=max_size,
+                    deallocate=deallocate,
+                    connection=connection,
+                )
+
+        return cache
+
+    @classmethod
+    def forget(cls, connection):
+        """Drops the cache of a physical connection that is being closed. The statements
+        are not deallocated, closing the connection does.
+        """
+        with cls._lock:
+            cls._caches.pop(id(connection), None)
+
+    @classmethod
+    def totals(cls, name):
+        """Gets the statistics of every physical connection of a connection name.
+
+        Arguments:
+            name {string} -- The connection name.
+
+        Returns:
+            dict
+        """
+        with cls._lock:
+            stats = dict(cls._totals.get(name) or cls._empty_stats())
+            stats["prepared"] = sum(
+                len(cache._handles)
+                for cache in cls._caches.values()
+                if cache.name == name
+            )
+
+        return stats
+
+    @staticmethod
+    def _empty_stats():
+        return {"hits": 0, "misses": 0, "evictions": 0}
+
+    def next_name(self, prefix="masonite_stmt_"):
+        """Gets a statement name unique on this connection."""
+        return f"{prefix}{next(self._names)}"
+
+    def get(self, sql):
+        """Gets the handle of a prepared statement.
+
+        Arguments:
+            sql {string} -- The SQL sent to the driver.
+
+        Returns:
+            object|None -- None when the statement is not prepared yet.
+        """
+        handle = self._handles.get(sql)
+        if handle is None:
+            self._count("misses")
+            return None
+
+        self._handles.move_to_end(sql)
+        self._count("hits")
+        return handle
+
+    def put(self, sql, handle):
+        """Stores the handle of a newly prepared statement, deallocating the least
+        recently used statements over the bound.
+
+        Arguments:
+            sql {string} -- The SQL sent to the driver.
+            handle {object} -- The handle of the prepared statement.
+
+        Returns:
+            object -- The handle.
+        """
+        self._handles[sql] = handle
+        self._handles.move_to_end(sql)
+
+        while len(self._handles) > self.max_size:
+            _, evicted = self._handles.popitem(last=False)
+            self._count("evictions")
+            if self.deallocate:
+                try:
+                    self.deallocate(self.connection, evicted)
+                except Exception:
+                    # The statement stays allocated until the connection is closed
+                    logging.getLogger("masoniteorm.connection.prepared_statements").warning(
+                        "Could not deallocate the prepared statement %s on %s.",
+                        evicted,
+                        self.name,
+                        exc_info=True,
+                    )
+
+        return handle
+
+    def discard(self, sql):
+        """Forgets a statement whose handle can no longer be used."""
+        self._handles.pop(sql, None)
+
+    def stats(self):
+        """Returns a snapshot of the statistics of this physical connection.
+
+        Returns:
+            dict
+        """
+        stats = dict(self._stats)
+        stats.update({"prepared": len(self._handles), "max_size": self.max_size})
+        return stats
+
+    def __len__(self):
+        return len(self._handles)
+
+    def _count(self, stat):
+        self._stats[stat] += 1
+        with self._lock:
+            totals = self._totals.setdefault(self.name, self._empty_stats())
+            totals[stat] += 1
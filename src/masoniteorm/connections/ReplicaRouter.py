@@ -0,0 +1,209 @@
+import threading
+from itertools import count
+
+
+class ReplicaRouter:
+    """Routes the queries of a connection configured with read and write host groups.
+
+    The hosts of a group are given as a list of settings overriding the connection
+    settings, or as a dictionary whose "host" is a list of hosts:
+
+        "mysql": {
+            "driver": "mysql",
+            "user": "root",
+            "read": [{"host": "replica-1"}, {"host": "replica-2", "port": 3307}],
+            "write": {"host": "primary"},
+            "read_strategy": "least_busy",
+            "sticky": True,
+            ...
+        }
+
+    Reads are spread over the read group round robin, or sent to the read host with the
+    fewest open connections from this process with the "least_busy" strategy. Everything
+    else uses the write group. With "sticky" on, the reads of a connection go to the write
+    group on a thread once it wrote on that thread, until the writes are forgotten.
+    """
+
+    _lock = threading.Lock()
+    _cursors = {}
+    _busy = {}
+    _routed = {}
+    _local = threading.local()
+
+    @staticmethod
+    def splits(details):
+        """Checks if connection settings have read or write host groups.
+
+        Arguments:
+            details {dict} -- The connection settings.
+
+        Returns:
+            bool
+        """
+        return bool(details) and ("read" in details or "write" in details)
+
+    @classmethod
+    def route(cls, name, details, read=False):
+        """Gets the settings of the host a query should run on.
+
+        Arguments:
+            name {string} -- The connection name.
+            details {dict} -- The connection settings.
+
+        Keyword Arguments:
+            read {bool} -- Whether the query only reads. (default: {False})
+
+        Returns:
+            dict -- The connection settings merged with the settings of the chosen host.
+        """
+        if not cls.splits(details):
+            return details
+
+        group = "write"
+        if read and details.get("read") and not cls.has_written(name):
+            group = "read"
+
+        hosts = cls.get_hosts(details, group)
+        if not hosts:
+            return details
+
+        index = cls._pick(name, group, len(hosts), details.get("read_strategy"))
+
+        return {**details, **hosts[index], "host_group": group, "host_index": index}
+
+    @staticmethod
+    def get_hosts(details, group):
+        """Gets the settings of every host of a group.
+
+        Arguments:
+            details {dict} -- The connection settings.
+            group {string} -- "read" or "write".
+
+        Returns:
+            list
+        """
+        hosts = details.get(group) or []
+        if isinstance(hosts, dict):
+            host = hosts.get("host")
+            if isinstance(host, (list, tuple)):
+                return [{**hosts, "host": each} for each in host]
+            return [hosts]
+
+        return list(hosts)
+
+    @classmethod
+    def _pick(cls, name, group, size, strategy=None):
+        with cls._lock:
+            cursor = cls._cursors.setdefault((name, group), count())
+            start = next(cursor) % size
+
+            index = start
+            if strategy == "least_busy":
+                # Start from the next host in turn so ties are spread round robin
+                index = min(
+                    ((start + offset) % size for offset in range(size)),
+                    key=lambda index: cls._busy.get((name, group, index), 0),
+                )
+
+            key = (name, group, index)
+            cls._routed[key] = cls._routed.get(key, 0) + 1
+
+        return index
+
+    @classmethod
+    def checkout(cls, name, details):
+        """Counts a connection opened on a routed host."""
+        if "host_index" not in details:
+            return
+
+        key = (name, details["host_group"], details["host_index"])
+        with cls._lock:
+            cls._busy[key] = cls._busy.get(key, 0) + 1
+
+    @classmethod
+    def checkin(cls, name, details):
+        """Counts a connection closed on a routed host."""
+        if "host_index" not in details:
+            return
+
+        key = (name, details["host_group"], details["host_index"])
+        with cls._lock:
+            cls._busy[key] = max(cls._busy.get(key, 0) - 1, 0)
+
+    @classmethod
+    def record_write(cls, name, details):
+        """Remembers a write on a sticky connection for the current thread."""
+        if not cls.splits(details) or not details.get("sticky"):
+            return
+
+        if not hasattr(cls._local, "written"):
+            cls._local.written = set()
+        cls._local.written.add(name)
+
+    @classmethod
+    def has_written(cls, name):
+        return name in getattr(cls._local, "written", ())
+
+    @classmethod
+    def get_writes(cls):
+        """Gets the sticky connections written to on the current thread.
+
+        Returns:
+            set
+        """
+        return set(getattr(cls._local, "written", ()))
+
+    @classmethod
+    def set_writes(cls, written):
+        """Sets the sticky connections written to on the current thread, for example to carry
+        the writes of a thread to the worker threads it starts.
+
+        Arguments:
+            written {set} -- The connection names.
+        """
+        cls._local.written = set(written)
+
+    @classmethod
+    def forget_writes(cls, name=None):
+        """Sends the reads of the current thread back to the read group.
+
+        Keyword Arguments:
+            name {string} -- Only forget the writes of this connection. (default: {None})
+        """
+        written = getattr(cls._local, "written", set())
+        if name is None:
+            written.clear()
+        else:
+            written.discard(name)
+
+    @classmethod
+    def stats(cls, name):
+        """Gets the number of queries routed to each host of a connection and the number of
+        connections currently open on them.
+
+        Arguments:
+            name {string} -- The connection name.
+
+        Returns:
+            dict -- Keyed by group, then by the index of the host in the group.
+        """
+        stats = {}
+        with cls._lock:
+            for key in set(cls._routed) | set(cls._busy):
+                if key[0] != name:
+                    continue
+                stats.setdefault(key[1], {})[key[2]] = {
+                    "routed": cls._routed.get(key, 0),
+                    "busy": cls._busy.get(key, 0),
+                }
+
+        return stats
+
+    @classmethod
+    def reset(cls):
+        """Forgets every counter. Used by tests."""
+        with cls._lock:
+            cls._cursors = {}
+            cls._busy = {}
+            cls._routed = {}
+        cls.forget_writes()
@@ -59,10 +59,7 @@ class SQLiteConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
-        self._connection = sqlite3.connect(self.database, isolation_level=None)
-        self._connection.create_function("REGEXP", 2, regexp)
-
-        self._connection.row_factory = sqlite3.Row
+        self._connection = self.acquire_connection()
 
         self.enable_disable_foreign_keys()
 
@@ -70,6 +67,50 @@ class SQLiteConnection(BaseConnection):
 
         return self
 
+    def create_connection(self):
+        import sqlite3
+
+        options = {}
+        if self.full_details.get("prepared_statements"):
+            # sqlite3 keeps the compiled statements of a connection in its own LRU
+            options["cached_statements"] = (
+                self.full_details.get("prepared_statements_max_size") or 100
+            )
+
+        connection = sqlite3.connect(
+            self.database,
+            isolation_level=None,
+            check_same_thread=not self.full_details.get("connection_pooling_enabled"),
+            **options,
+        )
+        connection.create_function("REGEXP", 2, regexp)
+
+        connection.row_factory = sqlite3.Row
+
+        return connection
+
+    def get_connection_pool(self):
+        # Every connection to an in memory database is a brand new database.
+        if self.database == ":memory:":
+            return None
+
+        return super().get_connection_pool()
+
+    def reset_connection(self, connection):
+        if connection.in_transaction:
+            connection.rollback()
+        connection.isolation_level = None
+
+    def execute_prepared(self, query, bindings):
+        """sqlite3 reuses the statements compiled on the connection by itself, with the same
+        bound, so the cache only mirrors it to report hits, misses and evictions.
+        """
+        statements = self.get_prepared_statements()
+        if statements.get(query) is None:
+            statements.put(query, query)
+
+        self._cursor.execute(query, bindings)
+
     @classmethod
     def get_default_query_grammar(cls):
         return SQLiteGrammar
@@ -92,13 +133,13 @@ class SQLiteConnection(BaseConnection):
         """Transaction"""
 
         if self.get_transaction_level() == 1:
-            self.transaction_level -= 1
             self._connection.commit()
             self._connection.isolation_level = None
-            self._connection.close()
-            self.open = 0
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
+
         return self
 
     def begin(self):
@@ -110,12 +151,13 @@ class SQLiteConnection(BaseConnection):
     def rollback(self):
         """Transaction"""
         if self.get_transaction_level() == 1:
-            self.transaction_level -= 1
             self._connection.rollback()
-            self._connection.close()
-            self.open = 0
+            self._connection.isolation_level = None
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.close_connection()
+
         return self
 
     def get_cursor(self):
@@ -160,20 +202,7 @@ class SQLiteConnection(BaseConnection):
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self._connection.close()
-                self.open = 0
+                self.close_connection()
 
     def format_cursor_results(self, cursor_result):
         return [dict(row) for row in cursor_result]
-
-    def select_many(self, query, bindings, amount):
-        self._cursor = self._connection.cursor()
-        self.statement(query)
-        if not self.open:
-            self.make_connection()
-
-        result = self.format_cursor_results(self._cursor.fetchmany(amount))
-        while result:
-            yield result
-
-            result = self.format_cursor_results(self._cursor.fetchmany(amount))
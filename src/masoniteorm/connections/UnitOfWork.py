@@ -0,0 +1,286 @@
+import threading
+from collections import OrderedDict
+
+
+class UnitOfWork:
+    """Collects created, updated and deleted models and writes them in a handful of statements.
+
+    Models are grouped per class: new models become one bulk insert per class (and column set),
+    dirty models one bulk update per class and deleted models one DELETE ... WHERE IN per class.
+    Inserts run parents first by following the belongs_to relationships of every model class,
+    deletes run children first. Everything is written inside one transaction per connection.
+    The keys generated for new models are read back, so flushed models can be saved again,
+    and set on the foreign keys of the models attached to them through a belongs_to.
+
+    While a unit of work is active on the current thread, Model.save() registers the model
+    instead of writing it right away.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, resolver=None):
+        """UnitOfWork initializer
+
+        Keyword Arguments:
+            resolver {masoniteorm.connections.ConnectionResolver} -- The resolver used to open transactions. (default: {None})
+        """
+        if resolver is None:
+            from .ConnectionResolver import ConnectionResolver
+
+            resolver = ConnectionResolver()
+
+        self.resolver = resolver
+        self.new = []
+        self.dirty = []
+        self.deleted = []
+        self._tracked = set()
+        self._transactions = []
+
+    @classmethod
+    def current(cls):
+        """Gets the unit of work active on the current thread.
+
+        Returns:
+            UnitOfWork|None
+        """
+        sessions = getattr(cls._local, "sessions", None)
+        return sessions[-1] if sessions else None
+
+    def begin(self):
+        """Makes this unit of work the active one on the current thread."""
+        if not hasattr(self._local, "sessions"):
+            self._local.sessions = []
+        self._local.sessions.append(self)
+        return self
+
+    def close(self):
+        """Stops collecting models on the current thread and forgets the pending ones."""
+        sessions = getattr(self._local, "sessions", [])
+        if self in sessions:
+            sessions.remove(self)
+
+        self.new, self.dirty, self.deleted = [], [], []
+        self._tracked = set()
+        return self
+
+    def add(self, *models):
+        """Registers models to be created or updated, depending on whether they are loaded."""
+        for model in models:
+            if id(model) in self._tracked:
+                continue
+
+            self._tracked.add(id(model))
+            if model.is_loaded():
+                self.dirty.append(model)
+            else:
+                self.new.append(model)
+
+        return self
+
+    def delete(self, *models):
+        """Registers loaded models to be deleted."""
+        for model in models:
+            if id(model) in self._tracked:
+                self.new = [tracked for tracked in self.new if tracked is not model]
+                self.dirty = [
+                    tracked for tracked in self.dirty if tracked is not model
+                ]
+            else:
+                self._tracked.add(id(model))
+
+            if model.is_loaded():
+                self.deleted.append(model)
+
+        return self
+
+    def flush(self):
+        """Writes every pending model, opening the transactions the first time it is called."""
+        new, dirty, deleted = self.new, self.dirty, self.deleted
+        self.new, self.dirty, self.deleted = [], [], []
+        self._tracked = set()
+
+        for model in new + dirty + deleted:
+            self._begin_transaction(model)
+
+        order = self._insert_order(new + dirty + deleted)
+
+        for model_class in order:
+            models = [model for model in new if model.__class__ is model_class]
+            self._fill_foreign_keys(models)
+            self._insert(models)
+
+        for model_class in order:
+            models = [model for model in dirty if model.__class__ is model_class]
+            self._fill_foreign_keys(models)
+            self._update(models)
+
+        for model_class in reversed(order):
+            self._delete([model for model in deleted if model.__class__ is model_class])
+
+        return self
+
+    def commit(self):
+        """Flushes the pending models and commits every transaction."""
+        try:
+            self.flush()
+        except Exception:
+            self.rollback()
+            raise
+
+        transactions, self._transactions = self._transactions, []
+        self.close()
+
+        for name in transactions:
+            self.resolver.commit(name)
+
+        return self
+
+    def rollback(self):
+        """Rolls back every transaction and forgets the pending models."""
+        transactions, self._transactions = self._transactions, []
+        self.close()
+
+        for name in transactions:
+            self.resolver.rollback(name)
+
+        return self
+
+    def _begin_transaction(self, model):
+        name = model.__connection__
+        if name == "default":
+            name = self.resolver.get_connection_details().get("default")
+
+        if name in self._transactions:
+            return
+
+        # An outer transaction on the same connection owns the commit
+        if name in self.resolver.get_global_connections():
+            return
+
+        self.resolver.begin_transaction(name)
+        self._transactions.append(name)
+
+    def _insert(self, models):
+        groups = OrderedDict()
+        for model in models:
+            attributes = dict(model.get_dirty_attributes())
+            if model.__timestamps__:
+                now = model.get_new_date().to_datetime_string()
+                attributes.setdefault(model.date_created_at, now)
+                attributes.setdefault(model.date_updated_at, now)
+
+            key = tuple(sorted(attributes))
+            groups.setdefault(key, []).append((model, attributes))
+
+        for group in groups.values():
+            # Read back the keys the database generates so the models can be saved again
+            primary_key = group[0][0].get_primary_key()
+            created = self._builder(group[0][0]).bulk_create(
+                [attributes for _, attributes in group],
+                ignore_mass_assignment=True,
+                get_ids=primary_key not in group[0][1],
+            )
+
+            for (model, attributes), row in zip(group, created):
+                if primary_key not in attributes:
+                    attributes[primary_key] = row.get_primary_key_value()
+                model.fill(attributes)
+                model.fill_original(attributes)
+                model.__dirty_attributes__ = {}
+
+    def _update(self, models):
+        models = [model for model in models if model.get_dirty_attributes()]
+        if not models:
+            return
+
+        for model in models:
+            if model.__timestamps__ and model.date_updated_at not in (
+                model.__dirty_attributes__
+            ):
+                model.__dirty_attributes__[
+                    model.date_updated_at
+                ] = model.get_new_date().to_datetime_string()
+
+        self._builder(models[0]).bulk_update(models, key=models[0].get_primary_key())
+
+    def _delete(self, models):
+        if not models:
+            return
+
+        self._builder(models[0]).where_in(
+            models[0].get_primary_key(),
+            [model.get_primary_key_value() for model in models],
+        ).delete()
+
+    def _builder(self, model):
+        """A builder on the model's table and scopes whose model is not loaded, so
+        the builder does not constrain the statements to a single record."""
+        return model.__class__.new_unbooted().get_builder()
+
+    def _insert_order(self, models):
+        """Orders model classes so the classes a model belongs to come first."""
+        classes = []
+        for model in models:
+            if model.__class__ not in classes:
+                classes.append(model.__class__)
+
+        dependencies = {
+            model_class: [
+                parent
+                for parent in self._parents(model_class)
+                if parent in classes and parent is not model_class
+            ]
+            for model_class in classes
+        }
+
+        order = []
+        visiting = set()
+
+        def visit(model_class):
+            if model_class in order or model_class in visiting:
+                return
+            visiting.add(model_class)
+            for parent in dependencies[model_class]:
+                visit(parent)
+            visiting.discard(model_class)
+            order.append(model_class)
+
+        for model_class in classes:
+            visit(model_class)
+
+        return order
+
+    def _fill_foreign_keys(self, models):
+        """Sets the keys of the parents attached to the models, which are inserted first."""
+        for model in models:
+            for name, relationship in self._belongs_to(model.__class__):
+                parent = model._relationships.get(name)
+                if parent is None:
+                    continue
+
+                relationship.set_keys(model, name)
+                key = parent.get_raw_attribute(relationship.foreign_key)
+                if key is not None and key != model.get_raw_attribute(
+                    relationship.local_key
+                ):
+                    model.__dirty_attributes__[relationship.local_key] = key
+
+    def _parents(self, model_class):
+        parents = []
+        for _, relationship in self._belongs_to(model_class):
+            try:
+                parent = relationship.fn(None)
+            except Exception:
+                continue
+            if isinstance(parent, type):
+                parents.append(parent)
+
+        return parents
+
+    def _belongs_to(self, model_class):
+        from ..relationships.BelongsTo import BelongsTo
+
+        for klass in model_class.__mro__:
+            for name, relationship in vars(klass).items():
+                if isinstance(relationship, BelongsTo) and relationship.fn:
+                    yield name, relationship
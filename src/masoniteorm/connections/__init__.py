@@ -4,3 +4,11 @@ from .MySQLConnection import MySQLConnection
 from .PostgresConnection import PostgresConnection
 from .SQLiteConnection import SQLiteConnection
 from .MSSQLConnection import MSSQLConnection
+from .ConnectionPool import ConnectionPool
+from .UnitOfWork import UnitOfWork
+from .AsyncConnectionPool import AsyncConnectionPool
+from .AsyncSQLiteConnection import AsyncSQLiteConnection
+from .AsyncPostgresConnection import AsyncPostgresConnection
+from .AsyncMySQLConnection import AsyncMySQLConnection
+from .PreparedStatementCache import PreparedStatementCache
+from .ReplicaRouter import ReplicaRouter
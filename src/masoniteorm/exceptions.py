@@ -36,3 +36,11 @@ class MultipleRecordsFound(Exception):
 
 class InvalidArgument(Exception):
     pass
+
+
+class ConnectionPoolTimeout(Exception):
+    pass
+
+
+class LazyLoadingViolation(Exception):
+    pass
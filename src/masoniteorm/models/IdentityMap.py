@@ -0,0 +1,113 @@
+import threading
+
+
+class IdentityMap:
+    """Keeps a single model instance per model class and primary key.
+
+    While an identity map is active on the current thread, query results are hydrated
+    through it: a row whose model was already hydrated returns that model instead of a
+    new one. A row is only matched when all of its columns hold the same values as the
+    row the model was hydrated from, so rows carrying extra join or pivot columns still
+    get their own instance.
+
+    A query with eager loads opens an identity map for itself when none is active. Open
+    one explicitly to share models across every query of a request.
+    """
+
+    _local = threading.local()
+
+    def __init__(self):
+        self._models = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def current(cls):
+        """Gets the identity map active on the current thread.
+
+        Returns:
+            IdentityMap|None
+        """
+        maps = getattr(cls._local, "maps", None)
+        return maps[-1] if maps else None
+
+    def begin(self):
+        """Makes this identity map the active one on the current thread."""
+        if not hasattr(self._local, "maps"):
+            self._local.maps = []
+        self._local.maps.append(self)
+        return self
+
+    def close(self):
+        """Stops using this identity map on the current thread."""
+        maps = getattr(self._local, "maps", [])
+        if self in maps:
+            maps.remove(self)
+
+        return self
+
+    def __enter__(self):
+        return self.begin()
+
+    def __exit__(self, *args):
+        self.close()
+
+    def hydrate(self, model_class, result, complete=True):
+        """Hydrates a query result, reusing the models already in the map.
+
+        Arguments:
+            model_class {masoniteorm.models.Model} -- The model class to hydrate.
+            result {dict|list} -- A row or a list of rows.
+
+        Keyword Arguments:
+            complete {bool} -- Whether the rows hold every column of the table. (default: {True})
+
+        Returns:
+            Model|Collection
+        """
+        if isinstance(result, (list, tuple)):
+            return model_class.set_siblings(
+                model_class.new_collection(
+                    [self._hydrate_row(model_class, row, complete) for row in result]
+                )
+            )
+
+        return self._hydrate_row(model_class, result, complete)
+
+    def get(self, model_class, key):
+        """Gets the model hydrated from a complete row of a model class.
+
+        Arguments:
+            model_class {masoniteorm.models.Model} -- The model class.
+            key {any} -- The primary key value.
+
+        Returns:
+            Model|None
+        """
+        entry = self._models.get((model_class, str(key)))
+        if entry and entry[2]:
+            self.hits += 1
+            return entry[0]
+
+        return None
+
+    def _hydrate_row(self, model_class, row, complete):
+        if not isinstance(row, dict):
+            return model_class.hydrate(row)
+
+        key = row.get(model_class.__primary_key__)
+        if key is None:
+            return model_class.hydrate(row)
+
+        key = (model_class, str(key))
+        entry = self._models.get(key)
+        if entry and row.items() <= entry[1].items():
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        model = model_class.hydrate(row)
+        if entry is None:
+            self._models[key] = (model, row, complete)
+
+        return model
@@ -0,0 +1,122 @@
+import logging
+import threading
+
+from ..exceptions import LazyLoadingViolation
+
+
+class LazyLoadDetector:
+    """Counts the relationships lazily loaded on the current thread to find N+1 queries.
+
+    Every lazy load is counted by its shape: the model class and the relationship name.
+    Once a shape is lazily loaded threshold times it is reported, either as a warning on
+    the masoniteorm.models.lazy_loads logger or, in strict mode, by raising
+    LazyLoadingViolation.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, threshold=2, strict=False):
+        """LazyLoadDetector initializer
+
+        Keyword Arguments:
+            threshold {int} -- How many lazy loads of the same shape are reported. (default: {2})
+            strict {bool} -- Raise LazyLoadingViolation instead of logging a warning. (default: {False})
+        """
+        self.threshold = threshold
+        self.strict = strict
+        self.counts = {}
+
+    @classmethod
+    def current(cls):
+        """Gets the detector active on the current thread.
+
+        Returns:
+            LazyLoadDetector|None
+        """
+        detectors = getattr(cls._local, "detectors", None)
+        return detectors[-1] if detectors else None
+
+    def begin(self):
+        """Makes this detector the active one on the current thread."""
+        if not hasattr(self._local, "detectors"):
+            self._local.detectors = []
+        self._local.detectors.append(self)
+        return self
+
+    def close(self):
+        """Stops counting lazy loads on the current thread."""
+        detectors = getattr(self._local, "detectors", [])
+        if self in detectors:
+            detectors.remove(self)
+
+        return self
+
+    def __enter__(self):
+        return self.begin()
+
+    def __exit__(self, *args):
+        self.close()
+
+    def record(self, model, attribute):
+        """Counts a lazy load and reports it when its shape reaches the threshold.
+
+        Arguments:
+            model {masoniteorm.models.Model} -- The model the relationship was loaded on.
+            attribute {string} -- The name of the relationship.
+        """
+        shape = f"{model.__class__.__name__}.{attribute}"
+        self.counts[shape] = self.counts.get(shape, 0) + 1
+
+        if self.counts[shape] != self.threshold:
+            return
+
+        message = (
+            f"N+1 query detected: '{shape}' was lazy loaded {self.threshold} times. "
+            f"Eager load it with with_('{attribute}')."
+        )
+        if self.strict:
+            raise LazyLoadingViolation(message)
+
+        logging.getLogger("masoniteorm.models.lazy_loads").warning(message)
+
+    def report(self):
+        """Gets the lazy loads that reached the threshold.
+
+        Returns:
+            dict -- The number of lazy loads per model class and relationship.
+        """
+        return {
+            shape: count
+            for shape, count in self.counts.items()
+            if count >= self.threshold
+        }
+
+
+class BatchLazyLoading:
+    """Turns on batch lazy loading on the current thread.
+
+    With batch lazy loading, lazily loading a relationship on a model that was hydrated
+    as part of a collection loads that relationship for every model of the collection
+    in a single query. Models can also opt in with __batch_lazy_loads__ = True.
+    """
+
+    _local = threading.local()
+
+    @classmethod
+    def enabled(cls, model):
+        """Checks if a model's relationships are lazily loaded in batches.
+
+        Arguments:
+            model {masoniteorm.models.Model} -- The model a relationship is lazily loaded on.
+
+        Returns:
+            bool
+        """
+        return bool(model.__batch_lazy_loads__ or getattr(cls._local, "depth", 0))
+
+    def __enter__(self):
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        return self
+
+    def __exit__(self, *args):
+        self._local.depth -= 1
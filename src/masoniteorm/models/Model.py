@@ -1,6 +1,7 @@
 import inspect
 import json
 import logging
+import weakref
 from datetime import date as datetimedate
 from datetime import datetime
 from datetime import time as datetimetime
@@ -12,10 +13,12 @@ from inflection import tableize, underscore
 
 from ..collection import Collection
 from ..config import load_config
+from ..connections.UnitOfWork import UnitOfWork
 from ..exceptions import ModelNotFound
 from ..observers import ObservesEvents
-from ..query import QueryBuilder
+from ..query import AsyncQueryBuilder, QueryBuilder
 from ..scopes import TimeStampsMixin
+from .ModelMetadata import ModelMetadata
 
 """This is a magic class that will help using models like User.first() instead of having to instatiate a class like
 User().first()
@@ -45,10 +48,20 @@ class ModelMeta(type):
         instantiated = self()
         return getattr(instantiated, attribute)
 
+    def __setattr__(self, attribute, value):
+        type.__setattr__(self, attribute, value)
+        ModelMetadata.forget(self)
+
+    def __delattr__(self, attribute):
+        type.__delattr__(self, attribute)
+        ModelMetadata.forget(self)
+
 
 class BoolCast:
     """Casts a value to a boolean"""
 
+    stateless = True
+
     def get(self, value):
         return bool(value)
 
@@ -59,6 +72,8 @@ class BoolCast:
 class JsonCast:
     """Casts a value to JSON"""
 
+    stateless = True
+
     def get(self, value):
         if isinstance(value, str):
             try:
@@ -80,6 +95,8 @@ class JsonCast:
 class IntCast:
     """Casts a value to a int"""
 
+    stateless = True
+
     def get(self, value):
         return int(value)
 
@@ -90,6 +107,8 @@ class IntCast:
 class FloatCast:
     """Casts a value to a float"""
 
+    stateless = True
+
     def get(self, value):
         return float(value)
 
@@ -100,6 +119,8 @@ class FloatCast:
 class DateCast:
     """Casts a value to a float"""
 
+    stateless = True
+
     def get(self, value):
         return pendulum.parse(value).to_date_string()
 
@@ -110,6 +131,8 @@ class DateCast:
 class DecimalCast:
     """Casts a value to Decimal for accuracy"""
 
+    stateless = True
+
     def get(self, value):
         """
         Get the value
@@ -158,6 +181,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     __timezone__ = "UTC"
     __with__ = ()
     __force_update__ = False
+    __batch_lazy_loads__ = False
 
     date_created_at = "created_at"
     date_updated_at = "updated_at"
@@ -175,8 +199,11 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "avg",
             "between",
             "bulk_create",
+            "bulk_update",
             "chunk",
             "count",
+            "cursor",
+            "cursor_paginate",
             "decrement",
             "delete",
             "distinct",
@@ -206,6 +233,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "join",
             "joins",
             "last",
+            "lazy",
             "left_join",
             "limit",
             "lock_for_update",
@@ -222,6 +250,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "order_by_raw",
             "order_by",
             "paginate",
+            "remember",
             "right_join",
             "select_raw",
             "select",
@@ -238,6 +267,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "to_sql",
             "truncate",
             "update",
+            "upsert",
             "when",
             "where_between",
             "where_column",
@@ -264,6 +294,12 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "where_doesnt_have",
             "with_",
             "with_count",
+            "with_sum",
+            "with_avg",
+            "with_min",
+            "with_max",
+            "with_exists",
+            "with_aggregate",
             "latest",
             "oldest",
             "value",
@@ -301,6 +337,15 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         """
         return self.__primary_key__
 
+    @classmethod
+    def get_metadata(cls):
+        """Gets the attribute metadata (accessors, mutators, casts, dates, ...) of the model class.
+
+        Returns:
+            ModelMetadata
+        """
+        return ModelMetadata.resolve(cls)
+
     def get_primary_key_type(self):
         """Gets the primary key column type
 
@@ -341,7 +386,34 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     def query(self):
         return self.get_builder()
 
+    @classmethod
+    def async_query(cls):
+        """Gets a query builder for the model whose methods running queries are coroutines.
+
+        Like Model.where, the builder queries the table of the model and is not scoped to
+        a loaded model.
+
+        Returns:
+            masoniteorm.query.AsyncQueryBuilder
+        """
+        model = cls()
+        builder = AsyncQueryBuilder(
+            connection=model.__connection__,
+            table=model.get_table_name(),
+            connection_details=model.get_connection_details(),
+            model=model,
+            scopes=model._scopes.get(cls),
+            dry=model.__dry__,
+        )
+
+        return builder.select(*model.get_selects())
+
     def get_builder(self):
+        if self.__dict__.get("_boot_deferred"):
+            self._boot_deferred = False
+            self._boot_builder()
+            return self.builder
+
         if hasattr(self, "builder"):
             return self.builder
 
@@ -370,25 +442,25 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     def boot(self):
         if not self._booted:
             self.observe_events(self, "booting")
-            for base_class in inspect.getmro(self.__class__):
-                class_name = base_class.__name__
-
-                if class_name.endswith("Mixin"):
-                    getattr(self, "boot_" + class_name)(self.get_builder())
-                elif (
-                    base_class != Model
-                    and issubclass(base_class, Model)
-                    and "__fillable__" in base_class.__dict__
-                    and "__guarded__" in base_class.__dict__
-                ):
-                    raise AttributeError(
-                        f"{type(self).__name__} must specify either __fillable__ or __guarded__ properties, but not both."
-                    )
-
-            self._booted = True
+            self._check_fillable_and_guarded()
+            self._boot_builder()
             self.observe_events(self, "booted")
 
-            self.append_passthrough(list(self.get_builder()._macros.keys()))
+    def _check_fillable_and_guarded(self):
+        if self.get_metadata().fillable_and_guarded:
+            raise AttributeError(
+                f"{type(self).__name__} must specify either __fillable__ or __guarded__ properties, but not both."
+            )
+
+    def _boot_builder(self):
+        for base_class in inspect.getmro(self.__class__):
+            class_name = base_class.__name__
+
+            if class_name.endswith("Mixin"):
+                getattr(self, "boot_" + class_name)(self.get_builder())
+
+        self._booted = True
+        self.append_passthrough(list(self.get_builder()._macros.keys()))
 
     def append_passthrough(self, passthrough):
         self.__passthrough__.update(passthrough)
@@ -481,32 +553,11 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             return None
 
         if isinstance(result, (list, tuple)):
-            response = []
-            for element in result:
-                response.append(cls.hydrate(element))
-            return cls.new_collection(response)
+            return cls.set_siblings(cls.new_collection(cls.hydrate_many(result)))
 
         elif isinstance(result, dict):
-            model = cls()
-            dic = {}
-            for key, value in result.items():
-                if key in model.get_dates() and value:
-                    value = model.get_new_date(value)
-                dic.update({key: value})
-
-            logger = logging.getLogger("masoniteorm.models.hydrate")
-            logger.setLevel(logging.INFO)
-            logger.propagate = False
-            logger.info(
-                f"Hydrating Model {cls.__name__}",
-                extra={"class_name": cls.__name__, "class_module": cls.__module__},
-            )
-
-            model.observe_events(model, "hydrating")
-            model.__attributes__.update(dic or {})
-            model.__original_attributes__.update(dic or {})
-            model.add_relation(relations)
-            model.observe_events(model, "hydrated")
+            model = cls.new_unbooted()
+            model._hydrate_attributes(result, cls.get_metadata().dates, relations)
             return model
 
         elif hasattr(result, "serialize"):
@@ -522,6 +573,128 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             model.observe_events(model, "hydrated")
             return model
 
+    @classmethod
+    def set_siblings(cls, collection):
+        """Remembers the collection every model was hydrated in so a relationship lazily
+        loaded on one model can be loaded for all of them at once.
+
+        The collection is weakly referenced, so a model kept alive does not keep its whole
+        result set in memory.
+
+        Args:
+            collection (Collection): The hydrated models.
+
+        Returns:
+            Collection: The same collection.
+        """
+        siblings = weakref.ref(collection)
+        for model in collection:
+            model.__dict__["_siblings"] = siblings
+
+        return collection
+
+    def get_siblings(self):
+        """Gets the collection the model was hydrated in, while it is still in use.
+
+        Returns:
+            Collection|None
+        """
+        siblings = self.__dict__.get("_siblings")
+        return siblings() if siblings else None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_siblings", None)
+        state.pop("_casts", None)
+        return state
+
+    @classmethod
+    def hydrate_many(cls, results):
+        """Takes a list of results and loads each of them into a model.
+
+        Models are allocated without being booted. Booting the mixins, and building the
+        query builder, is deferred until a model first needs its builder.
+
+        Args:
+            results (list|tuple): The rows to hydrate.
+
+        Returns:
+            list: The hydrated models.
+        """
+        response = []
+        dates = cls.get_metadata().dates
+
+        for result in results:
+            if not isinstance(result, dict):
+                response.append(cls.hydrate(result))
+                continue
+
+            model = cls.new_unbooted()
+            model._hydrate_attributes(result, dates)
+            response.append(model)
+
+        return response
+
+    @classmethod
+    def new_unbooted(cls):
+        """Creates a model instance without booting it.
+
+        The booting and booted events are fired and the model is checked right away, but
+        the mixins are booted and the query builder is built the first time the model
+        needs its builder.
+
+        Returns:
+            Model
+        """
+        if cls.__init__ is not Model.__init__:
+            return cls()
+
+        model = cls.__new__(cls)
+        model.__dict__.update(
+            {
+                "__attributes__": {},
+                "__original_attributes__": {},
+                "__dirty_attributes__": {},
+                "_relationships": {},
+                "_global_scopes": {},
+                "_boot_deferred": True,
+            }
+        )
+        if not hasattr(model, "__appends__"):
+            model.__dict__["__appends__"] = []
+
+        model.observe_events(model, "booting")
+        model._check_fillable_and_guarded()
+        model.observe_events(model, "booted")
+
+        return model
+
+    def _hydrate_attributes(self, result, dates, relations=None):
+        dic = {}
+        for key, value in result.items():
+            if value and key in dates:
+                value = self.get_new_date(value)
+            dic[key] = value
+
+        logger = logging.getLogger("masoniteorm.models.hydrate")
+        if logger.hasHandlers():
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.info(
+                f"Hydrating Model {self.__class__.__name__}",
+                extra={
+                    "class_name": self.__class__.__name__,
+                    "class_module": self.__class__.__module__,
+                },
+            )
+
+        self.observe_events(self, "hydrating")
+        self.__attributes__.update(dic)
+        self.__original_attributes__.update(dic)
+        if relations:
+            self.add_relation(relations)
+        self.observe_events(self, "hydrated")
+
     def fill(self, attributes):
         self.__attributes__.update(attributes)
         return self
@@ -573,17 +746,13 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         Given an attribute name and a value, casts the value using the model's registered caster.
         If no registered caster exists, returns the unmodified value.
         """
-        cast_method = cls.__casts__.get(attribute)
-        cast_map = cls.get_cast_map(cls)
+        cast = cls.get_metadata().casts.get(attribute)
 
         if value is None:
             return None
 
-        if isinstance(cast_method, str):
-            return cast_map[cast_method]().set(value)
-
-        if cast_method:
-            return cast_method(value)
+        if cast:
+            return cast[1](value)
         return value
 
     @classmethod
@@ -620,25 +789,32 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         if include is not None:
             self.__visible__ = include
 
+        metadata = self.get_metadata()
+        hidden = (
+            frozenset(self.__dict__["__hidden__"])
+            if "__hidden__" in self.__dict__
+            else metadata.hidden
+        )
+        visible = self.__dict__.get("__visible__", metadata.visible)
+
         # prevent using both hidden and visible at the same time
-        if self.__visible__ and self.__hidden__:
+        if visible and hidden:
             raise AttributeError(
                 f"class model '{self.__class__.__name__}' defines both __visible__ and __hidden__."
             )
 
-        if self.__visible__:
+        if visible:
             new_serialized_dictionary = {
-                k: serialized_dictionary[k]
-                for k in self.__visible__
-                if k in serialized_dictionary
+                k: serialized_dictionary[k] for k in visible if k in serialized_dictionary
             }
             serialized_dictionary = new_serialized_dictionary
         else:
-            for key in self.__hidden__:
+            for key in hidden:
                 if key in serialized_dictionary:
                     serialized_dictionary.pop(key)
 
-        for date_column in self.get_dates():
+        casts = self.get_casts()
+        for date_column in self.get_date_columns():
             if (
                 date_column in serialized_dictionary
                 and serialized_dictionary[date_column]
@@ -661,13 +837,13 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
 
         remove_keys = []
         for key, value in serialized_dictionary.items():
-            if key in self.__hidden__:
+            if key in hidden:
                 remove_keys.append(key)
             if hasattr(value, "serialize"):
                 value = value.serialize(self.__relationship_hidden__.get(key, []))
             if isinstance(value, datetime):
                 value = self.get_new_serialized_date(value)
-            if key in self.__casts__:
+            if key in casts:
                 value = self._cast_attribute(key, value)
 
             serialized_dictionary.update({key: value})
@@ -771,10 +947,14 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             mixed: Could be anything that a method can return.
         """
 
-        new_name_accessor = "get_" + attribute + "_attribute"
+        if attribute == "builder" and self.__dict__.get("_boot_deferred"):
+            return self.get_builder()
 
-        if (new_name_accessor) in self.__class__.__dict__:
-            return self.__class__.__dict__.get(new_name_accessor)(self)
+        metadata = self.get_metadata()
+
+        accessor = metadata.accessors.get(attribute)
+        if accessor:
+            return accessor(self)
 
         if (
             "__dirty_attributes__" in self.__dict__
@@ -786,7 +966,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "__attributes__" in self.__dict__
             and attribute in self.__dict__["__attributes__"]
         ):
-            if attribute in self.get_dates():
+            if attribute in self.get_date_columns():
                 return (
                     self.get_new_date(self.get_value(attribute))
                     if self.get_value(attribute)
@@ -829,14 +1009,16 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return results
 
     def __setattr__(self, attribute, value):
-        if hasattr(self, "set_" + attribute + "_attribute"):
-            method = getattr(self, "set_" + attribute + "_attribute")
-            value = method(value)
+        metadata = self.get_metadata()
+
+        mutator = metadata.mutators.get(attribute)
+        if mutator:
+            value = getattr(self, mutator)(value)
 
-        if attribute in self.__casts__:
+        if attribute in self.get_casts():
             value = self._set_cast_attribute(attribute, value)
 
-        if attribute in self.get_dates():
+        if attribute in self.get_date_columns():
             value = self.get_new_datetime_string(value)
 
         try:
@@ -871,6 +1053,12 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return list(self.get_dirty_attributes().keys())
 
     def save(self, query=False):
+        session = UnitOfWork.current()
+        if session is not None and not query:
+            # The unit of work writes the model when it commits
+            session.add(self)
+            return self
+
         builder = self.get_builder()
 
         if "builder" in self.__dirty_attributes__:
@@ -906,14 +1094,14 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
 
     def get_value(self, attribute):
         value = self.__attributes__[attribute]
-        if attribute in self.__casts__:
+        if attribute in self.get_casts():
             return self._cast_attribute(attribute, value)
 
         return value
 
     def get_dirty_value(self, attribute):
         value = self.__dirty_attributes__[attribute]
-        if attribute in self.__casts__:
+        if attribute in self.get_casts():
             return self._cast_attribute(attribute, value)
 
         return value
@@ -921,8 +1109,9 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     def all_attributes(self):
         attributes = self.__attributes__
         attributes.update(self.get_dirty_attributes())
+        casts = self.get_casts()
         for key, value in attributes.items():
-            if key in self.__casts__:
+            if key in casts:
                 attributes.update({key: self._cast_attribute(key, value)})
 
         return attributes
@@ -940,30 +1129,52 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return self.__dirty_attributes__ or {}
 
     def get_cast_map(self):
-        cast_map = self.__internal_cast_map__
-        cast_map.update(self.__cast_map__)
-        return cast_map
+        return self.get_metadata().cast_map
 
-    def _cast_attribute(self, attribute, value):
-        cast_method = self.__casts__[attribute]
-        cast_map = self.get_cast_map()
+    def get_casts(self):
+        """Gets the resolved casts of the model.
 
-        if value is None:
-            return None
+        The casts of the class are used unless the instance overrides __casts__ or has
+        casters that are not stateless, which are then resolved once for the instance.
 
-        if isinstance(cast_method, str):
-            return cast_map[cast_method]().get(value)
+        Returns:
+            dict
+        """
+        metadata = self.get_metadata()
+        casts = self.__dict__.get("__casts__")
+        if casts is None and not metadata.stateful_casts:
+            return metadata.casts
+
+        resolved = self.__dict__.get("_casts")
+        if resolved is None or resolved[0] is not metadata or resolved[1] is not casts:
+            resolved = (
+                metadata,
+                casts,
+                metadata.resolve_casts(self.__casts__ if casts is None else casts),
+            )
+            self.__dict__["_casts"] = resolved
 
-        return cast_method(value)
+        return resolved[2]
 
-    def _set_cast_attribute(self, attribute, value):
-        cast_method = self.__casts__[attribute]
-        cast_map = self.get_cast_map()
+    def get_date_columns(self):
+        """Gets the columns converted to dates, honoring an instance __dates__ override.
+
+        Returns:
+            frozenset
+        """
+        if "__dates__" in self.__dict__:
+            return frozenset(self.get_dates())
 
-        if isinstance(cast_method, str):
-            return cast_map[cast_method]().set(value)
+        return self.get_metadata().dates
 
-        return cast_method(value)
+    def _cast_attribute(self, attribute, value):
+        if value is None:
+            return None
+
+        return self.get_casts()[attribute][0](value)
+
+    def _set_cast_attribute(self, attribute, value):
+        return self.get_casts()[attribute][1](value)
 
     @classmethod
     def load(cls, *loads):
@@ -1058,13 +1269,53 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             )
 
         related = getattr(self.__class__, relation)
+        # Relationships with a pivot table detach every record with one delete
+        bulk = hasattr(type(related), "detach_many")
         for related_record in relating_records:
             if not related_record.is_created():
                 related_record.create(related_record.all_attributes())
             else:
                 related_record.save()
 
-            related.detach(self, related_record)
+            if not bulk:
+                related.detach(self, related_record)
+
+        if bulk:
+            related.detach_many(self, relating_records)
+
+    def attach_many(self, relation, related_records, extra=None):
+        """Attaches many records to a belongs to many relationship with one insert.
+
+        Arguments:
+            relation {string} -- The name of the relationship.
+            related_records {list|Collection} -- Related models or their keys.
+
+        Keyword Arguments:
+            extra {dict} -- Extra pivot columns set on every inserted row. (default: {None})
+
+        Returns:
+            list -- The keys that were attached.
+        """
+        return getattr(self.__class__, relation).attach_many(
+            self, related_records, extra=extra
+        )
+
+    def sync(self, relation, related_records, extra=None):
+        """Makes the given records the only records attached to a belongs to many relationship.
+
+        Arguments:
+            relation {string} -- The name of the relationship.
+            related_records {list|Collection} -- Related models or their keys.
+
+        Keyword Arguments:
+            extra {dict} -- Extra pivot columns set on newly attached rows. (default: {None})
+
+        Returns:
+            dict -- The keys that were "attached" and "detached".
+        """
+        return getattr(self.__class__, relation).sync(
+            self, related_records, extra=extra
+        )
 
     def related(self, relation):
         related = getattr(self.__class__, relation)
@@ -1077,7 +1328,10 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     def attach(self, relation, related_record):
         related = getattr(self.__class__, relation)
 
-        if not related_record.is_created():
+        if related.attaches_pending and UnitOfWork.current() is not None:
+            # The unit of work inserts the record, and sets its key on this model, when it flushes
+            related_record.save()
+        elif not related_record.is_created():
             related_record = related_record.create(related_record.all_attributes())
         else:
             related_record.save()
@@ -2,6 +2,7 @@ from typing import Any, Dict
 
 from typing_extensions import Self
 
+from ..query.AsyncQueryBuilder import AsyncQueryBuilder
 from ..query.QueryBuilder import QueryBuilder
 
 class Model:
@@ -33,6 +34,13 @@ class Model:
         """
         pass
 
+    def async_query() -> AsyncQueryBuilder:
+        """Gets a query builder whose methods running queries are coroutines.
+
+        await User.async_query().where("active", 1).get()
+        """
+        pass
+
     def avg(column: str):
         """Aggregates a columns values.
 
@@ -57,7 +65,38 @@ class Model:
         """
         pass
 
-    def bulk_create(creates: dict, query: bool = False):
+    def bulk_create(
+        creates: dict,
+        query: bool = False,
+        cast: bool = False,
+        batch_size: int = None,
+        transaction: bool = False,
+        ignore_mass_assignment: bool = False,
+        get_ids: bool = False,
+        id_key: str = "id",
+    ):
+        pass
+
+    def bulk_update(
+        records: list,
+        key: str = "id",
+        columns: list = None,
+        query: bool = False,
+        batch_size: int = None,
+        transaction: bool = False,
+    ):
+        """Updates many rows, each with its own values, in one statement per batch.
+
+        Arguments:
+            records {list} -- Models or dictionaries holding the key and the new values.
+
+        Keyword Arguments:
+            key {str} -- The column identifying each row. (default: {"id"})
+            columns {list} -- The columns to update. (default: the dirty attributes)
+
+        Returns:
+            int -- The number of affected rows.
+        """
         pass
 
     def cast_value(attribute: str, value: Any):
@@ -78,6 +117,12 @@ class Model:
     def chunk(chunk_amount: str | int):
         pass
 
+    def cursor(chunk_amount: int = 1000):
+        pass
+
+    def cursor_paginate(per_page: int, cursor: str = None):
+        pass
+
     def count(column: str = None):
         """Aggregates a columns values.
 
@@ -280,6 +325,14 @@ class Model:
         """
         pass
 
+    def lazy(chunk_amount: int = 1000):
+        """Streams the results of the query one record at a time using a server side cursor.
+
+        Returns:
+            generator
+        """
+        pass
+
     def group_by_raw(query: str, bindings: list = []):
         """Specifies a column to group by.
 
@@ -516,6 +569,17 @@ class Model:
     def paginate(per_page: int, page: int = 1):
         pass
 
+    def remember(ttl: int = None, key: str = None, tags: list = None):
+        """Caches the rows returned by the select of this builder. Writes run through a query
+        builder on the tables of the query forget them.
+
+        Keyword Arguments:
+            ttl {int|float} -- Seconds the rows are kept for. (default: {None})
+            key {string} -- The cache key. (default: {None})
+            tags {list} -- More tags to forget the result with. (default: {None})
+        """
+        pass
+
     def right_join(
         table: str, column1: str = None, equality: str = None, column2: str = None
     ):
@@ -639,6 +703,28 @@ class Model:
         """
         pass
 
+    def upsert(
+        rows: list,
+        unique_by: list,
+        update: list = None,
+        query: bool = False,
+        batch_size: int = None,
+        transaction: bool = False,
+    ):
+        """Inserts many rows, updating the rows that conflict with an existing record instead.
+
+        Arguments:
+            rows {list} -- A list of dictionaries of columns and values.
+            unique_by {list} -- The columns of the unique index that identifies a record.
+
+        Keyword Arguments:
+            update {list} -- The columns updated on conflicting rows. (default: every column not in unique_by)
+
+        Returns:
+            int -- The number of affected rows.
+        """
+        pass
+
     def when(conditional: bool, callback: callable):
         pass
 
@@ -834,8 +920,63 @@ class Model:
         """
         pass
 
-    def with_(*eagers: str):
+    def with_(*eagers: str, strategy: str = "query"):
+        """Eager loads relationships.
+
+        Keyword Arguments:
+            strategy {string} -- "query" or "join" to load belongs to and has one relationships
+                                 through a LEFT JOIN in the same query. (default: {"query"})
+
+        Returns:
+            self
+        """
         pass
 
-    def with_count(relationship: str, callback: Any = None):
+    def with_count(relationship: str, callback: Any = None, mode: str = "subselect"):
+        pass
+
+    def with_sum(
+        relationship: str, column: str, callback: Any = None, mode: str = "subselect"
+    ):
+        pass
+
+    def with_avg(
+        relationship: str, column: str, callback: Any = None, mode: str = "subselect"
+    ):
+        pass
+
+    def with_min(
+        relationship: str, column: str, callback: Any = None, mode: str = "subselect"
+    ):
+        pass
+
+    def with_max(
+        relationship: str, column: str, callback: Any = None, mode: str = "subselect"
+    ):
+        pass
+
+    def with_exists(relationship: str, callback: Any = None, mode: str = "subselect"):
+        pass
+
+    def with_aggregate(
+        relationship: str,
+        aggregate: str,
+        column: str = "*",
+        callback: Any = None,
+        mode: str = "subselect",
+    ):
+        """Loads an aggregate of the related records of a relationship onto each model.
+
+        Arguments:
+            relationship {string} -- The name of the relationship.
+            aggregate {string} -- One of count, sum, avg, min, max or exists.
+
+        Keyword Arguments:
+            column {string} -- The related column to aggregate. (default: {"*"})
+            callback {callable} -- A callback receiving the aggregate query. (default: {None})
+            mode {string} -- "subselect" or "group". (default: {"subselect"})
+
+        Returns:
+            self
+        """
         pass
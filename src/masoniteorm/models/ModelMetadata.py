@@ -0,0 +1,126 @@
+class ModelMetadata:
+    """Attribute metadata of a model class.
+
+    The metadata is resolved once per model class and dropped whenever an attribute is set
+    on the class (or one of its parents), so hot paths like attribute access, hydration and
+    serialization only need dictionary lookups.
+
+    Casters declared stateless (with a truthy ``stateless`` attribute) are shared by
+    every instance of the class. Any other caster is created for each model instance.
+    """
+
+    def __init__(self, model):
+        """ModelMetadata initializer
+
+        Arguments:
+            model {masoniteorm.models.Model} -- The model class.
+        """
+        self.accessors = {}
+        for name, method in model.__dict__.items():
+            if name.startswith("get_") and name.endswith("_attribute"):
+                self.accessors[name[4:-10]] = method
+
+        self.mutators = {}
+        for name in dir(model):
+            if name.startswith("set_") and name.endswith("_attribute"):
+                self.mutators[name[4:-10]] = name
+
+        self.cast_map = dict(model.__internal_cast_map__)
+        self.cast_map.update(model.__cast_map__)
+
+        self._stateless_casters = {}
+        self.casts = self.resolve_casts(model.__casts__)
+        self.stateful_casts = any(
+            isinstance(cast, str)
+            and cast in self.cast_map
+            and not getattr(self.cast_map[cast], "stateless", False)
+            for cast in model.__casts__.values()
+        )
+
+        self.dates = frozenset(model.get_dates(model))
+        self.hidden = frozenset(model.__hidden__)
+        self.visible = tuple(model.__visible__)
+        self.primary_key = model.__primary_key__
+
+        from .Model import Model
+
+        self.fillable_and_guarded = any(
+            base_class is not Model
+            and issubclass(base_class, Model)
+            and "__fillable__" in base_class.__dict__
+            and "__guarded__" in base_class.__dict__
+            for base_class in model.__mro__
+        )
+
+    def resolve_casts(self, casts):
+        """Resolves the casts of a model, creating the casters that are not stateless.
+
+        Arguments:
+            casts {dict} -- The casts keyed by attribute.
+
+        Returns:
+            dict
+        """
+        return {
+            attribute: self._resolve_cast(cast) for attribute, cast in casts.items()
+        }
+
+    def _resolve_cast(self, cast):
+        """Resolves a cast to a (get, set) pair of callables.
+
+        Arguments:
+            cast {str|callable} -- A key of the cast map or a callable.
+
+        Returns:
+            tuple
+        """
+        if not isinstance(cast, str):
+            return cast, cast
+
+        if cast not in self.cast_map:
+
+            def missing(value):
+                raise KeyError(cast)
+
+            return missing, missing
+
+        caster_class = self.cast_map[cast]
+        if not getattr(caster_class, "stateless", False):
+            caster = caster_class()
+            return caster.get, caster.set
+
+        if cast not in self._stateless_casters:
+            caster = caster_class()
+            self._stateless_casters[cast] = (caster.get, caster.set)
+
+        return self._stateless_casters[cast]
+
+    @classmethod
+    def resolve(cls, model):
+        """Gets the metadata of a model class, computing it on first use.
+
+        Arguments:
+            model {masoniteorm.models.Model} -- The model class.
+
+        Returns:
+            ModelMetadata
+        """
+        metadata = model.__dict__.get("__metadata__")
+        if metadata is None:
+            metadata = cls(model)
+            type.__setattr__(model, "__metadata__", metadata)
+
+        return metadata
+
+    @classmethod
+    def forget(cls, model):
+        """Drops the metadata of a model class and of every class inheriting from it.
+
+        Arguments:
+            model {masoniteorm.models.Model} -- The model class.
+        """
+        if "__metadata__" in model.__dict__:
+            type.__delattr__(model, "__metadata__")
+
+        for subclass in model.__subclasses__():
+            cls.forget(subclass)
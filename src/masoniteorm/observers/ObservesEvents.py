@@ -7,6 +7,14 @@ class ObservesEvents:
                 except AttributeError:
                     pass
 
+    def observe_batch_events(self, model, event, models):
+        if model.__has_events__ == True:
+            for observer in model.__observers__.get(model.__class__, []):
+                try:
+                    getattr(observer, event)(models)
+                except AttributeError:
+                    pass
+
     @classmethod
     def observe(cls, observer):
         if cls in cls.__observers__:
@@ -0,0 +1,76 @@
+import base64
+import binascii
+import json
+
+from ..exceptions import InvalidArgument
+from .BasePaginator import BasePaginator
+
+
+class CursorPaginator(BasePaginator):
+    """Paginates using opaque cursors pointing at the first or last record of a page.
+
+    Pages are fetched by seeking past the cursor values on the ordered columns instead
+    of using an offset, so no COUNT query is needed and every page costs the same.
+    """
+
+    def __init__(self, result, per_page, next_cursor=None, previous_cursor=None, url=None):
+        self.result = result
+        self.per_page = per_page
+        self.count = len(self.result)
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.url = url
+
+    def serialize(self, *args, **kwargs):
+        return {
+            "data": self.result.serialize(*args, **kwargs),
+            "meta": {
+                "next_cursor": self.next_cursor,
+                "previous_cursor": self.previous_cursor,
+                "per_page": self.per_page,
+                "count": self.count,
+            },
+        }
+
+    def has_more_pages(self):
+        return self.next_cursor is not None
+
+    @staticmethod
+    def encode_cursor(values, direction="next"):
+        """Encodes the seek values of a record into an opaque cursor.
+
+        Arguments:
+            values {list} -- The values of the ordered columns.
+
+        Keyword Arguments:
+            direction {str} -- Either 'next' or 'prev'. (default: {"next"})
+
+        Returns:
+            string
+        """
+        payload = json.dumps({"values": values, "direction": direction}, default=str)
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """Decodes a cursor created by encode_cursor.
+
+        Arguments:
+            cursor {string} -- The opaque cursor.
+
+        Raises:
+            InvalidArgument: Raised when the cursor is malformed.
+
+        Returns:
+            tuple -- The seek values and the direction.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            values, direction = payload["values"], payload["direction"]
+        except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+            raise InvalidArgument(f"Invalid pagination cursor '{cursor}'.")
+
+        if direction not in ("next", "prev") or not isinstance(values, list):
+            raise InvalidArgument(f"Invalid pagination cursor '{cursor}'.")
+
+        return values, direction
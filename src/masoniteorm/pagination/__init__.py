@@ -1,2 +1,3 @@
 from .LengthAwarePaginator import LengthAwarePaginator
 from .SimplePaginator import SimplePaginator
+from .CursorPaginator import CursorPaginator
@@ -0,0 +1,614 @@
+import asyncio
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from ..cache import ResultCache
+from ..config import load_config
+from ..connections.ReplicaRouter import ReplicaRouter
+from ..exceptions import ModelNotFound, MultipleRecordsFound
+from ..expressions.expressions import UpdateQueryExpression
+from ..pagination import LengthAwarePaginator, SimplePaginator
+from .QueryBuilder import QueryBuilder
+
+
+class AsyncQueryBuilder(QueryBuilder):
+    """A query builder awaiting its queries through an asyncio driver.
+
+    The query is built and compiled exactly like with the QueryBuilder. The methods running
+    a query are coroutines executed on the async connection registered for the driver of
+    the connection, for example aiosqlite for "sqlite":
+
+        users = await User.async_query().where("active", 1).get()
+
+    Eager loaded relationships and aggregates loaded in "group" mode are queried through
+    the blocking connections in a worker thread so they never block the event loop.
+    Methods that are not coroutines here, like chunk or upsert, still run through the
+    blocking connection.
+    """
+
+    def on(self, connection):
+        super().on(connection)
+
+        DB = load_config(self.config_path).DB
+        self.async_connection_class = DB.connection_factory.make_async(
+            self._connection_driver
+        )
+
+        return self
+
+    async def new_async_connection(self, read=None):
+        """Makes the async connection the queries of this builder run on. Inside
+        ConnectionResolver.async_transaction the connection of the transaction is used.
+
+        Keyword Arguments:
+            read {bool} -- Whether the query only reads. Guessed from the action of the
+                    builder when omitted. (default: {None})
+
+        Returns:
+            masoniteorm.connections.AsyncBaseConnection
+        """
+        if read is None:
+            read = self._action == "select" and not self.lock
+
+        details = self._connection_details.get(self.connection, {})
+        if not read:
+            ReplicaRouter.record_write(self.connection, details)
+
+        if self._connection and (
+            self._connection.open or not ReplicaRouter.splits(details)
+        ):
+            return self._connection
+
+        self._connection = await (
+            self.async_connection_class(
+                **self.get_connection_information(read=read), name=self.connection
+            )
+            .set_schema(self._schema)
+            .make_connection()
+        )
+        return self._connection
+
+    async def _run(self, query, bindings, results="*", read=None):
+        connection = await self.new_async_connection(read=read)
+        return await connection.query(query, bindings, results=results)
+
+    async def _run_select(self, results="*"):
+        """Runs the select query, through the result cache when remember was called.
+        Results read inside a transaction are never stored.
+        """
+        if not self._remember:
+            return await self._run(self.to_qmark(), self._bindings, results=results)
+
+        cache = self.get_result_cache()
+        key, tags, sql = self._remembered_query(cache, results)
+
+        result = cache.get(key, ResultCache.MISSING)
+        if result is not ResultCache.MISSING:
+            return result
+
+        generations = cache.get_generations(tags)
+        connection = await self.new_async_connection()
+        result = await connection.query(sql, self._bindings, results=results)
+        if connection.get_transaction_level() <= 0:
+            cache.put(
+                key,
+                result,
+                ttl=self._remember["ttl"],
+                tags=tags,
+                generations=generations,
+            )
+
+        return result
+
+    async def _prepare_result(self, result, collection=False):
+        """Hydrates the result. Eager loads and grouped aggregates run their queries on the
+        blocking connections so they are moved to a worker thread.
+        """
+        if not self._model or not result or not self._loads_related():
+            return self.prepare_result(result, collection=collection)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.prepare_result, result, collection=collection)
+        )
+
+    def _loads_related(self):
+        return (
+            self._eager_relation.eagers
+            or self._eager_relation.nested_eagers
+            or self._eager_relation.callback_eagers
+            or any(aggregate[5] != "subselect" for aggregate in self._eager_aggregates)
+        )
+
+    async def statement(self, query, bindings=None):
+        if bindings is None:
+            bindings = []
+        result = await self._run(query, bindings, read=False)
+        return self.prepare_result(result)
+
+    async def begin(self):
+        connection = await self.new_async_connection(read=False)
+        return await connection.begin()
+
+    async def commit(self):
+        return await self._connection.commit()
+
+    async def rollback(self):
+        await self._connection.rollback()
+        return self
+
+    async def create(
+        self,
+        creates: Optional[Dict[str, Any]] = None,
+        query: bool = False,
+        id_key: str = "id",
+        cast: bool = False,
+        ignore_mass_assignment: bool = False,
+        **kwargs,
+    ):
+        """Inserts a row.
+
+        Arguments:
+            creates {dict} -- A dictionary of columns and values.
+
+        Returns:
+            Model|dict
+        """
+        if query:
+            return super().create(
+                creates,
+                query=True,
+                cast=cast,
+                ignore_mass_assignment=ignore_mass_assignment,
+                **kwargs,
+            )
+
+        self.set_action("insert")
+        model = None
+        self._creates = creates if creates else kwargs
+
+        if self._model:
+            model = self._model
+            self._creates.update(self._creates_related)
+            if not ignore_mass_assignment:
+                self._creates = model.filter_mass_assignment(self._creates)
+            if cast:
+                self._creates = model.cast_values(self._creates)
+
+            model = model.hydrate(self._creates)
+            self.observe_events(model, "creating")
+            self._creates.update(model.get_dirty_attributes())
+
+        if not self.dry:
+            query_result = await self._run(self.to_qmark(), self._bindings, results=1)
+            self._forget_cached_results()
+
+            if model:
+                id_key = model.get_primary_key()
+
+            processed_results = self.get_processor().process_insert_get_id(
+                self, query_result or self._creates, id_key
+            )
+        else:
+            processed_results = self._creates
+
+        if model:
+            model = model.fill(processed_results)
+            self.observe_events(model, "created")
+            return model
+
+        return processed_results
+
+    async def bulk_create(
+        self,
+        creates: List[Dict[str, Any]],
+        query: bool = False,
+        cast: bool = False,
+        batch_size: Optional[int] = None,
+        transaction: bool = False,
+        ignore_mass_assignment: bool = False,
+    ):
+        """Inserts many rows, split into as few statements as the grammar's parameter limits allow.
+
+        Arguments:
+            creates {list} -- A list of dictionaries of columns and values.
+
+        Keyword Arguments:
+            query {bool} -- Return the builder instead of running the insert. (default: {False})
+            cast {bool} -- Cast the values through the model casts. (default: {False})
+            batch_size {int} -- The maximum number of rows per statement. (default: {None})
+            transaction {bool} -- Run every batch inside a single transaction. (default: {False})
+            ignore_mass_assignment {bool} -- Skip the fillable and guarded filters. (default: {False})
+
+        Returns:
+            Model|list|dict
+        """
+        super().bulk_create(
+            creates,
+            query=True,
+            cast=cast,
+            ignore_mass_assignment=ignore_mass_assignment,
+        )
+
+        if query:
+            return self
+
+        query_result = None
+        if not self.dry:
+            query_result = await self._run_batches(batch_size, transaction)
+
+        if self._model:
+            return self._model.hydrate(self._creates)
+
+        return query_result or self._creates
+
+    async def _run_batches(self, batch_size=None, transaction=False):
+        """Runs the bulk insert, one statement per batch of rows.
+
+        Returns:
+            dict|None -- The first row returned by the database, if any.
+        """
+        self.run_scopes()
+
+        creates = self._creates
+        if not creates:
+            return None
+
+        def make_grammar(rows):
+            return self.grammar(columns=rows, table=self._table)
+
+        size = self.get_bulk_batch_size(
+            len(make_grammar(creates[:1]).get_bulk_bindings(self._action)), batch_size
+        )
+        statements = {}
+        query_result = None
+
+        connection = await self.new_async_connection()
+        if transaction:
+            await connection.begin()
+
+        try:
+            for offset in range(0, len(creates), size):
+                rows = creates[offset : offset + size]
+                grammar = make_grammar(rows)
+
+                sql = statements.get(len(rows))
+                if sql is None:
+                    sql = statements[len(rows)] = grammar.compile(
+                        self._action, qmark=True
+                    ).to_sql()
+
+                result = await connection.query(
+                    sql, grammar.get_bulk_bindings(self._action), results=1
+                )
+                if query_result is None:
+                    query_result = result
+        except Exception:
+            if transaction:
+                await connection.rollback()
+            raise
+        finally:
+            self._forget_cached_results()
+
+        if transaction:
+            await connection.commit()
+
+        self.reset()
+
+        return query_result
+
+    async def update(
+        self,
+        updates: Dict[str, Any],
+        dry: bool = False,
+        force: bool = False,
+        cast: bool = False,
+        ignore_mass_assignment: bool = False,
+    ):
+        """Updates the rows matching the query.
+
+        Arguments:
+            updates {dictionary} -- A dictionary of columns and values to update.
+
+        Returns:
+            Model|dict|self
+        """
+        model = self._model
+        result = super().update(
+            updates,
+            dry=True,
+            force=force,
+            cast=cast,
+            ignore_mass_assignment=ignore_mass_assignment,
+        )
+
+        if result is not self or dry or self.dry:
+            return result
+
+        if self._action != "update":
+            # Nothing changed on the model
+            return model or result
+
+        updates = self._updates[0].column
+        additional = {}
+        if model and model.is_loaded():
+            additional.update({model.get_primary_key(): model.get_primary_key_value()})
+
+        await self._run(self.to_qmark(), self._bindings)
+        self._forget_cached_results()
+
+        if model:
+            model.fill(updates)
+            self.observe_events(model, "updated")
+            model.fill_original(updates)
+            return model
+
+        additional.update(updates)
+        return additional
+
+    async def increment(self, column, value=1):
+        """Increments a column's value.
+
+        Arguments:
+            column {string} -- The name of the column.
+
+        Keyword Arguments:
+            value {int} -- The value to increment by. (default: {1})
+
+        Returns:
+            int|dict
+        """
+        return await self._step(column, value, "increment")
+
+    async def decrement(self, column, value=1):
+        """Decrements a column's value.
+
+        Arguments:
+            column {string} -- The name of the column.
+
+        Keyword Arguments:
+            value {int} -- The value to decrement by. (default: {1})
+
+        Returns:
+            int|dict
+        """
+        return await self._step(column, value, "decrement")
+
+    async def _step(self, column, value, update_type):
+        model = self._model
+        id_value = None
+
+        if model and model.is_loaded():
+            id_value = model.get_primary_key_value()
+            self.where(model.get_primary_key(), id_value)
+            self.observe_events(model, "updating")
+
+        self._updates += (
+            UpdateQueryExpression(column, value, update_type=update_type),
+        )
+
+        self.set_action("update")
+        await self._run(self.to_qmark(), self._bindings)
+        self._forget_cached_results()
+
+        if id_value is None:
+            return {}
+
+        self.set_action("select")
+        row = await self.where(model.get_primary_key(), id_value).first([column])
+        return row[column]
+
+    async def delete(self, column=None, value=None, query=False):
+        """Deletes the rows matching the query.
+
+        Keyword Arguments:
+            column {string} -- The name of the column (default: {None})
+            value {string|int} -- The value of the column (default: {None})
+
+        Returns:
+            list|self
+        """
+        model = self._model
+        self.set_action("delete")
+
+        if column and value:
+            if isinstance(value, (list, tuple)):
+                self.where_in(column, value)
+            else:
+                self.where(column, value)
+
+        if query:
+            return self
+
+        if model and model.is_loaded():
+            self.where(model.get_primary_key(), model.get_primary_key_value())
+            self.observe_events(model, "deleting")
+
+        result = await self._run(self.to_qmark(), self._bindings)
+        self._forget_cached_results()
+
+        if model:
+            self.observe_events(model, "deleted")
+
+        return result
+
+    async def count(self, column=None):
+        """Counts the rows matching the query.
+
+        Keyword Arguments:
+            column {string} -- The column to count. (default: {None})
+
+        Returns:
+            int|self -- self when a column is given, to be run with first or get.
+        """
+        if column or self.dry:
+            return super().count(column)
+
+        self.aggregate("COUNT", "* as m_count_reserved")
+
+        result = await self._run_select(results=1)
+
+        return (result or {}).get("m_count_reserved") or 0
+
+    async def first(self, fields=None, query=False):
+        """Gets the first record.
+
+        Returns:
+            Model|dict|None
+        """
+        self.select(fields or []).limit(1)
+
+        if query:
+            return self
+
+        result = await self._run_select(results=1)
+
+        return await self._prepare_result(result)
+
+    async def last(self, column=None, query=False):
+        """Gets the last record, ordered by column in descendant order or primary
+        key if no column is given.
+
+        Returns:
+            Model|dict|None
+        """
+        _column = column if column else self._model.get_primary_key()
+        self.limit(1).order_by(_column, direction="DESC")
+
+        if query:
+            return self
+
+        result = await self._run_select(results=1)
+
+        return await self._prepare_result(result)
+
+    async def find(self, record_id, query=False):
+        """Finds a row by the primary key ID. Requires a model
+
+        Arguments:
+            record_id {int} -- The ID of the primary key to fetch.
+
+        Returns:
+            Model|None
+        """
+        self.where(self._model.get_primary_key(), record_id)
+
+        if query:
+            return self
+
+        return await self.first()
+
+    async def find_or_fail(self, record_id):
+        result = await self.find(record_id)
+
+        if not result:
+            raise ModelNotFound()
+
+        return result
+
+    async def first_or_fail(self, query=False):
+        if query:
+            return await self.first(query=True)
+
+        result = await self.first()
+
+        if not result:
+            raise ModelNotFound()
+
+        return result
+
+    async def first_where(self, column, *args):
+        if not args:
+            return await self.where_not_null(column).first()
+        return await self.where(column, *args).first()
+
+    async def first_or_create(self, wheres, creates: dict = None):
+        record = await self.where(wheres).first()
+        if record:
+            return record
+
+        total = dict(creates or {})
+        total.update(wheres)
+        total.update(self._creates_related)
+
+        return await self.create(total, id_key=self.get_primary_key())
+
+    async def sole(self, query=False):
+        result = await self.take(2).get()
+
+        if result.is_empty():
+            raise ModelNotFound()
+
+        if result.count() > 1:
+            raise MultipleRecordsFound()
+
+        return result.first()
+
+    async def sole_value(self, column: str, query=False):
+        return (await self.sole())[column]
+
+    async def all(self, selects=[], query=False):
+        """Returns all records from the table.
+
+        Returns:
+            Collection
+        """
+        self.select(*selects)
+
+        if query:
+            return self
+
+        result = await self._run_select() or []
+
+        return await self._prepare_result(result, collection=True)
+
+    async def get(self, selects=[]):
+        """Runs the select query built from the query builder.
+
+        Returns:
+            Collection
+        """
+        self.select(*selects)
+        result = await self._run_select()
+
+        return await self._prepare_result(result, collection=True)
+
+    async def exists(self):
+        return bool(await self.first())
+
+    async def doesnt_exist(self):
+        return not await self.exists()
+
+    async def value(self, column: str):
+        return (await self.get()).first()[column]
+
+    async def truncate(self, foreign_keys=False):
+        sql = self.get_grammar().truncate_table(self.get_table_name(), foreign_keys)
+        if self.dry:
+            return sql
+
+        result = await self._run(sql, (), read=False)
+        self._forget_cached_results()
+        return result
+
+    async def paginate(self, per_page, page=1):
+        offset = 0 if page == 1 else (int(page) * per_page) - per_page
+
+        total_builder = self.new_from_builder()
+        total_builder._order_by = ()
+        total_builder._columns = ()
+        total_builder.aggregate("COUNT", "* as m_count_reserved")
+        total_query = total_builder.to_qmark()
+
+        result = await self.limit(per_page).offset(offset).get()
+        total = (
+            await self._run(total_query, total_builder._bindings, results=1) or {}
+        ).get("m_count_reserved") or 0
+
+        return LengthAwarePaginator(result, per_page, page, total)
+
+    async def simple_paginate(self, per_page, page=1):
+        offset = 0 if page == 1 else (int(page) * per_page) - per_page
+
+        result = await self.limit(per_page).offset(offset).get()
+
+        return SimplePaginator(result, per_page, page)
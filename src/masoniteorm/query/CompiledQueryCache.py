@@ -0,0 +1,303 @@
+import threading
+from collections import OrderedDict
+
+from ..expressions.expressions import (
+    BetweenExpression,
+    JoinClause,
+    OnClause,
+    QueryExpression,
+    SelectExpression,
+)
+
+
+class Uncacheable(Exception):
+    """Raised while fingerprinting a builder whose state cannot be cached."""
+
+
+class CompiledQueryCache:
+    """A bounded LRU cache of compiled qmark SQL.
+
+    Entries are keyed on a structural fingerprint of the query builder: the grammar, action,
+    table, columns, where shapes, joins, ordering, grouping, limit and offset. Values that are
+    sent as bindings are not part of the fingerprint, so two queries that only differ by their
+    bindings share the same compiled SQL.
+
+    The fingerprint walks the builder in the same order the grammar compiles it so the bindings
+    can be collected without compiling the query. Builders using sub queries are never cached.
+    """
+
+    actions = ("select", "update", "delete")
+
+    def __init__(self, max_size=512):
+        """CompiledQueryCache initializer
+
+        Keyword Arguments:
+            max_size {int} -- The maximum number of compiled statements kept. 0 disables the cache. (default: {512})
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._statements = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, builder):
+        """Gets the fingerprint of a builder and the bindings the compiled statement expects.
+
+        Arguments:
+            builder {masoniteorm.query.QueryBuilder} -- The query builder.
+
+        Returns:
+            tuple -- The fingerprint (None if the builder cannot be cached) and a list of bindings.
+        """
+        if not self.max_size or builder._action not in self.actions:
+            return None, None
+
+        if builder._creates:
+            return None, None
+
+        bindings = []
+        try:
+            if builder._action == "select":
+                key = (
+                    builder.grammar,
+                    builder._action,
+                    self._table_key(builder._table),
+                    self._column_keys(builder._columns),
+                    tuple(
+                        (aggregate.aggregate, aggregate.column, aggregate.alias)
+                        for aggregate in builder._aggregates
+                    ),
+                    self._join_keys(builder._joins, bindings),
+                    self._where_keys(builder._wheres, bindings),
+                    self._order_by_keys(builder._order_by, bindings),
+                    self._group_by_keys(builder._group_by, bindings),
+                    tuple(
+                        (
+                            having.column,
+                            having.equality,
+                            self._value(having.value),
+                            having.raw,
+                        )
+                        for having in builder._having
+                    ),
+                    self._value(builder._limit),
+                    self._value(builder._offset),
+                    builder._distinct,
+                    builder.lock,
+                )
+            else:
+                key = (
+                    builder.grammar,
+                    builder._action,
+                    self._table_key(builder._table),
+                    self._update_keys(builder._updates, bindings),
+                    self._where_keys(builder._wheres, bindings),
+                )
+            hash(key)
+        except (Uncacheable, TypeError):
+            return None, None
+
+        return key, bindings
+
+    def get(self, key):
+        """Gets a compiled statement and marks it as recently used.
+
+        Arguments:
+            key {tuple} -- A fingerprint returned by fingerprint().
+
+        Returns:
+            str|None
+        """
+        with self._lock:
+            sql = self._statements.get(key)
+            if sql is None:
+                self.misses += 1
+                return None
+
+            self._statements.move_to_end(key)
+            self.hits += 1
+            return sql
+
+    def put(self, key, sql):
+        """Stores a compiled statement, evicting the least recently used one when full.
+
+        Arguments:
+            key {tuple} -- A fingerprint returned by fingerprint().
+            sql {str} -- The compiled qmark SQL.
+        """
+        with self._lock:
+            self._statements[key] = sql
+            self._statements.move_to_end(key)
+            while len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+
+    def resize(self, max_size):
+        """Changes the maximum number of cached statements.
+
+        Arguments:
+            max_size {int} -- The new maximum. 0 disables the cache.
+        """
+        with self._lock:
+            self.max_size = max_size
+            while len(self._statements) > max_size:
+                self._statements.popitem(last=False)
+
+        return self
+
+    def clear(self):
+        """Removes every cached statement and resets the counters."""
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+
+        return self
+
+    def stats(self):
+        """Returns the cache statistics.
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._statements),
+                "max_size": self.max_size,
+            }
+
+    def _value(self, value):
+        """Values compiled into the SQL itself are part of the fingerprint.
+        The type is kept so 1 and True do not share a key."""
+        return (type(value), value)
+
+    def _table_key(self, table):
+        if table is None:
+            return None
+        return (table.name, table.raw)
+
+    def _column_keys(self, columns):
+        keys = []
+        for column in columns:
+            if isinstance(column, SelectExpression):
+                keys.append((column.column, column.alias, column.raw))
+            elif isinstance(column, str):
+                keys.append(column)
+            else:
+                raise Uncacheable()
+        return tuple(keys)
+
+    def _update_keys(self, updates, bindings):
+        keys = []
+        for update in updates or ():
+            if isinstance(update.column, dict):
+                columns = []
+                for column, value in update.column.items():
+                    if hasattr(value, "expression"):
+                        columns.append((column, "expression", value.expression))
+                    else:
+                        columns.append(column)
+                        bindings.append(value)
+                keys.append((update.update_type, tuple(columns)))
+            else:
+                keys.append((update.update_type, update.column))
+                bindings.append(update.value)
+        return tuple(keys)
+
+    def _join_keys(self, joins, bindings):
+        keys = []
+        for join in joins:
+            if not isinstance(join, JoinClause):
+                raise Uncacheable()
+
+            clauses = []
+            for clause in join.get_on_clauses():
+                if isinstance(clause, OnClause):
+                    clauses.append(
+                        (clause.column1, clause.equality, clause.column2, clause.operator)
+                    )
+                    continue
+
+                clauses.append(
+                    (clause.column, clause.equality, clause.value_type, clause.operator)
+                )
+                if clause.value_type not in ("NULL", "NOT NULL"):
+                    bindings.append(clause.value)
+
+            keys.append((join.table, join.alias, join.clause, tuple(clauses)))
+        return tuple(keys)
+
+    def _where_keys(self, wheres, bindings):
+        keys = []
+        for where in wheres:
+            if not isinstance(where, (QueryExpression, BetweenExpression)):
+                raise Uncacheable()
+
+            keyword = getattr(where, "keyword", None) == "or"
+
+            if where.raw:
+                if not isinstance(where.bindings, (list, tuple)):
+                    raise Uncacheable()
+                keys.append((keyword, "raw", where.column))
+                bindings.extend(where.bindings)
+                continue
+
+            equality = where.equality.upper()
+            value = where.value
+            value_type = where.value_type
+            shape = (keyword, where.column, equality, value_type)
+
+            if equality == "BETWEEN":
+                keys.append(shape)
+                bindings.append(where.low)
+                bindings.append(where.high)
+                continue
+
+            if equality == "NOT BETWEEN":
+                keys.append(shape + (self._value(where.low), self._value(where.high)))
+                continue
+
+            if value_type == "value_equals":
+                shape += (self._value(value),)
+
+            if hasattr(value, "builder"):
+                raise Uncacheable()
+            elif isinstance(value, list):
+                keys.append(shape + ("list", len(value)))
+                bindings.extend(value)
+            elif value is True and value_type != "NOT NULL":
+                keys.append(shape + ("true",))
+            elif value is False and value_type != "NOT NULL":
+                keys.append(shape + ("false",))
+            elif value_type == "column":
+                keys.append(shape + (value,))
+            else:
+                keys.append(shape)
+                if value is not True and value_type not in (
+                    "value_equals",
+                    "NULL",
+                    "BETWEEN",
+                ):
+                    bindings.append(value)
+        return tuple(keys)
+
+    def _order_by_keys(self, order_by, bindings):
+        keys = []
+        for order in order_by:
+            if order.raw:
+                if not isinstance(order.bindings, (list, tuple)):
+                    raise Uncacheable()
+                bindings.extend(order.bindings)
+            keys.append((order.column, order.direction, order.raw))
+        return tuple(keys)
+
+    def _group_by_keys(self, group_by, bindings):
+        keys = []
+        for group in group_by:
+            keys.append((group.column, group.raw))
+            if group.raw:
+                # The grammar stops at the first raw group by
+                bindings.extend(group.bindings or ())
+                break
+        return tuple(keys)
@@ -1,10 +1,14 @@
 import inspect
-from copy import deepcopy
+import re
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Callable
 
 from ..collection.Collection import Collection
+from ..cache import MemoryResultCache, ResultCache
 from ..config import load_config
+from ..connections.ReplicaRouter import ReplicaRouter
 from ..exceptions import (
     HTTP404,
     ConnectionNotRegistered,
@@ -26,16 +30,24 @@ from ..expressions.expressions import (
     SubSelectExpression,
     UpdateQueryExpression,
 )
+from ..models.IdentityMap import IdentityMap
 from ..observers import ObservesEvents
-from ..pagination import LengthAwarePaginator, SimplePaginator
+from ..pagination import CursorPaginator, LengthAwarePaginator, SimplePaginator
 from ..schema import Schema
 from ..scopes import BaseScope
+from .CompiledQueryCache import CompiledQueryCache
 from .EagerRelation import EagerRelations
 
 
 class QueryBuilder(ObservesEvents):
     """A builder class to manage the building and creation of query expressions."""
 
+    _compiled_query_cache = CompiledQueryCache()
+    _result_cache = MemoryResultCache()
+
+    # The columns of the tables joined by join eager loads, per connection and table
+    _join_eager_table_columns = {}
+
     def __init__(
         self,
         grammar=None,
@@ -73,6 +85,10 @@ class QueryBuilder(ObservesEvents):
         self.lock = False
         self._schema = schema
         self._eager_relation = EagerRelations()
+        self._join_eagers = ()
+        self._join_eager_columns = ()
+        self._join_eagers_applied = False
+        self._remember = None
         if model:
             self._global_scopes = model._global_scopes
             if model.__with__:
@@ -84,6 +100,8 @@ class QueryBuilder(ObservesEvents):
 
         self._columns = ()
         self._creates = {}
+        self._unique_by = ()
+        self._upsert_columns = ()
 
         self._sql = ""
         self._bindings = ()
@@ -98,6 +116,7 @@ class QueryBuilder(ObservesEvents):
         self._macros = {}
 
         self._aggregates = ()
+        self._eager_aggregates = ()
 
         self._limit = False
         self._offset = False
@@ -147,25 +166,34 @@ class QueryBuilder(ObservesEvents):
         self._group_by = ()
         self._joins = ()
         self._having = ()
+        self._join_eagers_applied = False
 
         return self
 
-    def get_connection_information(self):
+    def get_connection_information(self, read=False):
+        """Gets the settings the connection class is created with.
+
+        Keyword Arguments:
+            read {bool} -- Whether the query only reads. Connections configured with read
+                    and write host groups route reads to a read host. (default: {False})
+
+        Returns:
+            dict
+        """
+        details = ReplicaRouter.route(
+            self.connection,
+            self._connection_details.get(self.connection, {}),
+            read=read,
+        )
         return {
-            "host": self._connection_details.get(self.connection, {}).get("host"),
-            "database": self._connection_details.get(self.connection, {}).get(
-                "database"
-            ),
-            "user": self._connection_details.get(self.connection, {}).get("user"),
-            "port": self._connection_details.get(self.connection, {}).get("port"),
-            "password": self._connection_details.get(self.connection, {}).get(
-                "password"
-            ),
-            "prefix": self._connection_details.get(self.connection, {}).get("prefix"),
-            "options": self._connection_details.get(self.connection, {}).get(
-                "options", {}
-            ),
-            "full_details": self._connection_details.get(self.connection, {}),
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
 
     def table(self, table, raw=False):
@@ -247,7 +275,7 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        return self.new_connection().begin()
+        return self.new_connection(read=False).begin()
 
     def begin_transaction(self, *args, **kwargs):
         return self.begin(*args, **kwargs)
@@ -445,7 +473,7 @@ class QueryBuilder(ObservesEvents):
     def statement(self, query, bindings=None):
         if bindings is None:
             bindings = []
-        result = self.new_connection().query(query, bindings)
+        result = self.new_connection(read=False).query(query, bindings)
         return self.prepare_result(result)
 
     def select_raw(self, query):
@@ -461,8 +489,35 @@ class QueryBuilder(ObservesEvents):
         return self.connection_class.get_default_post_processor()()
 
     def bulk_create(
-        self, creates: List[Dict[str, Any]], query: bool = False, cast: bool = False
+        self,
+        creates: List[Dict[str, Any]],
+        query: bool = False,
+        cast: bool = False,
+        batch_size: Optional[int] = None,
+        transaction: bool = False,
+        ignore_mass_assignment: bool = False,
+        get_ids: bool = False,
+        id_key: str = "id",
     ):
+        """Inserts many rows, split into as few statements as the grammar's parameter limits allow.
+
+        Arguments:
+            creates {list} -- A list of dictionaries of columns and values.
+
+        Keyword Arguments:
+            query {bool} -- Return the builder instead of running the insert. (default: {False})
+            cast {bool} -- Cast the values through the model casts. (default: {False})
+            batch_size {int} -- The maximum number of rows per statement. (default: {None})
+            transaction {bool} -- Run every batch inside a single transaction. (default: {False})
+            ignore_mass_assignment {bool} -- Skip the fillable and guarded filters. (default: {False})
+            get_ids {bool} -- Read the generated keys back into the rows. Rows are inserted
+                    one at a time when the database can not return the keys of a bulk
+                    insert. (default: {False})
+            id_key {string} -- The key generated by the database. Models use their primary key. (default: {"id"})
+
+        Returns:
+            Model|list|dict
+        """
         self.set_action("bulk_create")
         model = None
 
@@ -471,7 +526,7 @@ class QueryBuilder(ObservesEvents):
 
         self._creates = []
         for unsorted_create in creates:
-            if model:
+            if model and not ignore_mass_assignment:
                 unsorted_create = model.filter_mass_assignment(unsorted_create)
             if cast:
                 unsorted_create = model.cast_values(unsorted_create)
@@ -481,21 +536,312 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self
 
-        if model:
-            model = model.hydrate(self._creates)
+        creates = self._creates
         if not self.dry:
-            connection = self.new_connection()
-            query_result = connection.query(self.to_qmark(), self._bindings, results=1)
+            if get_ids and model:
+                id_key = model.get_primary_key()
+            if get_ids and not self.grammar.bulk_insert_returns_ids:
+                batch_size = 1
 
-            processed_results = query_result or self._creates
+            query_result, _ = self._run_in_batches(
+                batch_size, transaction, id_key=id_key if get_ids else None
+            )
+
+            processed_results = query_result or creates
         else:
-            processed_results = self._creates
+            processed_results = creates
 
         if model:
-            return model
+            return model.hydrate(creates)
 
         return processed_results
 
+    def get_bulk_batch_size(self, row_parameters, batch_size=None):
+        """Gets the number of rows a single bulk statement can hold.
+
+        Arguments:
+            row_parameters {int} -- The number of parameters bound for every row.
+
+        Keyword Arguments:
+            batch_size {int} -- A maximum requested by the caller. (default: {None})
+
+        Returns:
+            int
+        """
+        size = max(1, self.grammar.max_bulk_parameters // max(1, row_parameters))
+        if self.grammar.max_bulk_rows:
+            size = min(size, self.grammar.max_bulk_rows)
+        if batch_size:
+            size = min(size, batch_size)
+
+        return size
+
+    def upsert(
+        self,
+        rows: List[Dict[str, Any]],
+        unique_by: List[str],
+        update: Optional[List[str]] = None,
+        query: bool = False,
+        batch_size: Optional[int] = None,
+        transaction: bool = False,
+    ):
+        """Inserts many rows, updating the rows that conflict with an existing record instead.
+
+        Arguments:
+            rows {list} -- A list of dictionaries of columns and values.
+            unique_by {list} -- The columns of the unique index that identifies a record.
+                    MySQL always uses the table's primary and unique keys.
+
+        Keyword Arguments:
+            update {list} -- The columns updated on conflicting rows. Defaults to every
+                    column that is not in unique_by. An empty list leaves conflicting rows
+                    untouched. (default: {None})
+            query {bool} -- Return the builder instead of running the upsert. (default: {False})
+            batch_size {int} -- The maximum number of rows per statement. (default: {None})
+            transaction {bool} -- Run every batch inside a single transaction. (default: {False})
+
+        Returns:
+            int|self -- The number of affected rows, as reported by the driver.
+        """
+        if isinstance(unique_by, str):
+            unique_by = [unique_by]
+
+        if not unique_by:
+            raise InvalidArgument("upsert() requires at least one unique_by column.")
+
+        self.set_action("upsert")
+
+        self._creates = []
+        for row in rows:
+            if self._model:
+                row = self._model.filter_mass_assignment(row)
+            # sort the dicts by key so the values inserted align with the correct column
+            self._creates.append(dict(sorted(row.items())))
+
+        if update is None:
+            update = [
+                column
+                for column in (self._creates[0] if self._creates else ())
+                if column not in unique_by
+            ]
+
+        self._unique_by = tuple(unique_by)
+        self._upsert_columns = tuple(update)
+
+        if query:
+            return self
+
+        if self.dry:
+            return 0
+
+        _, affected = self._run_in_batches(batch_size, transaction)
+        return affected
+
+    def _run_in_batches(
+        self, batch_size=None, transaction=False, records=None, events=(), id_key=None
+    ):
+        """Runs a bulk statement, one statement per batch of rows. Batches of the same size
+        share the same compiled statement.
+
+        Keyword Arguments:
+            records {list} -- The models or dictionaries behind each row. (default: {None})
+            events {tuple} -- The observer events fired before and after every batch, with a
+                    collection of the records of the batch. (default: {()})
+            id_key {string} -- The key generated by the database, read back into the rows
+                    of a bulk insert. (default: {None})
+
+        Returns:
+            tuple -- The first row returned by the database, if any, and the number of affected rows.
+        """
+        self.run_scopes()
+
+        action = self._action
+        creates = self._creates
+        if not creates:
+            return None, 0
+
+        def make_grammar(rows):
+            return self.grammar(
+                columns=rows,
+                table=self._table,
+                unique_by=self._unique_by,
+                upsert_columns=self._upsert_columns,
+            )
+
+        size = self.get_bulk_batch_size(
+            len(make_grammar(creates[:1]).get_bulk_bindings(action)), batch_size
+        )
+        statements = {}
+        query_result = None
+        affected = 0
+        if not self._model:
+            events = ()
+
+        returning = id_key and action == "bulk_create"
+        if returning and self.grammar.bulk_insert_returns_ids:
+            compiled_action, results = "bulk_create_returning", "*"
+        else:
+            compiled_action, results = action, 1 if action == "bulk_create" else "*"
+
+        connection = self.new_connection()
+        if transaction:
+            if not connection.open:
+                connection.make_connection()
+            connection.begin()
+
+        try:
+            for offset in range(0, len(creates), size):
+                rows = creates[offset : offset + size]
+                grammar = make_grammar(rows)
+
+                sql = statements.get(len(rows))
+                if sql is None:
+                    sql = statements[len(rows)] = grammar.compile(
+                        compiled_action, qmark=True
+                    ).to_sql()
+
+                if events:
+                    batch = Collection(records[offset : offset + size])
+                    self.observe_batch_events(self._model, events[0], batch)
+
+                self._bindings = grammar.get_bulk_bindings(action)
+                result = connection.query(sql, self._bindings, results=results)
+                affected += connection.get_row_count()
+                if returning:
+                    result = self._read_inserted_ids(result, rows, id_key)
+                if query_result is None:
+                    query_result = result
+
+                if events:
+                    self.observe_batch_events(self._model, events[1], batch)
+        except Exception:
+            if transaction:
+                connection.rollback()
+            raise
+        finally:
+            self._forget_cached_results()
+
+        if transaction:
+            connection.commit()
+
+        self.reset()
+
+        return query_result, affected
+
+    def _read_inserted_ids(self, result, rows, id_key):
+        """Sets the keys generated by an insert on the rows it inserted.
+
+        Returns:
+            dict|None -- The first inserted row.
+        """
+        processor = self.get_processor()
+        if self.grammar.bulk_insert_returns_ids:
+            processor.process_bulk_insert_get_ids(self, result, rows, id_key)
+            return result[0] if isinstance(result, list) and result else result
+
+        processor.process_insert_get_id(self, rows[0], id_key)
+        return result
+
+    def bulk_update(
+        self,
+        records: List[Any],
+        key: str = "id",
+        columns: Optional[List[str]] = None,
+        query: bool = False,
+        batch_size: Optional[int] = None,
+        transaction: bool = False,
+    ):
+        """Updates many rows, each with its own values, in one statement per batch.
+
+        Observers of the model receive bulk_updating and bulk_updated events with a
+        collection of the records of every batch.
+
+        Arguments:
+            records {list} -- Models or dictionaries holding the key and the new values.
+
+        Keyword Arguments:
+            key {str} -- The column identifying each row. (default: {"id"})
+            columns {list} -- The columns to update. Defaults to the dirty attributes of the
+                    models, or every key of the first dictionary. (default: {None})
+            query {bool} -- Return the builder instead of running the update. (default: {False})
+            batch_size {int} -- The maximum number of rows per statement. (default: {None})
+            transaction {bool} -- Run every batch inside a single transaction. (default: {False})
+
+        Raises:
+            InvalidArgument: Raised when a record is missing the key or one of the columns.
+
+        Returns:
+            int|self -- The number of affected rows, as reported by the driver.
+        """
+        if columns is None:
+            columns = self._bulk_update_columns(records, key)
+
+        dates = self._model.get_dates() if self._model else ()
+
+        self._creates = []
+        for record in records:
+            row = {}
+            for column in [key] + list(columns):
+                value = self._bulk_update_value(record, column)
+                if column in dates and value:
+                    value = self._model.get_new_datetime_string(value)
+                row[column] = value
+            self._creates.append(row)
+
+        self.set_action("bulk_update")
+        self._unique_by = (key,)
+        self._upsert_columns = tuple(columns)
+
+        if query:
+            return self
+
+        if self.dry or not columns:
+            return 0
+
+        rows = self._creates
+        _, affected = self._run_in_batches(
+            batch_size,
+            transaction,
+            records=records,
+            events=("bulk_updating", "bulk_updated"),
+        )
+
+        for record, row in zip(records, rows):
+            if not isinstance(record, dict):
+                updates = {column: row[column] for column in columns}
+                record.fill(updates)
+                record.fill_original(updates)
+                for column in columns:
+                    record.__dirty_attributes__.pop(column, None)
+
+        return affected
+
+    def _bulk_update_columns(self, records, key):
+        if records and isinstance(records[0], dict):
+            return [column for column in records[0] if column != key]
+
+        columns = []
+        for record in records:
+            for column in record.get_dirty_attributes():
+                if column != key and column not in columns:
+                    columns.append(column)
+        return columns
+
+    def _bulk_update_value(self, record, column):
+        if isinstance(record, dict):
+            attributes = record
+        elif column in record.__dirty_attributes__:
+            return record.__dirty_attributes__[column]
+        else:
+            attributes = record.__attributes__
+
+        if column not in attributes:
+            raise InvalidArgument(
+                f"bulk_update() record is missing the '{column}' column."
+            )
+
+        return attributes[column]
+
     def create(
         self,
         creates: Optional[Dict[str, Any]] = None,
@@ -542,6 +888,7 @@ class QueryBuilder(ObservesEvents):
             connection = self.new_connection()
 
             query_result = connection.query(self.to_qmark(), self._bindings, results=1)
+            self._forget_cached_results()
 
             if model:
                 id_key = model.get_primary_key()
@@ -593,6 +940,7 @@ class QueryBuilder(ObservesEvents):
             self.observe_events(model, "deleting")
 
         result = self.new_connection().query(self.to_qmark(), self._bindings)
+        self._forget_cached_results()
 
         if model:
             self.observe_events(model, "deleted")
@@ -898,10 +1246,42 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def chunk(self, chunk_amount):
+        """Streams the results of the query in chunks using a server side cursor.
+
+        Arguments:
+            chunk_amount {int} -- The number of records in each chunk.
+
+        Returns:
+            generator -- Yields a collection of hydrated models (or a list of dictionaries) per chunk.
+        """
         chunk_connection = self.new_connection()
-        for result in chunk_connection.select_many(self.to_sql(), (), chunk_amount):
+        sql = self.to_qmark()
+        for result in chunk_connection.select_many(sql, self._bindings, chunk_amount):
             yield self.prepare_result(result)
 
+    def lazy(self, chunk_amount=1000):
+        """Streams the results of the query one record at a time using a server side cursor.
+
+        Keyword Arguments:
+            chunk_amount {int} -- The number of records fetched from the database at once. (default: {1000})
+
+        Returns:
+            generator -- Yields a hydrated model (or a dictionary) per record.
+        """
+        for results in self.chunk(chunk_amount):
+            yield from results
+
+    def cursor(self, chunk_amount=1000):
+        """Alias for the lazy method.
+
+        Keyword Arguments:
+            chunk_amount {int} -- The number of records fetched from the database at once. (default: {1000})
+
+        Returns:
+            generator
+        """
+        return self.lazy(chunk_amount)
+
     def where_not_null(self, column: str):
         """Specifies a where expression where the column is not NULL.
 
@@ -1228,11 +1608,141 @@ class QueryBuilder(ObservesEvents):
             related.query_where_exists(self, callback, method="or_where_not_exists")
         return self
 
-    def with_count(self, relationship, callback=None):
-        return getattr(self._model, relationship).get_with_count_query(
-            self, callback=callback
+    def with_count(self, relationship, callback=None, mode="subselect"):
+        """Loads the number of related records of a relationship onto each model.
+
+        Arguments:
+            relationship {string} -- The name of the relationship.
+
+        Keyword Arguments:
+            callback {callable} -- A callback constraining the counted records. (default: {None})
+            mode {string} -- "subselect" for a correlated subselect per row or "group" for a
+                             single GROUP BY query once the models are loaded. (default: {"subselect"})
+
+        Returns:
+            self
+        """
+        if mode == "subselect":
+            return getattr(self._model, relationship).get_with_count_query(
+                self, callback=callback
+            )
+
+        return self.with_aggregate(relationship, "count", callback=callback, mode=mode)
+
+    def with_sum(self, relationship, column, callback=None, mode="subselect"):
+        return self.with_aggregate(
+            relationship, "sum", column, callback=callback, mode=mode
+        )
+
+    def with_avg(self, relationship, column, callback=None, mode="subselect"):
+        return self.with_aggregate(
+            relationship, "avg", column, callback=callback, mode=mode
+        )
+
+    def with_min(self, relationship, column, callback=None, mode="subselect"):
+        return self.with_aggregate(
+            relationship, "min", column, callback=callback, mode=mode
+        )
+
+    def with_max(self, relationship, column, callback=None, mode="subselect"):
+        return self.with_aggregate(
+            relationship, "max", column, callback=callback, mode=mode
+        )
+
+    def with_exists(self, relationship, callback=None, mode="subselect"):
+        return self.with_aggregate(
+            relationship, "exists", callback=callback, mode=mode
+        )
+
+    def with_aggregate(
+        self, relationship, aggregate, column="*", callback=None, mode="subselect"
+    ):
+        """Loads an aggregate of the related records of a relationship onto each model.
+
+        In "subselect" mode the aggregate is a correlated subselect added to the columns
+        of this query. In "group" mode it is computed once the models are loaded, with a
+        single query grouped by the related key for every loaded model, and stitched onto
+        the models. Models without related records get 0 for counts, False for exists and
+        None for the other aggregates.
+
+        Arguments:
+            relationship {string} -- The name of the relationship.
+            aggregate {string} -- One of count, sum, avg, min, max or exists.
+
+        Keyword Arguments:
+            column {string} -- The related column to aggregate. (default: {"*"})
+            callback {callable} -- A callback receiving the aggregate query to constrain it. (default: {None})
+            mode {string} -- "subselect" or "group". (default: {"subselect"})
+
+        Returns:
+            self
+        """
+        aggregate = aggregate.lower()
+        if aggregate not in ("count", "sum", "avg", "min", "max", "exists"):
+            raise InvalidArgument(f"'{aggregate}' is not a relationship aggregate.")
+
+        if mode not in ("subselect", "group"):
+            raise InvalidArgument(
+                f"Relationship aggregates run as a 'subselect' or 'group' query, not '{mode}'."
+            )
+
+        related = getattr(self._model, relationship)
+        alias = related.get_aggregate_alias(relationship, aggregate, column)
+
+        if mode == "group":
+            self._eager_aggregates += (
+                (relationship, aggregate, column, callback, alias, mode),
+            )
+            return self
+
+        def subselect(query):
+            related_table, related_key, parent_key = related.get_aggregate_query(
+                query, self, join_related=column != "*" or bool(callback)
+            )
+            query.where_column(related_key, f"{self.get_table_name()}.{parent_key}")
+            if callback:
+                callback(query)
+
+            if aggregate == "exists":
+                return query.select_raw("1").limit(1)
+
+            query.aggregate(
+                aggregate.upper(),
+                self._qualify_aggregate_column(related_table, column),
+                alias="m_aggregate_reserved",
+            )
+            return query
+
+        if not self._columns:
+            self.select("*")
+
+        if aggregate == "exists":
+            # The subselect holds 1 or NULL, cast to a boolean once the models load
+            self._eager_aggregates += (
+                (relationship, aggregate, column, None, alias, mode),
+            )
+
+        self._columns += (
+            SubGroupExpression(subselect(self._new_aggregate_query()), alias=alias),
+        )
+
+        return self
+
+    def _new_aggregate_query(self):
+        return QueryBuilder(
+            grammar=self.grammar,
+            connection_class=self.connection_class,
+            connection=self.connection,
+            connection_details=self._connection_details,
+            connection_driver=self._connection_driver,
         )
 
+    def _qualify_aggregate_column(self, table, column):
+        if column == "*" or "." in column:
+            return column
+
+        return f"{table}.{column}"
+
     def where_not_in(self, column, wheres=None):
         """Specifies where a column does not contain a list of a values.
 
@@ -1463,6 +1973,7 @@ class QueryBuilder(ObservesEvents):
         additional.update(updates)
 
         self.new_connection().query(self.to_qmark(), self._bindings)
+        self._forget_cached_results()
         if model:
             model.fill(updates)
             self.observe_events(model, "updated")
@@ -1522,6 +2033,7 @@ class QueryBuilder(ObservesEvents):
 
         self.set_action("update")
         results = self.new_connection().query(self.to_qmark(), self._bindings)
+        self._forget_cached_results()
         processed_results = self.get_processor().get_column_value(
             self, column, results, id_key, id_value
         )
@@ -1561,6 +2073,7 @@ class QueryBuilder(ObservesEvents):
 
         self.set_action("update")
         result = self.new_connection().query(self.to_qmark(), self._bindings)
+        self._forget_cached_results()
         processed_results = self.get_processor().get_column_value(
             self, column, result, id_key, id_value
         )
@@ -1599,9 +2112,7 @@ class QueryBuilder(ObservesEvents):
             return self
 
         if not column:
-            result = self.new_connection().query(
-                self.to_qmark(), self._bindings, results=1
-            )
+            result = self._run_select(results=1)
 
             if isinstance(result, dict):
                 return result.get(alias, 0)
@@ -1715,7 +2226,7 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self
 
-        result = self.new_connection().query(self.to_qmark(), self._bindings, results=1)
+        result = self._run_select(results=1)
 
         return self.prepare_result(result)
 
@@ -1780,11 +2291,7 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self
 
-        result = self.new_connection().query(
-            self.to_qmark(),
-            self._bindings,
-            results=1,
-        )
+        result = self._run_select(results=1)
 
         return self.prepare_result(result)
 
@@ -1885,13 +2392,44 @@ class QueryBuilder(ObservesEvents):
 
     def prepare_result(self, result, collection=False):
         if self._model and result:
-            # eager load here
-            hydrated_model = self._model.hydrate(result)
-            if (
+            eager = (
                 self._eager_relation.eagers
                 or self._eager_relation.nested_eagers
                 or self._eager_relation.callback_eagers
-            ) and hydrated_model:
+            )
+
+            identity_map = IdentityMap.current()
+            if identity_map is None and eager:
+                # Share models across the eager loads of this query
+                identity_map = IdentityMap().begin()
+                try:
+                    return self.prepare_result(result, collection=collection)
+                finally:
+                    identity_map.close()
+
+            related_rows = None
+            if self._join_eagers:
+                result, related_rows = self._split_join_eagers(result)
+
+            if identity_map:
+                model_class = (
+                    self._model if inspect.isclass(self._model) else self._model.__class__
+                )
+                hydrated_model = identity_map.hydrate(
+                    model_class, result, complete=not self._columns
+                )
+            else:
+                hydrated_model = self._model.hydrate(result)
+
+            if related_rows and hydrated_model:
+                self._register_join_eagers(hydrated_model, related_rows, identity_map)
+
+            if self._eager_aggregates and hydrated_model:
+                self._load_eager_aggregates(hydrated_model)
+
+            # eager load here
+            if eager and hydrated_model:
+                relations = []
                 for eager_load in self._eager_relation.get_eagers():
                     if isinstance(eager_load, dict):
                         # Nested
@@ -1905,15 +2443,12 @@ class QueryBuilder(ObservesEvents):
                             else:
                                 related = self._model.get_related(relation)
 
-                            result_set = related.get_related(
-                                self, hydrated_model, eagers=eagers, callback=callback
-                            )
-
-                            self._register_relationships_to_model(
-                                related,
-                                result_set,
-                                hydrated_model,
-                                relation_key=relation,
+                            relations.append(
+                                (
+                                    relation,
+                                    related,
+                                    {"eagers": eagers, "callback": callback},
+                                )
                             )
                     else:
                         # Not Nested
@@ -1923,11 +2458,15 @@ class QueryBuilder(ObservesEvents):
                             else:
                                 related = self._model.get_related(eager)
 
-                            result_set = related.get_related(self, hydrated_model)
+                            relations.append((eager, related, {}))
 
-                            self._register_relationships_to_model(
-                                related, result_set, hydrated_model, relation_key=eager
-                            )
+                result_sets = self._get_related_results(relations, hydrated_model)
+                for (relation_key, related, _), result_set in zip(
+                    relations, result_sets
+                ):
+                    self._register_relationships_to_model(
+                        related, result_set, hydrated_model, relation_key=relation_key
+                    )
 
             if collection:
                 return hydrated_model if result else Collection([])
@@ -1939,6 +2478,133 @@ class QueryBuilder(ObservesEvents):
         else:
             return result or None
 
+    def _load_eager_aggregates(self, hydrated_model):
+        """Stitches the relationship aggregates loaded in "group" mode onto the models.
+
+        Each aggregate runs as one query selecting the related key and the aggregate for
+        every loaded model, grouped by the related key.
+
+        Arguments:
+            hydrated_model {Model|Collection} -- The loaded models.
+        """
+        models = (
+            hydrated_model
+            if isinstance(hydrated_model, Collection)
+            else [hydrated_model]
+        )
+
+        for relationship, aggregate, column, callback, alias, mode in (
+            self._eager_aggregates
+        ):
+            if mode == "group":
+                parent_key, values = self._get_grouped_aggregate(
+                    relationship, aggregate, column, callback, models
+                )
+
+            default = {"count": 0, "exists": False}.get(aggregate)
+            for model in models:
+                if mode == "group":
+                    value = values.get(str(getattr(model, parent_key, None)))
+                else:
+                    value = model.__attributes__.get(alias)
+
+                if aggregate == "exists":
+                    value = bool(value)
+                elif value is None:
+                    value = default
+
+                model.fill({alias: value}).fill_original({alias: value})
+
+    def _get_grouped_aggregate(self, relationship, aggregate, column, callback, models):
+        related = getattr(self._model, relationship)
+        query = self._new_aggregate_query()
+        related_table, related_key, parent_key = related.get_aggregate_query(
+            query, self, join_related=column != "*" or bool(callback)
+        )
+        if callback:
+            callback(query)
+
+        keys = Collection(
+            [getattr(model, parent_key, None) for model in models]
+        ).unique()
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            return parent_key, {}
+
+        query.select(f"{related_key} as m_aggregate_key").group_by(related_key)
+        query.aggregate(
+            "COUNT" if aggregate == "exists" else aggregate.upper(),
+            self._qualify_aggregate_column(related_table, column),
+            alias="m_aggregate_value",
+        )
+
+        return parent_key, {
+            str(row["m_aggregate_key"]): row["m_aggregate_value"]
+            for row in query.get_where_in(related_key, keys)
+        }
+
+    def _get_related_results(self, relations, hydrated_model):
+        """Runs the queries of sibling eager loaded relationships.
+
+        When the connection allows more than one eager load worker the queries run
+        concurrently, each on its own connection. The result sets are always returned
+        in the order of the relationships so they are registered deterministically.
+
+        Arguments:
+            relations {list} -- Tuples of relation key, relationship and get_related keyword arguments.
+            hydrated_model {Model|Collection} -- The models the relationships are loaded for.
+
+        Returns:
+            list
+        """
+
+        identity_map = IdentityMap.current()
+        written = ReplicaRouter.get_writes()
+
+        def get_related(relation):
+            _, related, kwargs = relation
+            return related.get_related(self, hydrated_model, **kwargs)
+
+        def get_related_in_worker(relation):
+            # Worker threads share the identity map and the sticky writes of the calling thread
+            ReplicaRouter.set_writes(written)
+            if identity_map is None:
+                return get_related(relation)
+
+            with identity_map:
+                return get_related(relation)
+
+        workers = min(self.get_eager_load_workers(), len(relations))
+        if workers <= 1:
+            return [get_related(relation) for relation in relations]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(get_related_in_worker, relations))
+
+    def get_eager_load_workers(self):
+        """Gets how many sibling relationships may be eager loaded at the same time.
+
+        Set with the eager_load_workers option of the connection. Inside a transaction, or
+        while a connection is held open on the current thread, every query has to share
+        that connection so relationships load one at a time.
+
+        Returns:
+            int
+        """
+        details = self._connection_details.get(self.connection) or {}
+        workers = int(details.get("eager_load_workers") or 1)
+        if workers <= 1:
+            return 1
+
+        resolver = load_config(self.config_path).DB
+        if (
+            self.connection in resolver.get_global_connections()
+            or self.connection in resolver.get_held_connections()
+        ):
+            return 1
+
+        return workers
+
     def _register_relationships_to_model(
         self, related, related_result, hydrated_model, relation_key
     ):
@@ -1980,7 +2646,7 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self
 
-        result = self.new_connection().query(self.to_qmark(), self._bindings) or []
+        result = self._run_select() or []
 
         return self.prepare_result(result, collection=True)
 
@@ -1991,17 +2657,202 @@ class QueryBuilder(ObservesEvents):
             self
         """
         self.select(*selects)
-        result = self.new_connection().query(self.to_qmark(), self._bindings)
+        result = self._run_select()
+
+        return self.prepare_result(result, collection=True)
+
+    def get_where_in(self, column, values, batch_size=None):
+        """Runs the select query for the rows where a column contains one of many values.
+
+        Used by eager loading. Grammars that can bind a list as a single array parameter
+        send integer values in one statement. Other values, and other grammars, are split
+        into batches that stay under the grammar's parameter limit and the results are
+        merged.
+
+        A limit or offset on the query applies to the rows of each value rather than to
+        the whole result, so an eager load can fetch the latest few related records of
+        every parent model.
+
+        Arguments:
+            column {string} -- The name of the column.
+            values {list} -- A list of values.
+
+        Keyword Arguments:
+            batch_size {int} -- A maximum number of values per statement. (default: {None})
+
+        Returns:
+            Collection
+        """
+        values = list(values)
+        grammar = self.get_grammar()
+
+        # The driver types a list of strings as text[], which does not compare with
+        # uuid or numeric key columns, so only integer keys are bound as an array
+        if (
+            len(values) > 1
+            and grammar.where_any_string()
+            and all(
+                isinstance(value, int) and not isinstance(value, bool)
+                for value in values
+            )
+        ):
+            return self.where_raw(
+                grammar.where_any_string().format(
+                    column=grammar._table_column_string(column)
+                ),
+                [values],
+            )._get_limited_per(column)
+
+        size = self.get_where_in_batch_size(batch_size)
+        if len(values) <= size:
+            return self.where_in(column, values)._get_limited_per(column)
+
+        state = (
+            self._action,
+            self._updates,
+            self._wheres,
+            self._order_by,
+            self._group_by,
+            self._joins,
+            self._having,
+        )
+
+        results = Collection()
+        for offset in range(0, len(values), size):
+            (
+                self._action,
+                self._updates,
+                self._wheres,
+                self._order_by,
+                self._group_by,
+                self._joins,
+                self._having,
+            ) = state
+            results.merge(
+                self.where_in(
+                    column, values[offset : offset + size]
+                )._get_limited_per(column)
+            )
+
+        return results
+
+    def _get_limited_per(self, column):
+        """Runs the select query, applying its limit and offset to the rows of each value
+        of a column.
+
+        The rows are numbered per value with ROW_NUMBER() OVER (PARTITION BY column) in
+        the order of the query and only the numbers inside the limit and offset are
+        selected, so the other rows never leave the database. Needs window functions:
+        MySQL 8, SQLite 3.25 or any supported Postgres and SQL Server version.
+
+        Arguments:
+            column {string} -- The name of the column.
+
+        Returns:
+            Collection
+        """
+        if not self._limit and not self._offset:
+            return self.get()
+
+        if any(order_by.bindings for order_by in self._order_by):
+            raise InvalidArgument(
+                "A limit per related key cannot order by a raw expression with bindings."
+            )
+
+        state = (self._columns, self._limit, self._offset, self._order_by)
+        limit, offset = int(self._limit or 0), int(self._offset or 0)
+
+        grammar = self.get_grammar()
+        partition = grammar._table_column_string(column)
+        row_number = grammar.row_number_string().format(
+            partition=partition,
+            order_by=grammar.process_order_by()
+            or grammar.order_by_string().format(order_columns=partition),
+            alias="m_row_number",
+        )
+
+        conditions = [f"m_row_number > {offset}"]
+        if limit:
+            conditions.append(f"m_row_number <= {offset + limit}")
+
+        try:
+            if not self._columns:
+                self.select(f"{self.get_table_name()}.*")
+
+            self._limit = self._offset = False
+            self._order_by = ()
+            query = self.select_raw(row_number).to_qmark()
+        finally:
+            self._columns, self._limit, self._offset, self._order_by = state
+
+        result = self.new_connection().query(
+            grammar.limit_per_partition_string().format(
+                query=query,
+                table="m_partitioned",
+                conditions=" AND ".join(conditions),
+                row_number="m_row_number",
+            ),
+            self._bindings,
+        )
+
+        for row in result or []:
+            row.pop("m_row_number", None)
 
         return self.prepare_result(result, collection=True)
 
-    def new_connection(self):
-        if self._connection:
+    def get_where_in_batch_size(self, batch_size=None):
+        """Gets the number of values a single WHERE IN statement can hold next to the
+        bindings the query already has.
+
+        Keyword Arguments:
+            batch_size {int} -- A maximum requested by the caller. (default: {None})
+
+        Returns:
+            int
+        """
+        # The global scopes add their bindings when the query runs. They run on a copy,
+        # and compiling it resets its subqueries, so the expressions are copied too.
+        builder = copy(self)
+        for attribute in ("_columns", "_wheres", "_having", "_joins", "_aggregates"):
+            setattr(builder, attribute, deepcopy(getattr(self, attribute)))
+        builder._apply_join_eagers().run_scopes()
+
+        grammar = builder.get_grammar()
+        limit = grammar.max_where_in_parameters or grammar.max_bulk_parameters
+        if batch_size:
+            limit = min(limit, batch_size)
+
+        grammar.compile(builder._action, qmark=True)
+
+        return max(1, limit - len(grammar._bindings))
+
+    def new_connection(self, read=None):
+        """Gets the connection the query runs on, creating it if needed.
+
+        Keyword Arguments:
+            read {bool} -- Whether the query only reads. Guessed from the action of the
+                    builder when omitted: selects without a lock read. (default: {None})
+
+        Returns:
+            masoniteorm.connections.BaseConnection
+        """
+        if read is None:
+            read = self._action == "select" and not self.lock
+
+        details = self._connection_details.get(self.connection, {})
+        if not read:
+            ReplicaRouter.record_write(self.connection, details)
+
+        # A closed connection is routed again so reads and writes of the same builder
+        # each reach a host of their group
+        if self._connection and (
+            self._connection.open or not ReplicaRouter.splits(details)
+        ):
             return self._connection
 
         self._connection = (
             self.connection_class(
-                **self.get_connection_information(), name=self.connection
+                **self.get_connection_information(read=read), name=self.connection
             )
             .set_schema(self._schema)
             .make_connection()
@@ -2015,10 +2866,166 @@ class QueryBuilder(ObservesEvents):
         self._should_eager = False
         return self
 
-    def with_(self, *eagers):
-        self._eager_relation.register(eagers)
+    def with_(self, *eagers, strategy="query"):
+        """Eager loads relationships.
+
+        Arguments:
+            eagers {string|list|dict} -- The relationships, nested with dots or given a callback in a dictionary.
+
+        Keyword Arguments:
+            strategy {string} -- "query" loads each relationship with its own query once the
+                                 models are loaded. "join" loads belongs to relationships keyed on
+                                 the related primary key in the same query through a LEFT JOIN,
+                                 selecting the related columns under a "<relationship>__" prefix.
+                                 Columns of the parent table should then be qualified in wheres
+                                 and orders. (default: {"query"})
+
+        Returns:
+            self
+        """
+        if strategy == "query":
+            self._eager_relation.register(eagers)
+            return self
+
+        if strategy != "join":
+            raise InvalidArgument(
+                f"Relationships are eager loaded with a 'query' or 'join' strategy, not '{strategy}'."
+            )
+
+        names = []
+        for eager in eagers:
+            names += list(eager) if isinstance(eager, (list, tuple)) else [eager]
+
+        for eager in names:
+            if not isinstance(eager, str) or "." in eager:
+                raise InvalidArgument(
+                    "The join strategy only eager loads relationships given by name."
+                )
+
+            related = getattr(self._model, eager)
+            # Joining on anything but the related primary key can match several rows per parent
+            if (
+                not related.joins_eagerly
+                or related.foreign_key
+                != related.get_builder()._model.get_primary_key()
+            ):
+                raise InvalidArgument(
+                    f"'{eager}' cannot be eager loaded with a join, only belongs to relationships keyed on the related primary key can."
+                )
+
+            if related.get_builder().get_table_name() == self.get_table_name():
+                raise InvalidArgument(
+                    f"'{eager}' relates the '{self.get_table_name()}' table to itself and cannot be eager loaded with a join."
+                )
+
+            self._join_eagers += (eager,)
+
+        return self
+
+    def _apply_join_eagers(self):
+        """Adds the LEFT JOIN and the prefixed related columns of the relationships eager
+        loaded with the join strategy to a select query.
+
+        A table the query already joins, for example through another relationship eager
+        loaded with a join, is joined again under the "__<relationship>" alias.
+        """
+        if (
+            not self._join_eagers
+            or self._join_eagers_applied
+            or self._action != "select"
+            or self._aggregates
+        ):
+            return self
+
+        self._columns = tuple(
+            column for column in self._columns if column not in self._join_eager_columns
+        )
+        if not self._columns:
+            self.select(f"{self.get_table_name()}.*")
+
+        columns = self._columns
+        joined = {
+            join.alias or join.table
+            for join in self._joins
+            if isinstance(join, JoinClause)
+        }
+        for eager in self._join_eagers:
+            related = getattr(self._model, eager)
+            related_table = related.get_builder().get_table_name()
+            alias = f"__{eager}" if related_table in joined else None
+            related.joins(self, clause="left", alias=alias)
+            joined.add(alias or related_table)
+
+            for column in self._get_join_eager_table_columns(related.get_builder()):
+                self.select(f"{alias or related_table}.{column} as {eager}__{column}")
+
+        self._join_eager_columns = self._columns[len(columns) :]
+        self._join_eagers_applied = True
+
         return self
 
+    def _get_join_eager_table_columns(self, builder):
+        model = builder._model
+        if model and model.__selects__:
+            return [select.split(" as ")[-1].strip() for select in model.__selects__]
+
+        key = (builder.connection, builder.get_table_name())
+        if key not in self._join_eager_table_columns:
+            self._join_eager_table_columns[key] = list(builder.get_table_columns())
+
+        return self._join_eager_table_columns[key]
+
+    def _split_join_eagers(self, result):
+        """Splits the prefixed columns of join eager loads out of each row.
+
+        Returns:
+            tuple -- The rows without the prefixed columns and, for each row, the related rows by relationship.
+        """
+        rows = result if isinstance(result, (list, tuple)) else [result]
+        parents, related_rows = [], []
+        for row in rows:
+            row = dict(row)
+            related = {}
+            for eager in self._join_eagers:
+                prefix = f"{eager}__"
+                related[eager] = {
+                    column[len(prefix) :]: row.pop(column)
+                    for column in list(row)
+                    if column.startswith(prefix)
+                }
+            parents.append(row)
+            related_rows.append(related)
+
+        if isinstance(result, (list, tuple)):
+            return parents, related_rows
+
+        return parents[0], related_rows
+
+    def _register_join_eagers(self, hydrated_model, related_rows, identity_map=None):
+        models = (
+            hydrated_model
+            if isinstance(hydrated_model, Collection)
+            else [hydrated_model]
+        )
+
+        for model, related in zip(models, related_rows):
+            for eager, row in related.items():
+                related_model = None
+                if any(value is not None for value in row.values()):
+                    related_class = getattr(self._model, eager).get_builder()._model
+                    related_class = (
+                        related_class
+                        if inspect.isclass(related_class)
+                        else related_class.__class__
+                    )
+                    related_model = (
+                        identity_map.hydrate(related_class, row)
+                        if identity_map
+                        else related_class.hydrate(row)
+                    )
+
+                model.add_relation({eager: related_model})
+
     def paginate(self, per_page, page=1):
         if page == 1:
             offset = 0
@@ -2046,6 +3053,119 @@ class QueryBuilder(ObservesEvents):
         paginator = SimplePaginator(result, per_page, page)
         return paginator
 
+    def cursor_paginate(self, per_page, cursor=None):
+        """Paginates the query by seeking past a cursor instead of skipping an offset.
+
+        Records are ordered by the order by columns of the query followed by the primary key,
+        which breaks ties between equal values. Every page costs the same regardless of its depth
+        and no COUNT query is issued.
+
+        Arguments:
+            per_page {int} -- The number of records per page.
+
+        Keyword Arguments:
+            cursor {string} -- A next or previous cursor from a previous page. (default: {None})
+
+        Raises:
+            InvalidArgument: Raised when seeking on a raw order by or when the cursor is invalid.
+
+        Returns:
+            CursorPaginator
+        """
+        primary_key = self._model.get_primary_key() if self._model else "id"
+
+        orders = []
+        for order_by in self._order_by:
+            if order_by.raw:
+                raise InvalidArgument("Cursor pagination cannot seek on a raw order by.")
+            orders.append((order_by.column, order_by.direction.upper()))
+
+        if not any(column.split(".")[-1] == primary_key for column, _ in orders):
+            orders.append((primary_key, orders[-1][1] if orders else "ASC"))
+
+        direction = "next"
+        if cursor:
+            values, direction = CursorPaginator.decode_cursor(cursor)
+            if len(values) != len(orders):
+                raise InvalidArgument(
+                    "The pagination cursor does not match the order of the query."
+                )
+            self.where(self._seek_cursor(orders, values, direction))
+
+        self._order_by = tuple(
+            OrderByExpression(
+                column,
+                direction=order
+                if direction == "next"
+                else ("DESC" if order == "ASC" else "ASC"),
+            )
+            for column, order in orders
+        )
+
+        result = self.limit(per_page + 1).get()
+        records = list(result)
+        has_more = len(records) > per_page
+        records = records[:per_page]
+        if direction == "prev":
+            records.reverse()
+
+        next_cursor = previous_cursor = None
+        if records:
+            first, last = records[0], records[-1]
+            if (direction == "next" and has_more) or direction == "prev":
+                next_cursor = CursorPaginator.encode_cursor(
+                    self._cursor_values(last, orders), "next"
+                )
+            if (direction == "prev" and has_more) or (direction == "next" and cursor):
+                previous_cursor = CursorPaginator.encode_cursor(
+                    self._cursor_values(first, orders), "prev"
+                )
+
+        return CursorPaginator(
+            result.__class__(records), per_page, next_cursor, previous_cursor
+        )
+
+    def _seek_cursor(self, orders, values, direction):
+        """Builds the where group seeking past the cursor values:
+        (a > ?) OR (a = ? AND b > ?) OR ...
+        """
+
+        def seek(query):
+            for index, (column, order) in enumerate(orders):
+                operator = ">" if (order == "ASC") == (direction == "next") else "<"
+
+                def group(q, index=index, column=column, operator=operator):
+                    for (equal_column, _), value in zip(orders[:index], values):
+                        q.where(equal_column, "=", value)
+                    return q.where(column, operator, values[index])
+
+                if index:
+                    query.or_where(group)
+                else:
+                    query.where(group)
+
+            return query
+
+        return seek
+
+    def _cursor_values(self, record, orders):
+        """Gets the seek values of a record as they are stored, so they compare equal to the
+        stored values of the tied records.
+        """
+        values = []
+        for column, _ in orders:
+            column = column.split(".")[-1]
+            if not hasattr(record, "get_raw_attribute"):
+                values.append(record[column])
+                continue
+
+            value = record.get_raw_attribute(column)
+            if value and column in record.get_date_columns():
+                # Dates are hydrated into pendulum instances
+                value = record.get_new_datetime_string(value)
+            values.append(value)
+        return values
+
     def set_action(self, action):
         """Sets the action that the query builder should take when the query is built.
 
@@ -2082,6 +3202,8 @@ class QueryBuilder(ObservesEvents):
             lock=self.lock,
             joins=self._joins,
             having=self._having,
+            unique_by=self._unique_by,
+            upsert_columns=self._upsert_columns,
         )
 
     def to_sql(self):
@@ -2091,7 +3213,7 @@ class QueryBuilder(ObservesEvents):
             self
         """
 
-        self.run_scopes()
+        self._apply_join_eagers().run_scopes()
         grammar = self.get_grammar()
         sql = grammar.compile(self._action, qmark=False).to_sql()
         return sql
@@ -2119,16 +3241,184 @@ class QueryBuilder(ObservesEvents):
             self
         """
 
-        self.run_scopes()
-        grammar = self.get_grammar()
-        sql = grammar.compile(self._action, qmark=True).to_sql()
+        self._apply_join_eagers().run_scopes()
 
-        self._bindings = grammar._bindings
+        cache = self._compiled_query_cache
+        key, bindings = cache.fingerprint(self)
+        sql = cache.get(key) if key else None
+
+        if sql is None:
+            grammar = self.get_grammar()
+            sql = grammar.compile(self._action, qmark=True).to_sql()
+            bindings = grammar._bindings
+            if key:
+                cache.put(key, sql)
+
+        self._bindings = bindings
 
         self.reset()
 
         return sql
 
+    @classmethod
+    def get_compiled_query_cache(cls):
+        """Gets the cache of compiled qmark statements shared by every query builder.
+
+        Returns:
+            masoniteorm.query.CompiledQueryCache
+        """
+        return cls._compiled_query_cache
+
+    @classmethod
+    def get_result_cache(cls):
+        """Gets the cache storing the results of the queries run with remember.
+
+        Returns:
+            masoniteorm.cache.ResultCache
+        """
+        return QueryBuilder._result_cache
+
+    @classmethod
+    def set_result_cache(cls, cache):
+        """Sets the cache storing the results of the queries run with remember, shared by
+        every query builder.
+
+        Arguments:
+            cache {masoniteorm.cache.ResultCache} -- A MemoryResultCache, a SQLiteResultCache
+                    or any other ResultCache.
+        """
+        QueryBuilder._result_cache = cache
+
+    def remember(self, ttl=None, key=None, tags=None):
+        """Caches the rows returned by the select of this builder. The rows are keyed by
+        the compiled SQL and its bindings unless a key is given.
+
+        Results are tagged with the tables of the query, its joins and its subqueries.
+        Creates, updates, deletes and bulk statements run on one of those tables through
+        a query builder on the same connection forget them, including the results of
+        queries running at the same time. Queries reading tables through raw SQL
+        subqueries can only be remembered with explicit tags.
+
+        Keyword Arguments:
+            ttl {int|float} -- Seconds the rows are kept for. None keeps them until they
+                    are evicted or invalidated. (default: {None})
+            key {string} -- The cache key. (default: {None})
+            tags {list} -- More tags to forget the result with. (default: {None})
+
+        Returns:
+            self
+        """
+        self._remember = {"ttl": ttl, "key": key, "tags": tuple(tags or ())}
+        return self
+
+    def _run_select(self, results="*"):
+        """Runs the select query, through the result cache when remember was called.
+        Results read inside a transaction are never stored.
+        """
+        if not self._remember:
+            connection = self.new_connection()
+            if results == "*":
+                return connection.query(self.to_qmark(), self._bindings)
+            return connection.query(self.to_qmark(), self._bindings, results=results)
+
+        cache = self.get_result_cache()
+        key, tags, sql = self._remembered_query(cache, results)
+
+        result = cache.get(key, ResultCache.MISSING)
+        if result is not ResultCache.MISSING:
+            return result
+
+        # Rows read while a write forgets one of the tags are not stored
+        generations = cache.get_generations(tags)
+        connection = self.new_connection()
+        result = connection.query(sql, self._bindings, results=results)
+        if connection.get_transaction_level() <= 0:
+            cache.put(
+                key,
+                result,
+                ttl=self._remember["ttl"],
+                tags=tags,
+                generations=generations,
+            )
+
+        return result
+
+    def _remembered_query(self, cache, results):
+        """Compiles the select query and gets its cache key and tags.
+
+        Returns:
+            tuple -- The key, the tags and the qmark SQL.
+        """
+        self._apply_join_eagers()
+
+        tables, raw_subquery = self._get_read_tables()
+        if raw_subquery and not self._remember["tags"]:
+            raise InvalidArgument(
+                "The tables read by a raw SQL subquery are unknown. Pass the tags to forget the result with to remember()."
+            )
+
+        tags = self._remember["tags"] + tuple(
+            dict.fromkeys(
+                ResultCache.table_tag(self.connection, table) for table in tables
+            )
+        )
+
+        sql = self.to_qmark()
+        key = self._remember["key"] or cache.make_key(
+            self.connection, sql, self._bindings, results
+        )
+
+        return key, tags, sql
+
+    def _get_read_tables(self):
+        """Gets the tables a select query reads from: its table, its joins and the tables
+        of its subqueries.
+
+        Returns:
+            tuple -- The table names and whether raw SQL reads from a subquery.
+        """
+        select = re.compile(r"\bselect\b", re.IGNORECASE)
+        tables, raw_subquery = [], False
+
+        if self._table:
+            raw_subquery = bool(self._table.raw and select.search(self._table.name))
+            tables.append(self._table.name.split(" as ")[0])
+
+        for join in self._joins:
+            table = getattr(join, "table", None)
+            if isinstance(table, str):
+                raw_subquery = raw_subquery or bool(select.search(table))
+                tables.append(table.split(" as ")[0])
+
+        for expression in self._columns + self._wheres + self._having:
+            nested = getattr(expression, "value", None)
+            if nested is None:
+                nested = getattr(expression, "builder", None)
+            if isinstance(nested, (SubSelectExpression, SubGroupExpression)):
+                nested = nested.builder
+
+            if isinstance(nested, QueryBuilder):
+                nested_tables, nested_raw = nested._get_read_tables()
+                tables += nested_tables
+                raw_subquery = raw_subquery or nested_raw
+            elif getattr(expression, "raw", False) or getattr(
+                expression, "equality", None
+            ) in ("EXISTS", "NOT EXISTS"):
+                sql = expression.column if expression.raw else nested
+                raw_subquery = raw_subquery or bool(select.search(str(sql)))
+
+        return tables, raw_subquery
+
+    def _forget_cached_results(self):
+        """Forgets the cached results read from the table of this builder."""
+        if not self._table or self._table.raw:
+            return
+
+        table = self.get_table_name().split(" as ")[0]
+        self.get_result_cache().invalidate_tags(
+            [ResultCache.table_tag(self.connection, table)]
+        )
+
     def new(self):
         """Creates a new QueryBuilder class.
 
@@ -2139,6 +3429,7 @@ class QueryBuilder(ObservesEvents):
             grammar=self.grammar,
             connection_class=self.connection_class,
             connection=self.connection,
+            connection_details=self._connection_details,
             connection_driver=self._connection_driver,
             model=self._model,
         )
@@ -2227,7 +3518,9 @@ class QueryBuilder(ObservesEvents):
         if self.dry:
             return sql
 
-        return self.new_connection().query(sql, ())
+        result = self.new_connection(read=False).query(sql, ())
+        self._forget_cached_results()
+        return result
 
     def exists(self):
         """Determine if rows exist for the current query.
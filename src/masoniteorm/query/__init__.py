@@ -1 +1,2 @@
 from .QueryBuilder import QueryBuilder
+from .AsyncQueryBuilder import AsyncQueryBuilder
@@ -20,6 +20,20 @@ class BaseGrammar:
 
     table = "users"
 
+    # Bulk inserts are split into batches holding at most this many bound parameters
+    # and, when set, at most max_bulk_rows rows per VALUES clause.
+    max_bulk_parameters = 65535
+    max_bulk_rows = None
+
+    # Eager loads split their keys into WHERE IN batches of at most this many
+    # parameters. Falls back to max_bulk_parameters when not set.
+    max_where_in_parameters = None
+
+    # Bulk inserts can read back the keys they generate when the database returns the
+    # inserted rows or reports the first key it generated. Without it, rows whose keys
+    # are needed are inserted one at a time.
+    bulk_insert_returns_ids = False
+
     def __init__(
         self,
         columns=(),
@@ -37,6 +51,8 @@ class BaseGrammar:
         lock=False,
         having=(),
         connection_details=None,
+        unique_by=(),
+        upsert_columns=(),
     ):
         self._columns = columns
         self.table = table
@@ -53,6 +69,8 @@ class BaseGrammar:
         self._having = having
         self.lock = lock
         self._connection_details = connection_details or {}
+        self._unique_by = unique_by
+        self._upsert_columns = upsert_columns
         self._column = None
 
         self._bindings = []
@@ -164,39 +182,160 @@ class BaseGrammar:
         )
         return self
 
+    def _compile_bulk_create_returning(self, qmark=False):
+        """Compiles an insert expression returning the inserted rows.
+
+        Returns:
+            self
+        """
+        self._compile_bulk_create(qmark=qmark)
+        self._sql = self.bulk_insert_returning_format().format(insert=self._sql)
+        return self
+
+    def bulk_insert_returning_format(self):
+        return "{insert}"
+
+    def _compile_upsert(self, qmark=False):
+        """Compiles an insert expression that updates the rows that already exist.
+
+        Returns:
+            self
+        """
+        columns = list(self._columns[0].keys())
+        updates = self._upsert_columns
+
+        # Without columns to update, conflicting rows are left untouched
+        upsert_format = self.upsert_format() if updates else self.upsert_ignore_format()
+
+        self._sql = upsert_format.format(
+            table=self.process_table(self.table),
+            columns=self.columnize_bulk_columns(columns),
+            values=self.columnize_bulk_values(
+                [list(x.values()) for x in self._columns], qmark=qmark
+            ),
+            unique_by=self.columnize_bulk_columns(self._unique_by),
+            conflicts=self.columnize_upsert(
+                self._unique_by, self.upsert_conflict_string(), " AND "
+            ),
+            updates=self.columnize_upsert(updates, self.upsert_update_string()),
+            unchanged=self.columnize_upsert(self._unique_by, "{column} = {column}"),
+            source_columns=self.columnize_upsert(
+                columns, self.upsert_source_column_string()
+            ),
+        )
+        return self
+
+    def _compile_bulk_update(self, qmark=False):
+        """Compiles an update of many rows, each with its own values, using a CASE
+        expression on the key column per updated column.
+
+        Returns:
+            self
+        """
+        key = self._unique_by[0]
+        key_column = self.column_string().format(column=key, separator="")
+
+        if qmark:
+            self.add_binding(*self.get_bulk_bindings("bulk_update"))
+
+        cases = []
+        for column in self._upsert_columns:
+            whens = " ".join(
+                self.bulk_update_when_string().format(
+                    key=self._bulk_value(row[key], qmark),
+                    value=self._bulk_value(row[column], qmark),
+                )
+                for row in self._columns
+            )
+            cases.append(
+                self.bulk_update_case_string().format(
+                    column=self.column_string().format(column=column, separator=""),
+                    key=key_column,
+                    whens=whens,
+                )
+            )
+
+        self._sql = self.bulk_update_format().format(
+            table=self.process_table(self.table),
+            cases=", ".join(cases),
+            key=key_column,
+            keys=", ".join(self._bulk_value(row[key], qmark) for row in self._columns),
+        )
+        return self
+
+    def bulk_update_format(self):
+        return "UPDATE {table} SET {cases} WHERE {key} IN ({keys})"
+
+    def bulk_update_case_string(self):
+        return "{column} = CASE {key} {whens} END"
+
+    def bulk_update_when_string(self):
+        return "WHEN {key} THEN {value}"
+
+    def _bulk_value(self, value, qmark=False):
+        if qmark:
+            return "'?'"
+        return self.value_string().format(value=value, separator="")
+
+    def get_bulk_bindings(self, action):
+        """Gets the bindings of a bulk statement in the order its placeholders are compiled.
+
+        Arguments:
+            action {string} -- The bulk action (bulk_create, upsert or bulk_update).
+
+        Returns:
+            list
+        """
+        if action == "bulk_update":
+            key = self._unique_by[0]
+            bindings = []
+            for column in self._upsert_columns:
+                for row in self._columns:
+                    bindings += [row[key], row[column]]
+            bindings += [row[key] for row in self._columns]
+            return bindings
+
+        return [value for row in self._columns for value in row.values()]
+
+    def columnize_upsert(self, columns, template, separator=", "):
+        return separator.join(
+            template.format(
+                column=self.column_string().format(column=column, separator="")
+            )
+            for column in columns
+        )
+
     def columnize_bulk_columns(self, columns=[]):
         return ", ".join(
             self.column_string().format(column=x, separator="") for x in columns
         ).rstrip(",")
 
     def columnize_bulk_values(self, columns=[], qmark=False):
-        sql = ""
+        rows = []
         for x in columns:
-            inner = ""
             if isinstance(x, list):
-                for y in x:
-                    if qmark:
-                        self.add_binding(y)
-                    inner += (
-                        "'?', "
-                        if qmark
-                        else self.value_string().format(value=y, separator=", ")
-                    )
+                if qmark:
+                    self.add_binding(*x)
+                    inner = ", ".join(["'?'"] * len(x))
+                else:
+                    inner = "".join(
+                        self.value_string().format(value=y, separator=", ")
+                        for y in x
+                    ).rstrip(", ")
 
-                inner = inner.rstrip(", ")
-                sql += self.process_value_string().format(value=inner, separator=", ")
+                rows.append(
+                    self.process_value_string().format(value=inner, separator="")
+                )
             else:
                 if qmark:
                     self.add_binding(x)
-                sql += (
-                    "'?', "
+                rows.append(
+                    "'?'"
                     if qmark
-                    else self.process_value_string().format(
-                        value="?" if qmark else x, separator=", "
-                    )
+                    else self.process_value_string().format(value=x, separator="")
                 )
 
-        return sql.rstrip(", ")
+        return ", ".join(rows)
 
     def process_value_string(self):
         return "({value}){separator}"
@@ -968,6 +1107,17 @@ class BaseGrammar:
             f"'{self.__class__.__name__}' does not support truncating"
         )
 
+    def where_any_string(self):
+        """The syntax matching a column against a list bound as a single array
+        parameter, or None when the grammar cannot bind arrays."""
+        return None
+
+    def row_number_string(self):
+        return "ROW_NUMBER() OVER (PARTITION BY {partition} {order_by}) AS {alias}"
+
+    def limit_per_partition_string(self):
+        return "SELECT * FROM ({query}) AS {table} WHERE {conditions} ORDER BY {row_number}"
+
     def where_regexp_string(self):
         return "{keyword} {column} REGEXP {value}"
 
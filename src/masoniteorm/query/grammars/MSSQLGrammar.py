@@ -4,6 +4,10 @@ from .BaseGrammar import BaseGrammar
 class MSSQLGrammar(BaseGrammar):
     """Microsoft SQL Server grammar class."""
 
+    # SQL Server accepts 2100 parameters and 1000 rows per VALUES clause
+    max_bulk_parameters = 2000
+    max_bulk_rows = 1000
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -47,6 +51,28 @@ class MSSQLGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def upsert_format(self):
+        return (
+            "MERGE INTO {table} AS [target] USING (VALUES {values}) AS [source] ({columns}) "
+            "ON {conflicts} WHEN MATCHED THEN UPDATE SET {updates} "
+            "WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({source_columns});"
+        )
+
+    def upsert_ignore_format(self):
+        return (
+            "MERGE INTO {table} AS [target] USING (VALUES {values}) AS [source] ({columns}) "
+            "ON {conflicts} WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({source_columns});"
+        )
+
+    def upsert_update_string(self):
+        return "[target].{column} = [source].{column}"
+
+    def upsert_conflict_string(self):
+        return "[target].{column} = [source].{column}"
+
+    def upsert_source_column_string(self):
+        return "[source].{column}"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -4,6 +4,10 @@ from .BaseGrammar import BaseGrammar
 class MySQLGrammar(BaseGrammar):
     """MySQL grammar class."""
 
+    # Very long IN lists make the range optimizer give up and scan the table
+    max_where_in_parameters = 10000
+
+    # The connection reports the first key generated by a multi row insert
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -63,6 +67,21 @@ class MySQLGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON DUPLICATE KEY UPDATE {updates}"
+
+    def upsert_ignore_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON DUPLICATE KEY UPDATE {unchanged}"
+
+    def upsert_update_string(self):
+        return "{column} = VALUES({column})"
+
+    def upsert_conflict_string(self):
+        return "{column}"
+
+    def upsert_source_column_string(self):
+        return "{column}"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -5,6 +5,8 @@ import re
 class PostgresGrammar(BaseGrammar):
     """Postgres grammar class."""
 
+    bulk_insert_returns_ids = True
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -48,6 +50,62 @@ class PostgresGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values} RETURNING *"
 
+    def bulk_update_format(self):
+        return "UPDATE {table} SET {updates} FROM (SELECT {columns} FROM {table} WHERE false UNION ALL VALUES {values}) AS {alias} WHERE {table}.{key} = {alias}.{key}"
+
+    def _compile_bulk_update(self, qmark=False):
+        """Compiles an update of many rows by joining the table on a VALUES list.
+
+        The VALUES list is unioned with an empty select of the updated columns, so its
+        columns take the types of the table columns instead of resolving to text.
+
+        Returns:
+            self
+        """
+        key = self._unique_by[0]
+        columns = [key] + list(self._upsert_columns)
+        alias = self.column_string().format(column="bulk_update", separator="")
+
+        self._sql = self.bulk_update_format().format(
+            table=self.process_table(self.table),
+            updates=self.columnize_upsert(
+                self._upsert_columns, "{column} = " + alias + ".{column}"
+            ),
+            values=self.columnize_bulk_values(
+                [[row[column] for column in columns] for row in self._columns],
+                qmark=qmark,
+            ),
+            alias=alias,
+            columns=self.columnize_bulk_columns(columns),
+            key=self.column_string().format(column=key, separator=""),
+        )
+        return self
+
+    def get_bulk_bindings(self, action):
+        if action == "bulk_update":
+            columns = [self._unique_by[0]] + list(self._upsert_columns)
+            return [row[column] for row in self._columns for column in columns]
+
+        return super().get_bulk_bindings(action)
+
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON CONFLICT ({unique_by}) DO UPDATE SET {updates}"
+
+    def upsert_ignore_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON CONFLICT ({unique_by}) DO NOTHING"
+
+    def upsert_update_string(self):
+        return "{column} = EXCLUDED.{column}"
+
+    def upsert_conflict_string(self):
+        return "{column}"
+
+    def upsert_source_column_string(self):
+        return "{column}"
+
+    def where_any_string(self):
+        return "{column} = ANY('?')"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -1,10 +1,17 @@
 from .BaseGrammar import BaseGrammar
 import re
+import sqlite3
 
 
 class SQLiteGrammar(BaseGrammar):
     """SQLite grammar class."""
 
+    # SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32
+    max_bulk_parameters = 999
+
+    # RETURNING is supported since SQLite 3.35
+    bulk_insert_returns_ids = sqlite3.sqlite_version_info >= (3, 35, 0)
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -48,6 +55,24 @@ class SQLiteGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def bulk_insert_returning_format(self):
+        return "{insert} RETURNING *"
+
+    def upsert_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON CONFLICT ({unique_by}) DO UPDATE SET {updates}"
+
+    def upsert_ignore_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} ON CONFLICT ({unique_by}) DO NOTHING"
+
+    def upsert_update_string(self):
+        return "{column} = excluded.{column}"
+
+    def upsert_conflict_string(self):
+        return "{column}"
+
+    def upsert_source_column_string(self):
+        return "{column}"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
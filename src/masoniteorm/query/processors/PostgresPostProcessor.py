@@ -26,6 +26,24 @@ class PostgresPostProcessor:
 
         return results
 
+    def process_bulk_insert_get_ids(self, builder, results, creates, id_key):
+        """Sets the keys generated by a bulk insert on the rows that were inserted.
+
+        Args:
+            builder (masoniteorm.builder.QueryBuilder): The query builder class
+            results (list): The rows returned by the insert, in the order they were inserted.
+            creates (list): The dictionaries of the rows that were inserted.
+            id_key (string): The key to set the primary key to. This is usually the primary key of the table.
+
+        Returns:
+            list: Should return the modified dictionaries.
+        """
+
+        for create, row in zip(creates, results or []):
+            create.setdefault(id_key, row[id_key])
+
+        return creates
+
     def get_column_value(self, builder, column, results, id_key, id_value):
         """Gets the specific column value from a table. Typically done after an update to
         refetch the new value of a field.
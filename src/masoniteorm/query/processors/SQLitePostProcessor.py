@@ -27,6 +27,35 @@ class SQLitePostProcessor:
 
         return results
 
+    def process_bulk_insert_get_ids(self, builder, results, creates, id_key):
+        """Sets the keys generated by a bulk insert on the rows that were inserted.
+
+        SQLite returns the rows in an arbitrary order, so they are matched on the key. The
+        rows given a key keep it and the generated keys, which increase in the order the
+        rows were inserted, are set on the other rows in that order.
+
+        Args:
+            builder (masoniteorm.builder.QueryBuilder): The query builder class
+            results (list): The rows returned by the insert.
+            creates (list): The dictionaries of the rows that were inserted.
+            id_key (string): The key to set the primary key to. This is usually the primary key of the table.
+
+        Returns:
+            list: Should return the modified dictionaries.
+        """
+
+        given = {create[id_key] for create in creates if id_key in create}
+        generated = iter(
+            sorted(row[id_key] for row in results or [] if row[id_key] not in given)
+        )
+
+        for create, key in zip(
+            [create for create in creates if id_key not in create], generated
+        ):
+            create[id_key] = key
+
+        return creates
+
     def get_column_value(self, builder, column, results, id_key, id_value):
         """Gets the specific column value from a table. Typically done after an update to
         refetch the new value of a field.
@@ -1,7 +1,19 @@
+from copy import deepcopy
+
 from ..collection import Collection
+from ..models.IdentityMap import IdentityMap
+from ..models.LazyLoading import BatchLazyLoading, LazyLoadDetector
+from .LazyCollection import LazyCollection
 
 
 class BaseRelationship:
+    # Belongs to relationships can be eager loaded with a LEFT JOIN, see QueryBuilder.with_
+    joins_eagerly = False
+    # To-many relationships are accessed through a LazyCollection
+    loads_many = False
+    # Attaching a record waiting in a unit of work is left to the unit of work
+    attaches_pending = False
+
     def __init__(self, fn, local_key=None, foreign_key=None):
         if isinstance(fn, str):
             self.fn = None
@@ -52,23 +64,149 @@ class BaseRelationship:
             object -- Either returns a builder or a hydrated model.
         """
         attribute = self.fn.__name__
-        relationship = self.fn(instance)()
+        if instance.is_loaded() and attribute in instance._relationships:
+            return instance._relationships[attribute]
+
         self.set_keys(instance, attribute)
-        self._related_builder = relationship.builder
+        self._related_builder = builder = self.make_related_builder(instance)
 
         if instance.is_loaded():
-            if attribute in instance._relationships:
-                return instance._relationships[attribute]
-
-            result = self.apply_query(self._related_builder, instance)
-            return result
+            return self.lazy_related(
+                instance, attribute, lambda: self.apply_query(builder, instance)
+            )
         else:
             return self
 
+    def make_related_builder(self, instance):
+        """Makes a query builder for the related model.
+
+        The related model is made once per relationship. Every access gets a new builder
+        copied from the builder of that model instead of making a new related model.
+
+        Arguments:
+            instance {masoniteorm.models.Model} -- The model the relationship is accessed on.
+
+        Returns:
+            masoniteorm.query.QueryBuilder
+        """
+        prototype = self.__dict__.get("_related_prototype")
+        if prototype is None:
+            prototype = self._related_prototype = self.fn(instance)().get_builder()
+
+        builder = prototype.new()
+        builder._scopes = prototype._scopes
+        builder.dry = prototype.dry
+        # Macros and global scopes are changed per builder, for example by with_trashed
+        builder._macros = deepcopy(prototype._macros)
+        builder._global_scopes = {
+            action: dict(scopes)
+            for action, scopes in prototype._global_scopes.items()
+        }
+
+        return builder.select(*prototype._model.get_selects())
+
     def __getattr__(self, attribute):
         relationship = self.fn(self)()
         return getattr(relationship.builder, attribute)
 
+    def lazy_related(self, instance, attribute, query):
+        """Gets the related records of a loaded model that were not eager loaded.
+
+        To-many relationships return a LazyCollection that runs the query on first use,
+        and answers count() and exists() with an aggregate query until then. Other
+        relationships are loaded right away.
+
+        Arguments:
+            instance {masoniteorm.models.Model} -- The model the relationship is accessed on.
+            attribute {string} -- The name of the relationship.
+            query {callable} -- Loads the relationship of the instance alone.
+
+        Returns:
+            Model|Collection|None
+        """
+        if not self.loads_many:
+            return self.lazy_load(instance, attribute, query)
+
+        return LazyCollection(
+            query=lambda: self.lazy_load(instance, attribute, query),
+            aggregate=lambda aggregate: self.get_related_aggregate(instance, aggregate),
+        )
+
+    def get_related_aggregate(self, instance, aggregate):
+        """Counts the related records of a model, or checks if it has any, without loading them.
+
+        Arguments:
+            instance {masoniteorm.models.Model} -- The model the relationship is accessed on.
+            aggregate {string} -- "count" or "exists".
+
+        Returns:
+            int|bool
+        """
+        builder = instance.get_builder()
+        query = builder._new_aggregate_query()
+        related_table, related_key, parent_key = self.get_aggregate_query(
+            query, builder, join_related=False
+        )
+        query.where(related_key, getattr(instance, parent_key))
+
+        # Count what loading the relationship would return, soft deleted records aside
+        if query.get_table_name() == related_table:
+            query._global_scopes = {"select": self.get_related_select_scopes(instance)}
+
+        if aggregate == "exists":
+            return query.select_raw("1").limit(1).first() is not None
+
+        query.aggregate("COUNT", "*", alias="m_aggregate_reserved")
+        return (query.first() or {}).get("m_aggregate_reserved") or 0
+
+    def get_related_select_scopes(self, instance):
+        """Gets the global scopes the related model applies to its select queries.
+
+        Arguments:
+            instance {masoniteorm.models.Model} -- The model the relationship is accessed on.
+
+        Returns:
+            dict
+        """
+        return self.make_related_builder(instance)._global_scopes.get("select", {})
+
+    def lazy_load(self, instance, attribute, query):
+        """Lazily loads the relationship of a loaded model.
+
+        The load is counted by the active LazyLoadDetector. With batch lazy loading on, the
+        relationship is loaded in one query for every model hydrated in the same collection
+        as the instance and registered on each of them.
+
+        Arguments:
+            instance {masoniteorm.models.Model} -- The model the relationship is accessed on.
+            attribute {string} -- The name of the relationship.
+            query {callable} -- Loads the relationship of the instance alone.
+
+        Returns:
+            Model|Collection|None
+        """
+        detector = LazyLoadDetector.current()
+        if detector:
+            detector.record(instance, attribute)
+
+        siblings = instance.get_siblings()
+        if not siblings or len(siblings) < 2 or not BatchLazyLoading.enabled(instance):
+            return query()
+
+        models = Collection(
+            [
+                model
+                for model in siblings
+                if model is instance or attribute not in model._relationships
+            ]
+        )
+        related = self.get_related(instance.get_builder(), models)
+        index = self.map_related(related or Collection())
+        for model in models:
+            self.register_related(attribute, model, index)
+
+        return instance._relationships.get(attribute)
+
     def apply_query(self, foreign, owner, foreign_key, local_key):
         """Apply the query and return a dictionary to be hydrated
 
@@ -95,14 +233,14 @@ class BaseRelationship:
         )
         return query
 
-    def joins(self, builder, clause=None):
+    def joins(self, builder, clause=None, alias=None):
         other_table = self.get_builder().get_table_name()
         local_table = builder.get_table_name()
         return builder.join(
-            other_table,
+            f"{other_table} as {alias}" if alias else other_table,
             f"{local_table}.{self.local_key}",
             "=",
-            f"{other_table}.{self.foreign_key}",
+            f"{alias or other_table}.{self.foreign_key}",
             clause=clause,
         )
 
@@ -138,6 +276,49 @@ class BaseRelationship:
 
         return return_query
 
+    def get_aggregate_query(self, query, builder, join_related=True):
+        """Points an aggregate query at the related records of this relationship.
+
+        Arguments:
+            query {masoniteorm.query.QueryBuilder} -- The aggregate query.
+            builder {masoniteorm.query.QueryBuilder} -- The query builder of the parent models.
+
+        Keyword Arguments:
+            join_related {bool} -- Whether a relationship going through a pivot or intermediate
+                                   table needs the related table joined. (default: {True})
+
+        Returns:
+            tuple -- The related table, the related column holding the parent key and the parent column it matches.
+        """
+        related_table = self.get_builder().get_table_name()
+        query.table(related_table)
+
+        return related_table, f"{related_table}.{self.foreign_key}", self.local_key
+
+    def get_aggregate_alias(self, attribute, aggregate, column="*"):
+        """Gets the attribute an aggregate of this relationship is loaded into.
+
+        Arguments:
+            attribute {string} -- The name of the relationship.
+            aggregate {string} -- The aggregate: count, sum, avg, min, max or exists.
+
+        Keyword Arguments:
+            column {string} -- The aggregated column. (default: {"*"})
+
+        Returns:
+            string
+        """
+        if aggregate == "count":
+            return self.get_count_alias(attribute)
+
+        if aggregate == "exists" or column == "*":
+            return f"{attribute}_{aggregate}"
+
+        return f"{attribute}_{aggregate}_{column.split('.')[-1]}"
+
+    def get_count_alias(self, attribute):
+        return f"{self.get_builder().get_table_name()}_count"
+
     def attach(self, current_model, related_record):
         return related_record.update(
             {self.foreign_key: getattr(current_model, self.local_key)}
@@ -150,10 +331,10 @@ class BaseRelationship:
         if callback:
             callback(builder)
         if isinstance(relation, Collection):
-            return builder.where_in(
+            return builder.get_where_in(
                 f"{builder.get_table_name()}.{self.foreign_key}",
                 Collection(relation._get_value(self.local_key)).unique(),
-            ).get()
+            )
         else:
             return builder.where(
                 f"{builder.get_table_name()}.{self.foreign_key}",
@@ -196,3 +377,49 @@ class BaseRelationship:
 
     def map_related(self, related_result):
         return related_result
+
+    def get_related_by_keys(self, builder, column, keys):
+        """Runs an eager load query for a list of keys of the related table.
+
+        When the keys are primary keys, the builder is not constrained and an identity map
+        is active, the models already in the map are reused and only the missing keys
+        are fetched.
+
+        Arguments:
+            builder {masoniteorm.query.QueryBuilder} -- The related builder.
+            column {string} -- The related column the keys belong to.
+            keys {list} -- The keys to load.
+
+        Returns:
+            Collection
+        """
+        identity_map = IdentityMap.current()
+        if (
+            identity_map is None
+            or not builder._model
+            or column.split(".")[-1] != builder.get_primary_key()
+            or builder._wheres
+            or builder._columns
+            or builder._joins
+            or builder._order_by
+            or builder._limit
+            or builder._eager_relation.get_eagers()
+        ):
+            return builder.get_where_in(column, keys)
+
+        model_class = builder._model
+        if not isinstance(model_class, type):
+            model_class = model_class.__class__
+
+        related, missing = [], []
+        for key in keys:
+            model = identity_map.get(model_class, key)
+            if model is None:
+                missing.append(key)
+            else:
+                related.append(model)
+
+        if missing:
+            related += builder.get_where_in(column, missing).all()
+
+        return model_class.new_collection(related)
@@ -1,10 +1,14 @@
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..collection import Collection
 
 
 class BelongsTo(BaseRelationship):
     """Belongs To Relationship Class."""
 
+    joins_eagerly = True
+    attaches_pending = True
+
     def __init__(self, fn, local_key=None, foreign_key=None):
         if isinstance(fn, str):
             self.fn = None
@@ -51,10 +55,11 @@ class BelongsTo(BaseRelationship):
             callback(builder)
 
         if isinstance(relation, Collection):
-            return builder.where_in(
+            return self.get_related_by_keys(
+                builder,
                 f"{builder.get_table_name()}.{self.foreign_key}",
                 Collection(relation._get_value(self.local_key)).unique(),
-            ).get()
+            )
 
         else:
             return builder.where(
@@ -62,10 +67,29 @@ class BelongsTo(BaseRelationship):
                 getattr(relation, self.local_key),
             ).first()
 
-    def register_related(self, key, model, collection):
-        related = collection.get(getattr(model, self.local_key), None)
+    def attach(self, current_model, related_record):
+        """Points the current model at the related record and saves it.
+
+        A related record waiting in a unit of work has no key yet. It is remembered on the
+        current model and the unit of work sets the key once it inserted the record.
 
-        model.add_relation({key: related[0] if related else None})
+        Arguments:
+            current_model {masoniteorm.models.Model} -- The model holding the foreign key.
+            related_record {masoniteorm.models.Model} -- The record it belongs to.
+
+        Returns:
+            masoniteorm.models.Model
+        """
+        key = related_record.get_raw_attribute(self.foreign_key)
+        if key is None:
+            current_model.add_relation({self.fn.__name__: related_record})
+        else:
+            setattr(current_model, self.local_key, key)
+
+        return current_model.save()
+
+    def register_related(self, key, model, collection):
+        model.add_relation({key: collection.one(getattr(model, self.local_key))})
 
     def map_related(self, related_result):
-        return related_result.group_by(self.foreign_key)
+        return RelatedIndex(related_result, self.foreign_key)
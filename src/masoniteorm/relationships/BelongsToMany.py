@@ -1,5 +1,9 @@
+from contextlib import contextmanager
+
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..collection import Collection
+from ..config import load_config
 from inflection import singularize
 from ..models.Pivot import Pivot
 import pendulum
@@ -8,6 +12,8 @@ import pendulum
 class BelongsToMany(BaseRelationship):
     """Has Many Relationship Class."""
 
+    loads_many = True
+
     def __init__(
         self,
         fn=None,
@@ -235,10 +241,10 @@ class BelongsToMany(BaseRelationship):
             callback(result)
 
         if isinstance(relation, Collection):
-            return result.where_in(
+            return result.get_where_in(
                 self.local_owner_key,
                 Collection(relation._get_value(self.local_owner_key)).unique(),
-            ).get()
+            )
         else:
             return result.where(
                 self.local_owner_key, getattr(relation, self.local_owner_key)
@@ -351,12 +357,13 @@ class BelongsToMany(BaseRelationship):
     def register_related(self, key, model, collection):
         model.add_relation(
             {
-                key: collection.where(
-                    f"{self._table}_id", getattr(model, self.local_owner_key)
-                )
+                key: collection.many(getattr(model, self.local_owner_key))
             }
         )
 
+    def map_related(self, related_result):
+        return RelatedIndex(related_result, f"{self._table}_id")
+
     def joins(self, builder, clause=None):
         if not self._table:
             pivot_tables = [
@@ -501,6 +508,23 @@ class BelongsToMany(BaseRelationship):
 
         return return_query
 
+    def get_aggregate_query(self, query, builder, join_related=True):
+        related_table = self.get_builder().get_table_name()
+        self._table = self._table or self.get_pivot_table_name(
+            self.get_builder(), builder
+        )
+
+        query.table(self._table)
+        if join_related:
+            query.join(
+                related_table,
+                f"{related_table}.{self.other_owner_key}",
+                "=",
+                f"{self._table}.{self.foreign_key}",
+            )
+
+        return related_table, f"{self._table}.{self.local_key}", self.local_owner_key
+
     def attach(self, current_model, related_record):
         data = {
             self.local_key: getattr(current_model, self.local_owner_key),
@@ -544,6 +568,162 @@ class BelongsToMany(BaseRelationship):
             .delete()
         )
 
+    def attach_many(self, current_model, related_records, extra=None):
+        """Attaches many related records with a single bulk insert.
+
+        Records that are already attached are skipped, found with one select on the
+        pivot table. Everything runs in a transaction.
+
+        Arguments:
+            current_model {masoniteorm.models.Model} -- The model the records are attached to.
+            related_records {list|Collection} -- Related models or their keys.
+
+        Keyword Arguments:
+            extra {dict} -- Extra pivot columns set on every inserted row. (default: {None})
+
+        Returns:
+            list -- The keys that were attached.
+        """
+        with self._pivot_transaction(current_model):
+            keys = self._get_related_keys(related_records)
+            attached = self._get_attached_keys(current_model, keys)
+            keys = [key for key in keys if str(key) not in attached]
+            self._insert_pivot_rows(current_model, keys, extra)
+
+        return keys
+
+    def detach_many(self, current_model, related_records=None):
+        """Detaches many related records with a single delete.
+
+        Arguments:
+            current_model {masoniteorm.models.Model} -- The model the records are detached from.
+
+        Keyword Arguments:
+            related_records {list|Collection} -- Related models or their keys. Every related
+                                                 record is detached when None. (default: {None})
+
+        Returns:
+            list -- The keys that were detached.
+        """
+        with self._pivot_transaction(current_model):
+            if related_records is None:
+                keys = list(self._get_attached_keys(current_model).values())
+            else:
+                keys = self._get_related_keys(related_records)
+
+            self._delete_pivot_rows(current_model, keys)
+
+        return keys
+
+    def sync(self, current_model, related_records, extra=None):
+        """Makes the given records the only records attached to a model.
+
+        The pivot keys are diffed with one select, the missing records are attached with
+        one bulk insert and the others are detached with one delete, in a transaction.
+
+        Arguments:
+            current_model {masoniteorm.models.Model} -- The model the records are synced on.
+            related_records {list|Collection} -- Related models or their keys.
+
+        Keyword Arguments:
+            extra {dict} -- Extra pivot columns set on every inserted row. (default: {None})
+
+        Returns:
+            dict -- The keys that were "attached" and "detached".
+        """
+        with self._pivot_transaction(current_model):
+            keys = self._get_related_keys(related_records)
+            attached = self._get_attached_keys(current_model)
+            wanted = {str(key) for key in keys}
+
+            attach = [key for key in keys if str(key) not in attached]
+            detach = [key for name, key in attached.items() if name not in wanted]
+
+            self._insert_pivot_rows(current_model, attach, extra)
+            self._delete_pivot_rows(current_model, detach)
+
+        return {"attached": attach, "detached": detach}
+
+    @contextmanager
+    def _pivot_transaction(self, current_model):
+        builder = current_model.get_builder()
+        self._table = self._table or self.get_pivot_table_name(
+            self.get_builder(), builder
+        )
+
+        DB = load_config(builder.config_path).DB
+        if builder.connection in DB.get_global_connections():
+            # Join the transaction that is already open on this connection
+            yield
+            return
+
+        with DB.transaction(builder.connection):
+            yield
+
+    def _pivot_builder(self, current_model):
+        return (
+            Pivot.on(current_model.get_builder().connection)
+            .table(self._table)
+            .without_global_scopes()
+        )
+
+    def _get_related_keys(self, related_records):
+        keys = {}
+        for record in related_records:
+            if not isinstance(record, (str, int)):
+                record = getattr(record, self.other_owner_key)
+
+            keys.setdefault(str(record), record)
+
+        return list(keys.values())
+
+    def _get_attached_keys(self, current_model, keys=None):
+        builder = self._pivot_builder(current_model).where(
+            self.local_key, getattr(current_model, self.local_owner_key)
+        )
+        if keys is not None:
+            if not keys:
+                return {}
+
+            # Split into batches under the parameter limit of the grammar
+            rows = builder.select(self.foreign_key).get_where_in(self.foreign_key, keys)
+        else:
+            rows = builder.select(self.foreign_key).get()
+
+        return {str(key): key for key in rows.pluck(self.foreign_key)}
+
+    def _insert_pivot_rows(self, current_model, keys, extra=None):
+        if not keys:
+            return
+
+        row = dict(extra or {})
+        row[self.local_key] = getattr(current_model, self.local_owner_key)
+        if self.with_timestamps:
+            now = pendulum.now().to_datetime_string()
+            row.update({"created_at": now, "updated_at": now})
+
+        self._pivot_builder(current_model).bulk_create(
+            [{**row, self.foreign_key: key} for key in keys],
+            ignore_mass_assignment=True,
+        )
+
+    def _delete_pivot_rows(self, current_model, keys):
+        if not keys:
+            return
+
+        keys = list(keys)
+        local_key = getattr(current_model, self.local_owner_key)
+        size = (
+            self._pivot_builder(current_model)
+            .where(self.local_key, local_key)
+            .get_where_in_batch_size()
+        )
+
+        for offset in range(0, len(keys), size):
+            self._pivot_builder(current_model).where(self.local_key, local_key).where_in(
+                self.foreign_key, keys[offset : offset + size]
+            ).delete()
+
     def attach_related(self, current_model, related_record):
         data = {
             self.local_key: getattr(current_model, self.local_owner_key),
@@ -1,10 +1,13 @@
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..collection import Collection
 
 
 class HasMany(BaseRelationship):
     """Has Many Relationship Class."""
 
+    loads_many = True
+
     def apply_query(self, foreign, owner):
         """Apply the query and return a dictionary to be hydrated
 
@@ -28,8 +31,8 @@ class HasMany(BaseRelationship):
 
     def register_related(self, key, model, collection):
         model.add_relation(
-            {key: collection.get(getattr(model, self.local_key)) or Collection()}
+            {key: collection.many(getattr(model, self.local_key))}
         )
 
     def map_related(self, related_result):
-        return related_result.group_by(self.foreign_key)
+        return RelatedIndex(related_result, self.foreign_key)
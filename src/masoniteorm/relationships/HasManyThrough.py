@@ -1,10 +1,13 @@
 from ..collection import Collection
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 
 
 class HasManyThrough(BaseRelationship):
     """HasManyThrough Relationship Class."""
 
+    loads_many = True
+
     def __init__(
         self,
         fn=None,
@@ -46,21 +49,24 @@ class HasManyThrough(BaseRelationship):
             object -- Either returns a builder or a hydrated model.
         """
         attribute = self.fn.__name__
+        if instance.is_loaded() and attribute in instance._relationships:
+            return instance._relationships[attribute]
+
         self.attribute = attribute
         relationship1 = self.fn(self)[0]()
         relationship2 = self.fn(self)[1]()
-        self.distant_builder = relationship1.builder
-        self.intermediary_builder = relationship2.builder
+        self.distant_builder = distant_builder = relationship1.builder
+        self.intermediary_builder = intermediary_builder = relationship2.builder
         self.set_keys(self.distant_builder, self.intermediary_builder, attribute)
 
         if instance.is_loaded():
-            if attribute in instance._relationships:
-                return instance._relationships[attribute]
-
-            result = self.apply_related_query(
-                self.distant_builder, self.intermediary_builder, instance
+            return self.lazy_related(
+                instance,
+                attribute,
+                lambda: self.apply_related_query(
+                    distant_builder, intermediary_builder, instance
+                ),
             )
-            return result
         else:
             return self
 
@@ -84,7 +90,7 @@ class HasManyThrough(BaseRelationship):
         intermediate_table = intermediary_builder.get_table_name()
 
         return (
-            self.distant_builder.select(
+            distant_builder.select(
                 f"{distant_table}.*, {intermediate_table}.{self.local_key}"
             )
             .join(
@@ -131,9 +137,7 @@ class HasManyThrough(BaseRelationship):
         Returns
             None
         """
-        related = collection.get(getattr(model, self.local_owner_key), None)
-        if related and not isinstance(related, Collection):
-            related = Collection(related)
+        related = collection.many(getattr(model, self.local_owner_key))
 
         model.add_relation({key: related if related else None})
 
@@ -170,10 +174,10 @@ class HasManyThrough(BaseRelationship):
         )
 
         if isinstance(relation, Collection):
-            return self.distant_builder.where_in(
+            return self.distant_builder.get_where_in(
                 f"{intermediate_table}.{self.local_key}",
                 Collection(relation._get_value(self.local_owner_key)).unique(),
-            ).get()
+            )
         else:
             return self.distant_builder.where(
                 f"{intermediate_table}.{self.local_key}",
@@ -266,5 +270,28 @@ class HasManyThrough(BaseRelationship):
 
         return return_query
 
+    def get_aggregate_query(self, query, builder, join_related=True):
+        distant_table = self.distant_builder.get_table_name()
+        intermediate_table = self.intermediary_builder.get_table_name()
+
+        query.table(distant_table).join(
+            intermediate_table,
+            f"{intermediate_table}.{self.foreign_key}",
+            "=",
+            f"{distant_table}.{self.other_owner_key}",
+        )
+
+        return (
+            distant_table,
+            f"{intermediate_table}.{self.local_key}",
+            self.local_owner_key,
+        )
+
+    def get_related_select_scopes(self, instance):
+        return dict(self.distant_builder._global_scopes.get("select", {}))
+
+    def get_count_alias(self, attribute):
+        return f"{attribute}_count"
+
     def map_related(self, related_result):
-        return related_result.group_by(self.local_key)
+        return RelatedIndex(related_result, self.local_key)
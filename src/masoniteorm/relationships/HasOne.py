@@ -1,4 +1,5 @@
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..collection import Collection
 
 
@@ -52,10 +53,10 @@ class HasOne(BaseRelationship):
             callback(builder)
 
         if isinstance(relation, Collection):
-            return builder.where_in(
+            return builder.get_where_in(
                 f"{builder.get_table_name()}.{self.foreign_key}",
                 Collection(relation._get_value(self.local_key)).unique(),
-            ).get()
+            )
         else:
             return builder.where(
                 f"{builder.get_table_name()}.{self.foreign_key}",
@@ -63,11 +64,7 @@ class HasOne(BaseRelationship):
             ).first()
 
     def register_related(self, key, model, collection):
-        related = collection.where(
-            self.foreign_key, getattr(model, self.local_key)
-        ).first()
-
-        model.add_relation({key: related or None})
+        model.add_relation({key: collection.one(getattr(model, self.local_key))})
 
     def map_related(self, related_result):
-        return related_result
+        return RelatedIndex(related_result, self.foreign_key)
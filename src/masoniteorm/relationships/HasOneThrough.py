@@ -1,4 +1,5 @@
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..collection import Collection
 
 
@@ -62,8 +63,12 @@ class HasOneThrough(BaseRelationship):
             if attribute in instance._relationships:
                 return instance._relationships[attribute]
 
-            return self.apply_relation_query(
-                self.distant_builder, self.intermediary_builder, instance
+            return self.lazy_load(
+                instance,
+                attribute,
+                lambda: self.apply_relation_query(
+                    self.distant_builder, self.intermediary_builder, instance
+                ),
             )
         else:
             return self
@@ -139,8 +144,7 @@ class HasOneThrough(BaseRelationship):
             None
         """
 
-        related = collection.get(getattr(model, self.local_key), None)
-        model.add_relation({key: related[0] if related else None})
+        model.add_relation({key: collection.one(getattr(model, self.local_key))})
 
     def get_related(self, current_builder, relation, eagers=None, callback=None):
         """
@@ -175,10 +179,10 @@ class HasOneThrough(BaseRelationship):
         )
 
         if isinstance(relation, Collection):
-            return self.distant_builder.where_in(
+            return self.distant_builder.get_where_in(
                 f"{int_table}.{self.local_owner_key}",
                 Collection(relation._get_value(self.local_key)).unique(),
-            ).get()
+            )
         else:
             return self.distant_builder.where(
                 f"{int_table}.{self.local_owner_key}",
@@ -271,5 +275,21 @@ class HasOneThrough(BaseRelationship):
 
         return return_query
 
+    def get_aggregate_query(self, query, builder, join_related=True):
+        dist_table = self.distant_builder.get_table_name()
+        int_table = self.intermediary_builder.get_table_name()
+
+        query.table(dist_table).join(
+            int_table,
+            f"{int_table}.{self.foreign_key}",
+            "=",
+            f"{dist_table}.{self.other_owner_key}",
+        )
+
+        return dist_table, f"{int_table}.{self.local_owner_key}", self.local_key
+
+    def get_count_alias(self, attribute):
+        return f"{attribute}_count"
+
     def map_related(self, related_result):
-        return related_result.group_by(self.local_key)
+        return RelatedIndex(related_result, self.local_key)
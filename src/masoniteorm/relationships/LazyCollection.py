@@ -0,0 +1,59 @@
+from ..collection import Collection
+
+
+class LazyCollection(Collection):
+    """The records of a to-many relationship, queried the first time they are used.
+
+    Iterating, indexing or calling any collection method loads the records. Until then
+    count() and exists() run an aggregate query instead of loading every record.
+    """
+
+    def __init__(self, items=None, query=None, aggregate=None):
+        """LazyCollection initializer
+
+        Keyword Arguments:
+            items {list} -- Records that are already loaded. (default: {None})
+            query {callable} -- Loads the records. (default: {None})
+            aggregate {callable} -- Receives "count" or "exists" and runs it as an aggregate query. (default: {None})
+        """
+        self._query = query
+        self._aggregate = aggregate
+        self._results = None if query else (items or [])
+        self.__appends__ = []
+
+    @property
+    def _items(self):
+        if self._results is None:
+            result = self._query()
+            self._results = result._items if isinstance(result, Collection) else []
+
+        return self._results
+
+    @_items.setter
+    def _items(self, items):
+        self._results = items
+
+    def is_loaded(self):
+        """Checks if the records were queried.
+
+        Returns:
+            bool
+        """
+        return self._results is not None
+
+    def count(self):
+        if self.is_loaded() or not self._aggregate:
+            return super().count()
+
+        return self._aggregate("count")
+
+    def exists(self):
+        """Checks if the relationship has any record.
+
+        Returns:
+            bool
+        """
+        if self.is_loaded() or not self._aggregate:
+            return not self.is_empty()
+
+        return self._aggregate("exists")
@@ -1,9 +1,12 @@
 from ..collection import Collection
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..config import load_config
 
 
 class MorphMany(BaseRelationship):
+    loads_many = True
+
     def __init__(self, fn, morph_key="record_type", morph_id="record_id"):
         if isinstance(fn, str):
             self.fn = None
@@ -35,17 +38,17 @@ class MorphMany(BaseRelationship):
             object -- Either returns a builder or a hydrated model.
         """
         attribute = self.fn.__name__
-        self._related_builder = instance.builder
+        if instance.is_loaded() and attribute in instance._relationships:
+            return instance._relationships[attribute]
+
+        self._related_builder = builder = instance.builder
         self.polymorphic_builder = self.fn(self)()
         self.set_keys(owner, self.fn)
 
         if instance.is_loaded():
-            if attribute in instance._relationships:
-                return instance._relationships[attribute]
-
-            result = self.apply_query(self._related_builder, instance)
-
-            return result
+            return self.lazy_related(
+                instance, attribute, lambda: self.apply_query(builder, instance)
+            )
         else:
             return self
 
@@ -86,30 +89,18 @@ class MorphMany(BaseRelationship):
 
         if isinstance(relation, Collection):
             record_type = self.get_record_key_lookup(relation.first())
+            builder = self.polymorphic_builder.where(
+                f"{self.polymorphic_builder.get_table_name()}.{self.morph_key}",
+                record_type,
+            )
             if callback:
-                return callback(
-                    self.polymorphic_builder.where(
-                        f"{self.polymorphic_builder.get_table_name()}.{self.morph_key}",
-                        record_type,
-                    ).where_in(
-                        self.morph_id,
-                        relation.pluck(
-                            relation.first().get_primary_key(), keep_nulls=False
-                        ).unique(),
-                    )
-                ).get()
-            return (
-                self.polymorphic_builder.where(
-                    f"{self.polymorphic_builder.get_table_name()}.{self.morph_key}",
-                    record_type,
-                )
-                .where_in(
-                    self.morph_id,
-                    relation.pluck(
-                        relation.first().get_primary_key(), keep_nulls=False
-                    ).unique(),
-                )
-                .get()
+                callback(builder)
+
+            return builder.get_where_in(
+                self.morph_id,
+                relation.pluck(
+                    relation.first().get_primary_key(), keep_nulls=False
+                ).unique(),
             )
 
         else:
@@ -129,12 +120,38 @@ class MorphMany(BaseRelationship):
 
     def register_related(self, key, model, collection):
         record_type = self.get_record_key_lookup(model)
-        related = collection.where(self.morph_key, record_type).where(
-            self.morph_id, model.get_primary_key_value()
-        )
+        related = collection.many((record_type, model.get_primary_key_value()))
 
         model.add_relation({key: related})
 
+    def map_related(self, related_result):
+        return RelatedIndex(
+            related_result,
+            lambda record: (
+                getattr(record, self.morph_key, None),
+                getattr(record, self.morph_id, None),
+            ),
+        )
+
+    def get_with_count_query(self, builder, callback):
+        return builder.with_aggregate(self.fn.__name__, "count", callback=callback)
+
+    def get_aggregate_query(self, query, builder, join_related=True):
+        polymorphic_table = self.polymorphic_builder.get_table_name()
+        query.table(polymorphic_table).where(
+            f"{polymorphic_table}.{self.morph_key}",
+            self.get_record_key_lookup(builder._model),
+        )
+
+        return (
+            polymorphic_table,
+            f"{polymorphic_table}.{self.morph_id}",
+            builder._model.get_primary_key(),
+        )
+
+    def get_count_alias(self, attribute):
+        return f"{attribute}_count"
+
     def morph_map(self):
         return load_config().DB._morph_map
 
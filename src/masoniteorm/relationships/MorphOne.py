@@ -1,6 +1,7 @@
 from ..collection import Collection
 from ..config import load_config
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 
 
 class MorphOne(BaseRelationship):
@@ -43,9 +44,11 @@ class MorphOne(BaseRelationship):
             if attribute in instance._relationships:
                 return instance._relationships[attribute]
 
-            result = self.apply_query(self._related_builder, instance)
-
-            return result
+            return self.lazy_load(
+                instance,
+                attribute,
+                lambda: self.apply_query(self._related_builder, instance),
+            )
         else:
             return self
 
@@ -87,31 +90,18 @@ class MorphOne(BaseRelationship):
 
         if isinstance(relation, Collection):
             record_type = self.get_record_key_lookup(relation.first())
+            builder = self.polymorphic_builder.where(
+                f"{self.polymorphic_builder.get_table_name()}.{self.morph_key}",
+                record_type,
+            )
             if callback:
-                return callback(
-                    self.polymorphic_builder.where(
-                        f"{self.polymorphic_builder.get_table_name()}.{self.morph_key}",
-                        record_type,
-                    ).where_in(
-                        self.morph_id,
-                        relation.pluck(
-                            relation.first().get_primary_key(), keep_nulls=False
-                        ).unique(),
-                    )
-                ).get()
+                callback(builder)
 
-            return (
-                self.polymorphic_builder.where(
-                    f"{self.polymorphic_builder.get_table_name()}.{self.morph_key}",
-                    record_type,
-                )
-                .where_in(
-                    self.morph_id,
-                    relation.pluck(
-                        relation.first().get_primary_key(), keep_nulls=False
-                    ).unique(),
-                )
-                .get()
+            return builder.get_where_in(
+                self.morph_id,
+                relation.pluck(
+                    relation.first().get_primary_key(), keep_nulls=False
+                ).unique(),
             )
 
         else:
@@ -131,14 +121,38 @@ class MorphOne(BaseRelationship):
 
     def register_related(self, key, model, collection):
         record_type = self.get_record_key_lookup(model)
-        related = (
-            collection.where(self.morph_key, record_type)
-            .where(self.morph_id, model.get_primary_key_value())
-            .first()
-        )
+        related = collection.one((record_type, model.get_primary_key_value()))
 
         model.add_relation({key: related})
 
+    def map_related(self, related_result):
+        return RelatedIndex(
+            related_result,
+            lambda record: (
+                getattr(record, self.morph_key, None),
+                getattr(record, self.morph_id, None),
+            ),
+        )
+
+    def get_with_count_query(self, builder, callback):
+        return builder.with_aggregate(self.fn.__name__, "count", callback=callback)
+
+    def get_aggregate_query(self, query, builder, join_related=True):
+        polymorphic_table = self.polymorphic_builder.get_table_name()
+        query.table(polymorphic_table).where(
+            f"{polymorphic_table}.{self.morph_key}",
+            self.get_record_key_lookup(builder._model),
+        )
+
+        return (
+            polymorphic_table,
+            f"{polymorphic_table}.{self.morph_id}",
+            builder._model.get_primary_key(),
+        )
+
+    def get_count_alias(self, attribute):
+        return f"{attribute}_count"
+
     def morph_map(self):
         return load_config().DB._morph_map
 
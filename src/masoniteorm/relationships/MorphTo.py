@@ -1,6 +1,8 @@
 from ..collection import Collection
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..config import load_config
+from ..exceptions import InvalidArgument
 
 
 class MorphTo(BaseRelationship):
@@ -42,9 +44,11 @@ class MorphTo(BaseRelationship):
             if attribute in instance._relationships:
                 return instance._relationships[attribute]
 
-            result = self.apply_query(self._related_builder, instance)
-
-            return result
+            return self.lazy_load(
+                instance,
+                attribute,
+                lambda: self.apply_query(self._related_builder, instance),
+            )
         else:
             return self
 
@@ -84,12 +88,13 @@ class MorphTo(BaseRelationship):
             for group, items in relation.group_by(self.morph_key).items():
                 morphed_model = self.morph_map().get(group)
                 relations.merge(
-                    morphed_model.where_in(
+                    self.get_related_by_keys(
+                        morphed_model.get_builder(),
                         f"{morphed_model.get_table_name()}.{morphed_model.get_primary_key()}",
                         Collection(items)
                         .pluck(self.morph_id, keep_nulls=False)
                         .unique(),
-                    ).get()
+                    )
                 )
             return relations
         else:
@@ -100,9 +105,7 @@ class MorphTo(BaseRelationship):
     def register_related(self, key, model, collection):
         morphed_model = self.morph_map().get(getattr(model, self.morph_key))
 
-        related = collection.where(
-            morphed_model.get_primary_key(), getattr(model, self.morph_id)
-        ).first()
+        related = collection.one((morphed_model, getattr(model, self.morph_id)))
 
         model.add_relation({key: related})
 
@@ -111,6 +114,17 @@ class MorphTo(BaseRelationship):
             "MorphTo relationship does not implement the relate method"
         )
 
+    def get_with_count_query(self, builder, callback):
+        return builder.with_aggregate(self.fn.__name__, "count", callback=callback)
+
+    def get_count_alias(self, attribute):
+        return f"{attribute}_count"
+
+    def get_aggregate_query(self, query, builder, join_related=True):
+        raise InvalidArgument(
+            f"'{self.fn.__name__}' is a morph to relationship. It relates each record to at most one record, so it has no related records to aggregate."
+        )
+
     def query_has(self, related_record, method="where_exists"):
         raise NotImplementedError(
             "MorphTo relationship does not implement the has method"
@@ -135,4 +149,7 @@ class MorphTo(BaseRelationship):
         )
 
     def map_related(self, related_result):
-        return related_result
+        return RelatedIndex(
+            related_result,
+            lambda record: (record.__class__, record.get_primary_key_value()),
+        )
@@ -1,6 +1,8 @@
 from ..collection import Collection
 from .BaseRelationship import BaseRelationship
+from .RelatedIndex import RelatedIndex
 from ..config import load_config
+from ..exceptions import InvalidArgument
 
 
 class MorphToMany(BaseRelationship):
@@ -42,9 +44,11 @@ class MorphToMany(BaseRelationship):
             if attribute in instance._relationships:
                 return instance._relationships[attribute]
 
-            result = self.apply_query(self._related_builder, instance)
-
-            return result
+            return self.lazy_load(
+                instance,
+                attribute,
+                lambda: self.apply_query(self._related_builder, instance),
+            )
         else:
             return self
 
@@ -84,12 +88,12 @@ class MorphToMany(BaseRelationship):
             for group, items in relation.group_by(self.morph_key).items():
                 morphed_model = self.morph_map().get(group)
                 relations.merge(
-                    morphed_model.where_in(
+                    morphed_model.get_builder().get_where_in(
                         f"{morphed_model.get_table_name()}.{morphed_model.get_primary_key()}",
                         Collection(items)
                         .pluck(self.morph_id, keep_nulls=False)
                         .unique(),
-                    ).get()
+                    )
                 )
             return relations
         else:
@@ -100,12 +104,16 @@ class MorphToMany(BaseRelationship):
     def register_related(self, key, model, collection):
         morphed_model = self.morph_map().get(getattr(model, self.morph_key))
 
-        related = collection.where(
-            morphed_model.get_primary_key(), getattr(model, self.morph_id)
-        )
+        related = collection.many((morphed_model, getattr(model, self.morph_id)))
 
         model.add_relation({key: related})
 
+    def map_related(self, related_result):
+        return RelatedIndex(
+            related_result,
+            lambda record: (record.__class__, record.get_primary_key_value()),
+        )
+
     def morph_map(self):
         return load_config().DB._morph_map
 
@@ -119,6 +127,63 @@ class MorphToMany(BaseRelationship):
             "MorphToMany relationship does not implement the attach_related method"
         )
 
+    def get_with_count_query(self, builder, callback):
+        return builder.with_aggregate(self.fn.__name__, "count", callback=callback)
+
+    def get_count_alias(self, attribute):
+        return f"{attribute}_count"
+
+    def get_aggregate_query(self, query, builder, join_related=True):
+        """Aggregates through the morph columns of the parent table, which act as the pivot:
+        a row is related to the record of the table its morph type maps to, when that
+        record exists.
+
+        The related table differs from one row to the next, so only the count and the
+        existence of the related records can be aggregated.
+        """
+        if join_related:
+            raise InvalidArgument(
+                f"'{self.fn.__name__}' relates records of a different table to each record. Only the count and the existence of its related records can be loaded, without a callback."
+            )
+
+        grammar = builder.get_grammar()
+        pivot = "m_morph_pivot"
+        primary_key = builder._model.get_primary_key()
+        query.table(
+            f"{grammar.process_table(builder.get_table_name())} AS {grammar.process_table(pivot)}",
+            raw=True,
+        )
+
+        def related_exists(q):
+            # Raw, so the condition survives the query being compiled more than once
+            morph_id = grammar._table_column_string(f"{pivot}.{self.morph_id}")
+            for morph_type, model in morph_map.items():
+                related_table = model.new_unbooted().get_table_name()
+                related_key = grammar._table_column_string(
+                    f"{related_table}.{model.get_primary_key()}"
+                )
+                q.or_where(
+                    morph_exists(
+                        morph_type,
+                        f"EXISTS (SELECT 1 FROM {grammar.process_table(related_table)} "
+                        f"WHERE {related_key} = {morph_id})",
+                    )
+                )
+            return q
+
+        def morph_exists(morph_type, exists):
+            return lambda q: q.where(f"{pivot}.{self.morph_key}", morph_type).where_raw(
+                exists
+            )
+
+        morph_map = self.morph_map() or {}
+        if morph_map:
+            query.where(related_exists)
+        else:
+            query.where_in(f"{pivot}.{self.morph_key}", [])
+
+        return pivot, f"{pivot}.{primary_key}", primary_key
+
     def query_has(self, related_record, method="where_exists"):
         raise NotImplementedError(
             "MorphMany relationship does not implement the has method"
@@ -0,0 +1,79 @@
+from ..collection import Collection
+
+
+class RelatedIndex:
+    """Eager loaded related records indexed by key.
+
+    The index is built in a single pass over the related result so registering the
+    related records on each parent model is a dictionary lookup instead of a scan of
+    the whole result. Keys are compared the same way Collection.where compares them,
+    so an integer foreign key still matches a string local key.
+    """
+
+    def __init__(self, records, key):
+        """RelatedIndex initializer
+
+        Arguments:
+            records {Collection|list} -- The related records.
+            key {str|callable} -- The attribute to index on, or a callable receiving a record and returning its key.
+        """
+        self._index = {}
+        for record in records:
+            value = key(record) if callable(key) else self._data_get(record, key)
+            if value is None:
+                continue
+
+            self._index.setdefault(self.normalize(value), []).append(record)
+
+    @classmethod
+    def normalize(cls, value):
+        """Normalizes a key so loosely equal values share a bucket.
+
+        Arguments:
+            value {any} -- The key. Tuples are normalized item by item and classes are kept as is.
+
+        Returns:
+            str|tuple|type
+        """
+        if isinstance(value, tuple):
+            return tuple(cls.normalize(item) for item in value)
+
+        if isinstance(value, type):
+            return value
+
+        return str(value)
+
+    def many(self, value):
+        """Gets every related record for a key.
+
+        Arguments:
+            value {any} -- The key.
+
+        Returns:
+            Collection
+        """
+        if value is None:
+            return Collection()
+
+        return Collection(list(self._index.get(self.normalize(value), ())))
+
+    def one(self, value):
+        """Gets the first related record for a key.
+
+        Arguments:
+            value {any} -- The key.
+
+        Returns:
+            Model|None
+        """
+        if value is None:
+            return None
+
+        records = self._index.get(self.normalize(value))
+        return records[0] if records else None
+
+    def _data_get(self, record, key):
+        if isinstance(record, dict):
+            return record.get(key)
+
+        return getattr(record, key, None)
@@ -3,6 +3,7 @@ from .Table import Table
 from .TableDiff import TableDiff
 from ..exceptions import ConnectionNotRegistered
 from ..config import load_config
+from ..connections.ReplicaRouter import ReplicaRouter
 
 
 class Schema:
@@ -185,21 +186,18 @@ class Schema:
         return self._blueprint
 
     def get_connection_information(self):
+        details = ReplicaRouter.route(
+            self.connection, self.connection_details.get(self.connection) or {}
+        )
         return {
-            "host": self.connection_details.get(self.connection, {}).get("host"),
-            "database": self.connection_details.get(self.connection, {}).get(
-                "database"
-            ),
-            "user": self.connection_details.get(self.connection, {}).get("user"),
-            "port": self.connection_details.get(self.connection, {}).get("port"),
-            "password": self.connection_details.get(self.connection, {}).get(
-                "password"
-            ),
-            "prefix": self.connection_details.get(self.connection, {}).get("prefix"),
-            "options": self.connection_details.get(self.connection, {}).get(
-                "options", {}
-            ),
-            "full_details": self.connection_details.get(self.connection),
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
 
     def new_connection(self):
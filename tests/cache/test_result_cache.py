@@ -0,0 +1,155 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.masoniteorm.cache import MemoryResultCache, SQLiteResultCache
+
+
+class ResultCacheTests:
+    def test_stores_copies_of_the_rows(self):
+        rows = [{"id": 1, "name": "Joe"}]
+        self.cache.put("users", rows)
+        rows[0]["name"] = "Bob"
+
+        cached = self.cache.get("users")
+        self.assertEqual(cached, [{"id": 1, "name": "Joe"}])
+        self.assertIsNot(cached, self.cache.get("users"))
+        self.assertEqual(self.cache.get("missing", "default"), "default")
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+    def test_empty_results_are_cached(self):
+        self.cache.put("none", None)
+        self.cache.put("empty", [])
+
+        self.assertIsNone(self.cache.get("none", "default"))
+        self.assertEqual(self.cache.get("empty", "default"), [])
+
+    def test_entries_expire(self):
+        self.cache.put("users", [{"id": 1}], ttl=10)
+
+        with mock.patch(self.clock, return_value=self.now() + 11):
+            self.assertIsNone(self.cache.get("users"))
+
+    def test_tags_invalidate_their_entries(self):
+        self.cache.put("users", [{"id": 1}], tags=["table:dev:users"])
+        self.cache.put(
+            "joined", [{"id": 1}], tags=["table:dev:users", "table:dev:posts"]
+        )
+        self.cache.put("posts", [{"id": 1}], tags=["table:dev:posts"])
+
+        self.assertEqual(self.cache.invalidate_tags(["table:dev:users"]), 2)
+
+        self.assertIsNone(self.cache.get("users"))
+        self.assertIsNone(self.cache.get("joined"))
+        self.assertEqual(self.cache.get("posts"), [{"id": 1}])
+        self.assertEqual(self.cache.invalidate_tags(["table:dev:users"]), 0)
+
+    def test_rows_read_while_a_tag_was_invalidated_are_not_stored(self):
+        generations = self.cache.get_generations(["table:dev:users"])
+        self.cache.invalidate_tags(["table:dev:users"])
+
+        self.assertFalse(
+            self.cache.put(
+                "users", [{"id": 1}], tags=["table:dev:users"], generations=generations
+            )
+        )
+        self.assertIsNone(self.cache.get("users"))
+        self.assertEqual(self.cache.stats()["stores"], 0)
+
+        generations = self.cache.get_generations(["table:dev:users"])
+        self.assertTrue(
+            self.cache.put(
+                "users", [{"id": 1}], tags=["table:dev:users"], generations=generations
+            )
+        )
+        self.assertEqual(self.cache.get("users"), [{"id": 1}])
+
+    def test_is_bounded_by_a_number_of_entries(self):
+        self.cache.max_entries = 2
+        for key in ("a", "b", "c"):
+            self.cache.put(key, [key])
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.get("c"), ["c"])
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+
+class TestMemoryResultCache(ResultCacheTests, unittest.TestCase):
+    clock = "src.masoniteorm.cache.MemoryResultCache.monotonic"
+
+    def setUp(self):
+        self.cache = MemoryResultCache()
+
+    def now(self):
+        from time import monotonic
+
+        return monotonic()
+
+    def test_least_recently_used_entries_are_evicted_first(self):
+        self.cache.max_entries = 2
+        self.cache.put("a", ["a"])
+        self.cache.put("b", ["b"])
+        self.cache.get("a")
+        self.cache.put("c", ["c"])
+
+        self.assertEqual(self.cache.get("a"), ["a"])
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_is_bounded_by_memory(self):
+        self.cache.max_bytes = 600
+        self.cache.put("a", ["x" * 200])
+        self.cache.put("b", ["x" * 200])
+        self.cache.put("c", ["x" * 200])
+        self.cache.put("too large", ["x" * 1000])
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("too large"))
+        self.assertEqual(self.cache.stats()["entries"], 2)
+        self.assertLessEqual(self.cache.stats()["bytes"], 600)
+
+
+class TestSQLiteResultCache(ResultCacheTests, unittest.TestCase):
+    clock = "src.masoniteorm.cache.SQLiteResultCache.time"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.sqlite3")
+        self.cache = SQLiteResultCache(self.path)
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def now(self):
+        from time import time
+
+        return time()
+
+    def test_entries_are_shared_through_the_file(self):
+        self.cache.put("users", [{"id": 1}], tags=["table:dev:users"])
+
+        other = SQLiteResultCache(self.path)
+        try:
+            self.assertEqual(other.get("users"), [{"id": 1}])
+            other.invalidate_tags(["table:dev:users"])
+        finally:
+            other.close()
+
+        self.assertIsNone(self.cache.get("users"))
+
+    def test_invalidations_of_other_processes_keep_rows_from_being_stored(self):
+        generations = self.cache.get_generations(["table:dev:users"])
+
+        other = SQLiteResultCache(self.path)
+        try:
+            other.invalidate_tags(["table:dev:users"])
+        finally:
+            other.close()
+
+        self.cache.put(
+            "users", [{"id": 1}], tags=["table:dev:users"], generations=generations
+        )
+        self.assertIsNone(self.cache.get("users"))
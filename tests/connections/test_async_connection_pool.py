@@ -0,0 +1,133 @@
+import asyncio
+import subprocess
+import sys
+import unittest
+
+from src.masoniteorm.connections import (
+    AsyncConnectionPool,
+    AsyncSQLiteConnection,
+    ConnectionResolver,
+)
+from src.masoniteorm.exceptions import ConnectionPoolTimeout
+
+
+# IsolatedAsyncioTestCase is new in Python 3.8
+AsyncTestCase = getattr(unittest, "IsolatedAsyncioTestCase", unittest.TestCase)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+async def create_connection():
+    return FakeConnection()
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 8), "IsolatedAsyncioTestCase requires Python 3.8"
+)
+class TestAsyncConnectionPool(AsyncTestCase):
+    async def test_acquire_and_release_reuses_connections(self):
+        pool = AsyncConnectionPool(create_connection, max_size=2)
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+
+        self.assertIs(first, second)
+        self.assertEqual(pool.stats()["created"], 1)
+
+    async def test_acquire_times_out_when_pool_is_exhausted(self):
+        pool = AsyncConnectionPool(create_connection, max_size=1, timeout=0.05)
+
+        await pool.acquire()
+
+        with self.assertRaises(ConnectionPoolTimeout):
+            await pool.acquire()
+
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    async def test_waiting_tasks_share_the_pool_without_exceeding_max_size(self):
+        pool = AsyncConnectionPool(create_connection, max_size=3)
+        in_use, peak = 0, 0
+
+        async def borrow():
+            nonlocal in_use, peak
+            connection = await pool.acquire()
+            in_use += 1
+            peak = max(peak, in_use)
+            await asyncio.sleep(0.001)
+            in_use -= 1
+            await pool.release(connection)
+
+        await asyncio.gather(*[borrow() for _ in range(40)])
+        stats = pool.stats()
+
+        self.assertEqual(peak, 3)
+        self.assertEqual(stats["created"], 3)
+        self.assertEqual(stats["acquired"], 40)
+        self.assertEqual(stats["in_use"], 0)
+
+    async def test_invalid_connections_are_discarded_on_borrow(self):
+        async def validator(connection):
+            return False
+
+        pool = AsyncConnectionPool(create_connection, max_size=2, validator=validator)
+        first = await pool.acquire()
+        await pool.release(first)
+
+        second = await pool.acquire()
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertEqual(pool.stats()["validation_failures"], 1)
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 8), "IsolatedAsyncioTestCase requires Python 3.8"
+)
+class TestAsyncPooledConnections(AsyncTestCase):
+    def setUp(self):
+        self.details = {
+            "driver": "sqlite",
+            "database": "orm.sqlite3",
+            "connection_pooling_enabled": True,
+            "connection_pooling_max_size": 2,
+        }
+
+    async def asyncTearDown(self):
+        await ConnectionResolver().close_async_connection_pools()
+
+    def make_connection(self):
+        return AsyncSQLiteConnection(
+            database="orm.sqlite3", full_details=self.details, name="pooled_sqlite"
+        )
+
+    async def test_queries_reuse_the_pooled_connection(self):
+        await self.make_connection().query("SELECT 1 as one")
+        result = await self.make_connection().query("SELECT 1 as one", results=1)
+
+        stats = self.make_connection().get_connection_pool().stats()
+
+        self.assertEqual(result, {"one": 1})
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["acquired"], 2)
+        self.assertEqual(stats["in_use"], 0)
+
+
+class TestAsyncLayerImport(unittest.TestCase):
+    def test_the_async_resolver_is_imported_on_first_use(self):
+        script = (
+            "import sys\n"
+            "from src.masoniteorm.connections import ConnectionResolver\n"
+            "name = 'src.masoniteorm.connections.AsyncConnectionResolver'\n"
+            "assert name not in sys.modules\n"
+            "ConnectionResolver().get_async_resolver()\n"
+            "assert name in sys.modules\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,173 @@
+import threading
+import time
+import unittest
+
+from src.masoniteorm.connections import (
+    ConnectionPool,
+    ConnectionResolver,
+    SQLiteConnection,
+)
+from src.masoniteorm.exceptions import ConnectionPoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_acquire_and_release_reuses_connections(self):
+        pool = ConnectionPool(FakeConnection, max_size=2)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        self.assertIs(first, second)
+        self.assertEqual(pool.stats()["created"], 1)
+
+    def test_min_size_is_created_on_first_acquire(self):
+        pool = ConnectionPool(FakeConnection, min_size=3, max_size=5)
+
+        pool.acquire()
+        stats = pool.stats()
+
+        self.assertEqual(stats["size"], 3)
+        self.assertEqual(stats["idle"], 2)
+        self.assertEqual(stats["in_use"], 1)
+
+    def test_acquire_times_out_when_pool_is_exhausted(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, timeout=0.05)
+
+        pool.acquire()
+
+        with self.assertRaises(ConnectionPoolTimeout):
+            pool.acquire()
+
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_acquire_waits_for_a_released_connection(self):
+        pool = ConnectionPool(FakeConnection, max_size=1, timeout=2)
+        connection = pool.acquire()
+
+        timer = threading.Timer(0.05, pool.release, args=(connection,))
+        timer.start()
+
+        self.assertIs(pool.acquire(), connection)
+        self.assertEqual(pool.stats()["waits"], 1)
+        timer.join()
+
+    def test_invalid_connections_are_discarded_on_borrow(self):
+        pool = ConnectionPool(
+            FakeConnection, validator=lambda connection: not connection.closed
+        )
+        broken = pool.acquire()
+        pool.release(broken)
+        broken.closed = True
+
+        connection = pool.acquire()
+
+        self.assertIsNot(connection, broken)
+        self.assertEqual(pool.stats()["validation_failures"], 1)
+        self.assertEqual(pool.stats()["size"], 1)
+
+    def test_idle_connections_are_evicted_above_min_size(self):
+        pool = ConnectionPool(FakeConnection, min_size=1, max_size=3, max_idle=0.01)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        time.sleep(0.02)
+        pool.prune()
+
+        stats = pool.stats()
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["evicted_idle"], 1)
+
+    def test_connections_are_recycled_after_max_lifetime(self):
+        pool = ConnectionPool(FakeConnection, max_lifetime=0.01)
+        first = pool.acquire()
+
+        time.sleep(0.02)
+        pool.release(first)
+
+        self.assertTrue(first.closed)
+        self.assertIsNot(pool.acquire(), first)
+        self.assertEqual(pool.stats()["recycled"], 1)
+
+    def test_reset_is_called_on_release(self):
+        reset = []
+        pool = ConnectionPool(FakeConnection, reset=reset.append)
+        connection = pool.acquire()
+
+        pool.release(connection)
+
+        self.assertEqual(reset, [connection])
+
+    def test_pool_never_exceeds_max_size_across_threads(self):
+        pool = ConnectionPool(FakeConnection, max_size=3, timeout=5)
+        peak = []
+
+        def work():
+            for _ in range(20):
+                connection = pool.acquire()
+                peak.append(pool.stats()["in_use"])
+                pool.release(connection)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.stats()
+        self.assertLessEqual(max(peak), 3)
+        self.assertLessEqual(stats["created"], 3)
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["acquired"], 160)
+
+
+class TestPooledConnections(unittest.TestCase):
+    def setUp(self):
+        self.details = {
+            "driver": "sqlite",
+            "database": "orm.sqlite3",
+            "connection_pooling_enabled": True,
+            "connection_pooling_max_size": 2,
+        }
+
+    def tearDown(self):
+        ConnectionResolver().close_connection_pools()
+
+    def make_connection(self, name="pooled_sqlite"):
+        return SQLiteConnection(
+            database="orm.sqlite3", full_details=self.details, name=name
+        )
+
+    def test_queries_reuse_the_pooled_connection(self):
+        self.make_connection().query("SELECT 1 as one")
+        self.make_connection().query("SELECT 1 as one")
+
+        pool = self.make_connection().get_connection_pool()
+        stats = pool.stats()
+
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["acquired"], 2)
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_pools_are_keyed_per_connection_name(self):
+        first = self.make_connection("pooled_sqlite").get_connection_pool()
+        second = self.make_connection("other_pooled_sqlite").get_connection_pool()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first, self.make_connection("pooled_sqlite").get_connection_pool())
+
+    def test_in_memory_databases_are_not_pooled(self):
+        connection = SQLiteConnection(
+            database=":memory:", full_details=self.details, name="pooled_sqlite"
+        )
+
+        self.assertIsNone(connection.get_connection_pool())
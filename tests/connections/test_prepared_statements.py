@@ -0,0 +1,221 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import (
+    ConnectionResolver,
+    MSSQLConnection,
+    MySQLConnection,
+    PostgresConnection,
+    PreparedStatementCache,
+)
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class TestPreparedStatementCache(unittest.TestCase):
+    def test_least_recently_used_statements_are_deallocated(self):
+        deallocated = []
+        cache = PreparedStatementCache(
+            name="lru",
+            max_size=2,
+            deallocate=lambda connection, handle: deallocated.append(handle),
+        )
+
+        cache.put("a", "stmt_a")
+        cache.put("b", "stmt_b")
+        self.assertEqual(cache.get("a"), "stmt_a")
+        cache.put("c", "stmt_c")
+
+        self.assertEqual(deallocated, ["stmt_b"])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(
+            cache.stats(),
+            {"hits": 1, "misses": 1, "evictions": 1, "prepared": 2, "max_size": 2},
+        )
+
+    def test_failed_deallocations_are_logged(self):
+        def deallocate(connection, handle):
+            raise RuntimeError("connection lost")
+
+        cache = PreparedStatementCache(name="lost", max_size=1, deallocate=deallocate)
+        cache.put("a", "stmt_a")
+
+        with self.assertLogs("masoniteorm.connection.prepared_statements") as logs:
+            cache.put("b", "stmt_b")
+
+        self.assertIn("stmt_a", logs.output[0])
+        self.assertIsNone(cache.get("a"))
+
+    def test_caches_are_kept_per_physical_connection(self):
+        first, second = object(), object()
+
+        cache = PreparedStatementCache.for_connection(first, name="physical")
+        self.assertIs(PreparedStatementCache.for_connection(first), cache)
+        self.assertIsNot(PreparedStatementCache.for_connection(second), cache)
+
+        PreparedStatementCache.forget(first)
+        PreparedStatementCache.forget(second)
+        self.assertIsNot(PreparedStatementCache.for_connection(first), cache)
+        PreparedStatementCache.forget(first)
+
+
+class TestPostgresPreparedStatements(unittest.TestCase):
+    def setUp(self):
+        self.connection = PostgresConnection(
+            full_details={
+                "prepared_statements": True,
+                "prepared_statements_max_size": 1,
+            }
+        )
+        self.connection._connection = mock.MagicMock()
+        self.connection._cursor = mock.MagicMock()
+
+    def tearDown(self):
+        PreparedStatementCache.forget(self.connection._connection)
+
+    def test_statements_are_prepared_once_per_connection(self):
+        query = 'SELECT * FROM "users" WHERE "id" = %s AND "name" LIKE %s'
+        self.connection.statement(query, (1, "J%"))
+        self.connection.statement(query, (2, "B%"))
+
+        self.assertEqual(
+            self.connection._cursor.execute.call_args_list,
+            [
+                mock.call(
+                    'PREPARE masonite_stmt_1 AS SELECT * FROM "users" '
+                    'WHERE "id" = $1 AND "name" LIKE $2'
+                ),
+                mock.call("EXECUTE masonite_stmt_1 (%s, %s)", (1, "J%")),
+                mock.call("EXECUTE masonite_stmt_1 (%s, %s)", (2, "B%")),
+            ],
+        )
+
+    def test_evicted_statements_are_deallocated(self):
+        self.connection.statement('SELECT * FROM "users"', ())
+        self.connection.statement('SELECT * FROM "posts"', ())
+
+        self.connection._connection.cursor().execute.assert_called_with(
+            "DEALLOCATE masonite_stmt_1"
+        )
+
+    def test_statements_are_deallocated_on_the_physical_connection(self):
+        # With pooling, the statement is evicted by another connection class instance
+        # borrowing the same physical connection after the first one released it.
+        physical = self.connection._connection
+        self.connection.statement('SELECT * FROM "users"', ())
+        self.connection._connection = None
+
+        borrower = PostgresConnection(
+            full_details={
+                "prepared_statements": True,
+                "prepared_statements_max_size": 1,
+            }
+        )
+        borrower._connection = physical
+        borrower._cursor = mock.MagicMock()
+        borrower.statement('SELECT * FROM "posts"', ())
+
+        physical.cursor().execute.assert_called_with("DEALLOCATE masonite_stmt_1")
+        self.assertEqual(borrower.get_prepared_statements().stats()["evictions"], 1)
+        self.connection._connection = physical
+
+    def test_other_statements_are_not_prepared(self):
+        self.connection.statement('CREATE TABLE "users" ("id" INTEGER)', ())
+
+        self.connection._cursor.execute.assert_called_once_with(
+            'CREATE TABLE "users" ("id" INTEGER)', ()
+        )
+
+    def test_literal_percents_are_kept(self):
+        self.assertEqual(
+            PostgresConnection.to_positional("SELECT '100%%' WHERE a = %s AND b = %s"),
+            "SELECT '100%' WHERE a = $1 AND b = $2",
+        )
+
+
+class TestDriversReusingStatements(unittest.TestCase):
+    def test_mssql_keeps_a_cursor_per_query(self):
+        connection = MSSQLConnection(full_details={"prepared_statements": True})
+        connection._connection = mock.MagicMock()
+        connection._cursor = mock.MagicMock()
+        connection._connection.cursor.side_effect = lambda: mock.MagicMock()
+
+        connection.statement("SELECT * FROM [users] WHERE [id] = ?", (1,))
+        first = connection.get_cursor()
+        connection.statement("SELECT * FROM [posts]", ())
+        connection.statement("SELECT * FROM [users] WHERE [id] = ?", (2,))
+
+        self.assertIs(connection.get_cursor(), first)
+        self.assertEqual(first.execute.call_count, 2)
+        PreparedStatementCache.forget(connection._connection)
+
+    def test_mysql_uses_the_text_protocol(self):
+        connection = MySQLConnection(full_details={"prepared_statements": True})
+        connection._connection = mock.MagicMock()
+
+        self.assertFalse(connection.uses_prepared_statements("SELECT 1"))
+
+
+class TestSQLitePreparedStatements(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.details = {
+            **DATABASES,
+            "prepared": {
+                "driver": "sqlite",
+                "database": os.path.join(self.directory.name, "prepared.sqlite3"),
+                "prepared_statements": True,
+                "prepared_statements_max_size": 2,
+                "connection_pooling_enabled": True,
+            },
+        }
+        ConnectionResolver().set_connection_details(self.details)
+        schema = Schema(
+            connection="prepared",
+            connection_details=self.details,
+            platform=SQLitePlatform,
+        ).on("prepared")
+
+        with schema.create_table_if_not_exists("ps_users") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+    def tearDown(self):
+        ConnectionResolver().close_connection_pools()
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.directory.cleanup()
+
+    def get_builder(self):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="prepared",
+            table="ps_users",
+            connection_details=self.details,
+        ).on("prepared")
+
+    def test_statements_are_reused_on_the_physical_connection(self):
+        with mock.patch("sqlite3.connect", wraps=sqlite3.connect) as connect:
+            self.get_builder().create({"name": "Joe"})
+            for user_id in (1, 2, 3):
+                self.get_builder().where("id", user_id).first()
+            self.get_builder().where("name", "Joe").first()
+            self.get_builder().count()
+
+        for call in connect.call_args_list:
+            self.assertEqual(call.kwargs["cached_statements"], 2)
+
+        stats = ConnectionResolver().get_prepared_statement_stats("prepared")
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 4)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["prepared"], 2)
+
+        ConnectionResolver().close_connection_pools()
+        stats = ConnectionResolver().get_prepared_statement_stats("prepared")
+        self.assertEqual(stats["prepared"], 0)
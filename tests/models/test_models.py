@@ -36,6 +36,42 @@ class ModelTestForced(Model):
     __table__ = "users"
     __force_update__ = True
 
+class UpperCast:
+    def get(self, value):
+        return str(value).upper()
+
+    def set(self, value):
+        return str(value).lower()
+
+
+class ModelWithAccessors(Model):
+    __cast_map__ = {"upper": UpperCast}
+    __casts__ = {"code": "upper"}
+
+    def get_name_attribute(self):
+        return self.get_raw_attribute("name").title()
+
+    def set_email_attribute(self, value):
+        return value.strip()
+
+
+class CountingCast:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, value):
+        self.calls += 1
+        return f"{value}:{self.calls}"
+
+    def set(self, value):
+        return value
+
+
+class ModelWithStatefulCast(Model):
+    __cast_map__ = {"counted": CountingCast}
+    __casts__ = {"code": "counted", "is_vip": "bool"}
+
+
 class BaseModel(Model):
     def get_selects(self):
         return [f"{self.get_table_name()}.*"]
@@ -260,6 +296,88 @@ class TestModels(unittest.TestCase):
         delattr(InvalidFillableGuardedModelTest, "__guarded__")
         InvalidFillableGuardedModelTest()
 
+    def test_hydrate_many_defers_booting_until_builder_is_used(self):
+        models = ModelTest.hydrate(
+            [
+                {"id": 1, "due_date": "2020-11-28 11:42:07"},
+                {"id": 2, "due_date": None},
+            ]
+        )
+
+        first = models.first()
+        self.assertNotIn("builder", first.__dict__["__dirty_attributes__"])
+        self.assertFalse(first.is_dirty())
+        self.assertIsInstance(first.due_date, pendulum.now().__class__)
+        self.assertIsNone(models.last().due_date)
+
+        self.assertEqual(
+            first.builder.where("id", 1).to_sql(),
+            """SELECT * FROM `model_tests` WHERE `model_tests`.`id` = '1'""",
+        )
+        self.assertTrue(first._booted)
+
+    def test_hydrated_models_match_booted_models(self):
+        hydrated = ModelTest.hydrate({"id": 1, "username": "joe"})
+        booted = ModelTest()
+        booted.fill({"id": 1, "username": "joe"})
+
+        self.assertEqual(hydrated.serialize(), booted.serialize())
+        self.assertEqual(hydrated.get_builder().to_sql(), booted.get_builder().to_sql())
+
+    def test_model_metadata_is_cached_per_class(self):
+        metadata = ModelWithAccessors.get_metadata()
+
+        self.assertIs(metadata, ModelWithAccessors.get_metadata())
+        self.assertIsNot(metadata, ModelTest.get_metadata())
+        self.assertEqual(metadata.dates, frozenset(["created_at", "updated_at"]))
+        self.assertIn("name", metadata.accessors)
+        self.assertIn("email", metadata.mutators)
+        self.assertEqual(metadata.primary_key, "id")
+
+    def test_model_metadata_is_invalidated_when_class_attributes_change(self):
+        class Invoice(ModelTest):
+            pass
+
+        self.assertIn("due_date", Invoice.get_metadata().dates)
+
+        ModelTest.__dates__ = ["paid_at"]
+        try:
+            self.assertIn("paid_at", Invoice.get_metadata().dates)
+            self.assertNotIn("due_date", ModelTest.get_metadata().dates)
+        finally:
+            ModelTest.__dates__ = ["due_date"]
+
+        self.assertIn("due_date", Invoice.get_metadata().dates)
+
+    def test_model_metadata_resolves_accessors_mutators_and_casts(self):
+        model = ModelWithAccessors.hydrate({"name": "joe smith", "code": "abc"})
+        model.email = " joe@example.com "
+        model.code = "XYZ"
+
+        self.assertEqual(model.name, "Joe Smith")
+        self.assertEqual(model.get_dirty("email"), "joe@example.com")
+        self.assertEqual(model.get_dirty("code"), "xyz")
+        self.assertEqual(model.code, "XYZ")
+        self.assertNotIn("upper", Model.__internal_cast_map__)
+
+    def test_instance_casts_and_dates_override_the_class_metadata(self):
+        model = ModelTest.hydrate({"is_vip": 1, "paid_at": "2020-01-01 10:00:00"})
+        model.__casts__ = {"is_vip": "int"}
+        model.__dates__ = ["paid_at"]
+
+        self.assertEqual(model.is_vip, 1)
+        self.assertIsInstance(model.paid_at, pendulum.DateTime)
+        self.assertEqual(ModelTest.hydrate({"is_vip": 1}).is_vip, True)
+
+    def test_stateful_casters_are_created_per_instance(self):
+        first = ModelWithStatefulCast.hydrate({"code": "a", "is_vip": 1})
+        second = ModelWithStatefulCast.hydrate({"code": "b", "is_vip": 0})
+
+        self.assertEqual(first.code, "a:1")
+        self.assertEqual(first.code, "a:2")
+        self.assertEqual(second.code, "b:1")
+        self.assertIs(first.get_casts()["is_vip"], second.get_casts()["is_vip"])
+
     def test_model_can_provide_default_select(self):
         sql = ModelWithBaseModel.to_sql()
         self.assertEqual(
@@ -0,0 +1,35 @@
+import unittest
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import MSSQLGrammar
+
+
+class TestMSSQLUpsertGrammar(unittest.TestCase):
+    def setUp(self):
+        self.builder = QueryBuilder(MSSQLGrammar, table="products")
+        self.rows = [
+            # These keys are intentionally out of order to show column to value alignment works
+            {"sku": "A1", "name": "Chair", "price": 10},
+            {"price": 12, "sku": "B2", "name": "Desk"},
+        ]
+
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(self.rows, ["sku"], query=True).to_sql()
+
+        sql = """MERGE INTO [products] AS [target] USING (VALUES ('Chair', '10', 'A1'), ('Desk', '12', 'B2')) AS [source] ([name], [price], [sku]) ON [target].[sku] = [source].[sku] WHEN MATCHED THEN UPDATE SET [target].[name] = [source].[name], [target].[price] = [source].[price] WHEN NOT MATCHED THEN INSERT ([name], [price], [sku]) VALUES ([source].[name], [source].[price], [source].[sku]);"""
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_upsert_qmark_with_update_columns(self):
+        to_sql = self.builder.upsert(
+            self.rows, ["sku"], update=["price"], query=True
+        ).to_qmark()
+
+        sql = """MERGE INTO [products] AS [target] USING (VALUES ('?', '?', '?'), ('?', '?', '?')) AS [source] ([name], [price], [sku]) ON [target].[sku] = [source].[sku] WHEN MATCHED THEN UPDATE SET [target].[price] = [source].[price] WHEN NOT MATCHED THEN INSERT ([name], [price], [sku]) VALUES ([source].[name], [source].[price], [source].[sku]);"""
+        self.assertEqual(to_sql, sql)
+        self.assertEqual(self.builder._bindings, ["Chair", 10, "A1", "Desk", 12, "B2"])
+
+    def test_can_compile_upsert_without_updates(self):
+        to_sql = self.builder.upsert(self.rows, "sku", update=[], query=True).to_qmark()
+
+        sql = """MERGE INTO [products] AS [target] USING (VALUES ('?', '?', '?'), ('?', '?', '?')) AS [source] ([name], [price], [sku]) ON [target].[sku] = [source].[sku] WHEN NOT MATCHED THEN INSERT ([name], [price], [sku]) VALUES ([source].[name], [source].[price], [source].[sku]);"""
+        self.assertEqual(to_sql, sql)
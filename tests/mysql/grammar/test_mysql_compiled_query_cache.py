@@ -0,0 +1,94 @@
+import unittest
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.CompiledQueryCache import CompiledQueryCache
+from src.masoniteorm.query.grammars import MySQLGrammar
+
+
+class TestMySQLCompiledQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = QueryBuilder.get_compiled_query_cache()
+        self.max_size = self.cache.max_size
+        self.cache.clear()
+
+    def tearDown(self):
+        self.cache.resize(self.max_size).clear()
+
+    def get_builder(self):
+        return QueryBuilder(grammar=MySQLGrammar, table="users")
+
+    def uncached(self, builder):
+        grammar = builder.get_grammar()
+        sql = grammar.compile(builder._action, qmark=True).to_sql()
+        return sql, list(grammar._bindings)
+
+    def test_same_shape_with_different_bindings_hits_the_cache(self):
+        first = self.get_builder().where("name", "Joe").to_qmark()
+        builder = self.get_builder().where("name", "Bob")
+        second = builder.to_qmark()
+
+        self.assertEqual(first, second)
+        self.assertEqual(builder._bindings, ["Bob"])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_different_shapes_do_not_share_statements(self):
+        self.get_builder().where("name", "Joe").to_qmark()
+        sql = self.get_builder().where("email", "Joe").to_qmark()
+
+        self.assertEqual(sql, "SELECT * FROM `users` WHERE `users`.`email` = '?'")
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+    def test_inlined_values_are_part_of_the_fingerprint(self):
+        self.get_builder().limit(1).to_qmark()
+        sql = self.get_builder().limit(5).to_qmark()
+
+        self.assertEqual(sql, "SELECT * FROM `users` LIMIT 5")
+
+        self.get_builder().where("active", True).to_qmark()
+        sql = self.get_builder().where("active", 1).to_qmark()
+
+        self.assertEqual(sql, "SELECT * FROM `users` WHERE `users`.`active` = '?'")
+
+    def test_cached_statements_match_compiled_statements(self):
+        builders = [
+            lambda b: b.select("username").where("age", ">", 18).order_by("name"),
+            lambda b: b.where_in("id", [1, 2, 3]).or_where("name", "Joe"),
+            lambda b: b.where_between("age", 1, 2).where_null("deleted_at"),
+            lambda b: b.join("profiles", "users.id", "=", "profiles.user_id")
+            .where("profiles.name", "Joe")
+            .limit(10)
+            .offset(5),
+            lambda b: b.where_raw("`age` = ?", [18]).group_by_raw("age"),
+            lambda b: b.where_column("name", "email").where_not_in("id", [4]),
+            lambda b: b.update({"name": "Bob"}, dry=True).where("id", 1),
+            lambda b: b.where("id", 1).delete(query=True),
+        ]
+
+        for make in builders:
+            expected = self.uncached(make(self.get_builder()))
+            for _ in range(2):
+                builder = make(self.get_builder())
+                self.assertEqual(
+                    (builder.to_qmark(), list(builder._bindings)), expected
+                )
+
+        self.assertEqual(self.cache.stats()["hits"], len(builders))
+
+    def test_sub_queries_are_not_cached(self):
+        builder = self.get_builder().where_in(
+            "id", lambda query: query.select("user_id").from_("profiles")
+        )
+
+        self.assertEqual(self.cache.fingerprint(builder), (None, None))
+
+    def test_cache_is_bounded(self):
+        cache = CompiledQueryCache(max_size=2)
+        for column in ("name", "email", "age"):
+            builder = self.get_builder().where(column, "Joe")
+            key, _ = cache.fingerprint(builder)
+            cache.put(key, column)
+
+        builder = self.get_builder().where("name", "Joe")
+        self.assertIsNone(cache.get(cache.fingerprint(builder)[0]))
+        self.assertEqual(cache.stats()["size"], 2)
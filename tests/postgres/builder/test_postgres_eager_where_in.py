@@ -0,0 +1,71 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import PostgresGrammar
+from tests.utils import MockConnectionFactory
+
+
+class TestPostgresEagerWhereIn(unittest.TestCase):
+    def get_builder(self, table="users"):
+        connection = MockConnectionFactory().make("postgres")
+        return QueryBuilder(
+            PostgresGrammar,
+            connection_class=connection,
+            connection="postgres",
+            table=table,
+        )
+
+    def test_keys_are_bound_as_a_single_array(self):
+        builder = self.get_builder().where("active", 1)
+        connection = mock.MagicMock()
+        connection.query.return_value = []
+
+        with mock.patch.object(builder, "new_connection", return_value=connection):
+            builder.get_where_in("users.id", list(range(5000)))
+
+        connection.query.assert_called_once_with(
+            """SELECT * FROM "users" WHERE "users"."active" = '?' AND "users"."id" = ANY('?')""",
+            [1, list(range(5000))],
+        )
+
+    def test_a_single_key_uses_where_in(self):
+        builder = self.get_builder()
+        connection = mock.MagicMock()
+        connection.query.return_value = []
+
+        with mock.patch.object(builder, "new_connection", return_value=connection):
+            builder.get_where_in("id", [1])
+
+        connection.query.assert_called_once_with(
+            """SELECT * FROM "users" WHERE "users"."id" IN ('?')""", [1]
+        )
+
+    def test_keys_that_are_not_integers_use_where_in(self):
+        builder = self.get_builder()
+        connection = mock.MagicMock()
+        connection.query.return_value = []
+        keys = [
+            "0f6c6b52-7d2f-4c4e-9a53-1b3c1c1d3a01",
+            "0f6c6b52-7d2f-4c4e-9a53-1b3c1c1d3a02",
+        ]
+
+        with mock.patch.object(builder, "new_connection", return_value=connection):
+            builder.get_where_in("id", keys)
+
+        connection.query.assert_called_once_with(
+            """SELECT * FROM "users" WHERE "users"."id" IN ('?', '?')""", keys
+        )
+
+    def test_a_limit_applies_to_each_key(self):
+        builder = self.get_builder("posts").order_by("created_at", "desc").limit(3)
+        connection = mock.MagicMock()
+        connection.query.return_value = []
+
+        with mock.patch.object(builder, "new_connection", return_value=connection):
+            builder.get_where_in("posts.user_id", [1, 2])
+
+        connection.query.assert_called_once_with(
+            """SELECT * FROM (SELECT "posts".*, ROW_NUMBER() OVER (PARTITION BY "posts"."user_id" ORDER BY "created_at" DESC) AS m_row_number FROM "posts" WHERE "posts"."user_id" = ANY('?')) AS m_partitioned WHERE m_row_number > 0 AND m_row_number <= 3 ORDER BY m_row_number""",
+            [[1, 2]],
+        )
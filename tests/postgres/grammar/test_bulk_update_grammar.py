@@ -0,0 +1,44 @@
+import unittest
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import PostgresGrammar
+
+
+class TestPostgresBulkUpdateGrammar(unittest.TestCase):
+    def setUp(self):
+        self.builder = QueryBuilder(PostgresGrammar, table="users")
+        self.rows = [
+            {"id": 1, "name": "Joe", "age": 5},
+            {"age": 35, "id": 2, "name": "Bill"},
+        ]
+
+    def test_can_compile_bulk_update(self):
+        to_sql = self.builder.bulk_update(self.rows, query=True).to_sql()
+
+        sql = '''UPDATE "users" SET "name" = "bulk_update"."name", "age" = "bulk_update"."age" FROM (SELECT "id", "name", "age" FROM "users" WHERE false UNION ALL VALUES ('1', 'Joe', '5'), ('2', 'Bill', '35')) AS "bulk_update" WHERE "users"."id" = "bulk_update"."id"'''
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_bulk_update_qmark(self):
+        to_sql = self.builder.bulk_update(
+            self.rows, columns=["age"], query=True
+        ).to_qmark()
+
+        sql = '''UPDATE "users" SET "age" = "bulk_update"."age" FROM (SELECT "id", "age" FROM "users" WHERE false UNION ALL VALUES ('?', '?'), ('?', '?')) AS "bulk_update" WHERE "users"."id" = "bulk_update"."id"'''
+        self.assertEqual(to_sql, sql)
+        self.assertEqual(self.builder._bindings, [1, 5, 2, 35])
+
+    def test_values_take_the_types_of_the_table_columns(self):
+        # Untyped VALUES columns resolve to text, which cannot be assigned to a timestamp
+        to_sql = self.builder.bulk_update(
+            [
+                {"id": 1, "created_at": "2020-01-01 10:00:00"},
+                {"id": 2, "created_at": None},
+            ],
+            query=True,
+        ).to_qmark()
+
+        sql = '''UPDATE "users" SET "created_at" = "bulk_update"."created_at" FROM (SELECT "id", "created_at" FROM "users" WHERE false UNION ALL VALUES ('?', '?'), ('?', '?')) AS "bulk_update" WHERE "users"."id" = "bulk_update"."id"'''
+        self.assertEqual(to_sql, sql)
+        self.assertEqual(
+            self.builder._bindings, [1, "2020-01-01 10:00:00", 2, None]
+        )
@@ -0,0 +1,165 @@
+import asyncio
+import sys
+import unittest
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.exceptions import ModelNotFound
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import has_many
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+# IsolatedAsyncioTestCase is new in Python 3.8
+AsyncTestCase = getattr(unittest, "IsolatedAsyncioTestCase", unittest.TestCase)
+
+
+class Article(Model):
+    __table__ = "aq_articles"
+    __connection__ = "dev"
+    __timestamps__ = False
+    __fillable__ = ["user_id", "title"]
+
+
+class User(Model):
+    __table__ = "aq_users"
+    __connection__ = "dev"
+    __timestamps__ = False
+    __fillable__ = ["name", "age"]
+
+    @has_many("id", "user_id")
+    def articles(self):
+        return Article
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 8), "IsolatedAsyncioTestCase requires Python 3.8"
+)
+class TestSQLiteAsyncQueryBuilder(AsyncTestCase):
+    def setUp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("aq_users") as table:
+            table.increments("id")
+            table.string("name", 50)
+            table.integer("age")
+
+        with self.schema.create_table_if_not_exists("aq_articles") as table:
+            table.increments("id")
+            table.integer("user_id")
+            table.string("title", 50)
+
+        self.get_builder("aq_users").bulk_create(
+            [{"id": 1, "name": "Joe", "age": 20}, {"id": 2, "name": "Bob", "age": 30}]
+        )
+        self.get_builder("aq_articles").bulk_create(
+            [{"user_id": 1, "title": "First"}, {"user_id": 1, "title": "Second"}]
+        )
+
+    def tearDown(self):
+        for table in ["aq_users", "aq_articles"]:
+            self.schema.drop_table_if_exists(table)
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    async def test_select_queries_are_awaited(self):
+        users = await User.async_query().where("age", ">", 10).order_by("id").get()
+        user = await User.async_query().find(2)
+
+        self.assertIsInstance(users, Collection)
+        self.assertEqual(users.pluck("name").all(), ["Joe", "Bob"])
+        self.assertIsInstance(user, User)
+        self.assertEqual(user.name, "Bob")
+        self.assertEqual(await User.async_query().where("age", 30).count(), 1)
+        self.assertTrue(await User.async_query().where("name", "Joe").exists())
+        self.assertIsNone(await User.async_query().find(9))
+
+        with self.assertRaises(ModelNotFound):
+            await User.async_query().find_or_fail(9)
+
+    async def test_the_same_sql_as_the_query_builder_is_run(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            await User.async_query().where("age", 20).first()
+
+        self.assertEqual(
+            logs.records[0].query,
+            'SELECT * FROM "aq_users" WHERE "aq_users"."age" = ? LIMIT 1',
+        )
+
+    async def test_remembered_reads_are_forgotten_by_writes(self):
+        QueryBuilder.get_result_cache().flush()
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            for _ in range(3):
+                self.assertEqual(await User.async_query().remember(60).count(), 2)
+
+        self.assertEqual(len(logs.records), 1)
+
+        await User.async_query().create({"name": "Ann", "age": 40})
+        self.assertEqual(await User.async_query().remember(60).count(), 3)
+
+    async def test_writes(self):
+        user = await User.async_query().create({"name": "Ann", "age": 40})
+        await User.async_query().bulk_create(
+            [{"name": "Tim", "age": 50}, {"name": "Sue", "age": 60}]
+        )
+        await User.async_query().where("name", "Ann").update({"age": 41})
+        await User.async_query().where("name", "Tim").delete()
+
+        self.assertEqual(user.id, 3)
+        self.assertEqual(
+            self.get_builder("aq_users").order_by("id").get().pluck("name").all(),
+            ["Joe", "Bob", "Ann", "Sue"],
+        )
+        self.assertEqual(self.get_builder("aq_users").where("id", 3).first()["age"], 41)
+
+    async def test_eager_loads(self):
+        user = await User.async_query().with_("articles").find(1)
+
+        self.assertEqual(user.articles.pluck("title").all(), ["First", "Second"])
+
+    async def test_transaction_rolls_back(self):
+        with self.assertRaises(RuntimeError):
+            async with ConnectionResolver().async_transaction("dev"):
+                await User.async_query().where("id", 1).delete()
+                self.assertEqual(await User.async_query().count(), 1)
+                raise RuntimeError()
+
+        self.assertEqual(await User.async_query().count(), 2)
+
+        async with ConnectionResolver().async_transaction("dev"):
+            await User.async_query().where("id", 1).delete()
+
+        self.assertEqual(await User.async_query().count(), 1)
+
+    async def test_transactions_are_scoped_to_the_task(self):
+        started = asyncio.Event()
+
+        async def other_task():
+            await started.wait()
+            return ConnectionResolver().get_async_global_connections()
+
+        task = asyncio.create_task(other_task())
+
+        async with ConnectionResolver().async_transaction("dev") as connection:
+            self.assertIs(await User.async_query().new_async_connection(), connection)
+
+            started.set()
+            self.assertNotIn("dev", await task)
+
+        self.assertNotIn("dev", ConnectionResolver().get_async_global_connections())
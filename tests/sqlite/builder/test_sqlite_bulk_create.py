@@ -0,0 +1,79 @@
+import unittest
+
+from src.masoniteorm.exceptions import QueryException
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import MSSQLGrammar, SQLiteGrammar
+from tests.integrations.config.database import DATABASES
+
+
+class TestSQLiteBulkCreate(unittest.TestCase):
+    def get_builder(self, table="users"):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def rows(self, amount, name="bulk"):
+        return [
+            {"name": name, "email": f"{name}{index}@example.com"}
+            for index in range(amount)
+        ]
+
+    def test_batch_size_respects_the_grammar_limits(self):
+        builder = self.get_builder()
+        self.assertEqual(builder.get_bulk_batch_size(2), 499)
+        self.assertEqual(builder.get_bulk_batch_size(2, batch_size=100), 100)
+        self.assertEqual(builder.get_bulk_batch_size(2000), 1)
+
+        builder = QueryBuilder(MSSQLGrammar, table="users")
+        self.assertEqual(builder.get_bulk_batch_size(1), 1000)
+        self.assertEqual(builder.get_bulk_batch_size(4), 500)
+
+    def test_bulk_values_compile_the_same_sql(self):
+        sql = (
+            self.get_builder()
+            .bulk_create(self.rows(3), query=True)
+            .to_qmark()
+        )
+
+        self.assertEqual(
+            sql,
+            """INSERT INTO "users" ("email", "name") VALUES ('?', '?'), ('?', '?'), ('?', '?')""",
+        )
+
+    def test_inserts_more_rows_than_a_statement_can_bind(self):
+        builder = self.get_builder()
+        builder.begin()
+        try:
+            builder.bulk_create(self.rows(1200), transaction=True)
+            result = builder.get_connection().query(
+                "SELECT COUNT(*) AS total FROM users WHERE name = ?", ["bulk"], results=1
+            )
+            self.assertEqual(result["total"], 1200)
+        finally:
+            builder.rollback()
+
+        self.assertEqual(self.get_builder().where("name", "bulk").count(), 0)
+
+    def test_failed_batch_rolls_back_every_batch(self):
+        rows = self.rows(2, name="bulk-rollback") + [{"missing": "column"}]
+
+        with self.assertRaises(QueryException):
+            self.get_builder().bulk_create(rows, batch_size=2, transaction=True)
+
+        self.assertEqual(self.get_builder().where("name", "bulk-rollback").count(), 0)
+
+    def test_batches_without_a_transaction_are_committed_one_by_one(self):
+        rows = self.rows(2, name="bulk-partial") + [{"missing": "column"}]
+
+        try:
+            with self.assertRaises(QueryException):
+                self.get_builder().bulk_create(rows, batch_size=2)
+
+            self.assertEqual(
+                self.get_builder().where("name", "bulk-partial").count(), 2
+            )
+        finally:
+            self.get_builder().where("name", "bulk-partial").delete()
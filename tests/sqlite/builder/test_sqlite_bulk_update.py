@@ -0,0 +1,110 @@
+import unittest
+
+from src.masoniteorm.exceptions import InvalidArgument
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Product(Model):
+    __table__ = "bulk_update_products"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class ProductObserver:
+    def __init__(self):
+        self.events = []
+
+    def bulk_updating(self, products):
+        self.events.append(("bulk_updating", products.count()))
+
+    def bulk_updated(self, products):
+        self.events.append(("bulk_updated", products.count()))
+
+
+class TestSQLiteBulkUpdate(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("bulk_update_products") as table:
+            table.increments("id")
+            table.string("name", 50)
+            table.integer("price")
+
+        self.get_builder().bulk_create(
+            [
+                {"id": index, "name": f"product {index}", "price": index}
+                for index in range(1, 11)
+            ]
+        )
+
+    def tearDown(self):
+        self.schema.drop_table_if_exists("bulk_update_products")
+
+    def get_builder(self, model=None):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table="bulk_update_products",
+            connection_details=DATABASES,
+            model=model,
+        ).on("dev")
+
+    def prices(self):
+        return {
+            product["id"]: product["price"]
+            for product in self.get_builder().order_by("id").get()
+        }
+
+    def test_updates_each_row_with_its_own_values(self):
+        affected = self.get_builder().bulk_update(
+            [{"id": 2, "price": 20}, {"id": 3, "price": 30}]
+        )
+
+        self.assertEqual(affected, 2)
+        prices = self.prices()
+        self.assertEqual((prices[1], prices[2], prices[3]), (1, 20, 30))
+
+    def test_updates_the_dirty_attributes_of_models_in_batches(self):
+        products = self.get_builder(model=Product.new_unbooted()).order_by("id").get()
+        for product in products:
+            product.price = product.price * 100
+
+        observer = ProductObserver()
+        Product.__observers__[Product] = [observer]
+        try:
+            affected = self.get_builder(model=Product.new_unbooted()).bulk_update(
+                products.all(), batch_size=4
+            )
+        finally:
+            Product.__observers__.pop(Product)
+
+        self.assertEqual(affected, 10)
+        self.assertEqual(self.prices()[10], 1000)
+        self.assertFalse(products.first().is_dirty())
+        self.assertEqual(products.first().get_original("price"), 100)
+        self.assertEqual(
+            observer.events,
+            [
+                ("bulk_updating", 4),
+                ("bulk_updated", 4),
+                ("bulk_updating", 4),
+                ("bulk_updated", 4),
+                ("bulk_updating", 2),
+                ("bulk_updated", 2),
+            ],
+        )
+
+    def test_records_must_hold_every_column(self):
+        with self.assertRaises(InvalidArgument):
+            self.get_builder().bulk_update(
+                [{"id": 1, "price": 10}, {"id": 2}], columns=["price"]
+            )
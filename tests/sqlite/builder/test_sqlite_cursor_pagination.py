@@ -0,0 +1,120 @@
+import unittest
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.exceptions import InvalidArgument
+from src.masoniteorm.models import Model
+from src.masoniteorm.pagination import CursorPaginator
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Event(Model):
+    __table__ = "cursor_events"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class TestSQLiteCursorPagination(unittest.TestCase):
+    def get_builder(self, table="users"):
+        return (
+            QueryBuilder(
+                grammar=SQLiteGrammar,
+                connection="dev",
+                table=table,
+                connection_details=DATABASES,
+            )
+            .on("dev")
+            .where_in("id", [1, 4, 5])
+        )
+
+    def ids(self, paginator):
+        return [user["id"] for user in paginator]
+
+    def test_can_walk_pages_forward_and_backward(self):
+        first = self.get_builder().order_by("name").cursor_paginate(2)
+        self.assertEqual(self.ids(first), [4, 5])
+        self.assertIsNone(first.previous_cursor)
+        self.assertTrue(first.has_more_pages())
+
+        second = self.get_builder().order_by("name").cursor_paginate(2, first.next_cursor)
+        self.assertEqual(self.ids(second), [1])
+        self.assertIsNone(second.next_cursor)
+
+        previous = self.get_builder().order_by("name").cursor_paginate(
+            2, second.previous_cursor
+        )
+        self.assertEqual(self.ids(previous), [4, 5])
+        self.assertIsNone(previous.previous_cursor)
+
+    def test_primary_key_breaks_ties_in_the_seek(self):
+        builder = self.get_builder().order_by("name", "desc")
+        builder.where(
+            builder._seek_cursor([("name", "DESC"), ("id", "DESC")], ["Joe", 5], "next")
+        )
+
+        self.assertEqual(
+            builder.to_sql(),
+            """SELECT * FROM "users" WHERE "users"."id" IN ('1','4','5') AND ( ("users"."name" < 'Joe') OR ("users"."name" = 'Joe' AND "users"."id" < '5')) ORDER BY "name" DESC""",
+        )
+
+    def test_serializes_cursors_instead_of_counts(self):
+        paginator = self.get_builder().cursor_paginate(1)
+        meta = paginator.serialize()["meta"]
+
+        self.assertEqual(meta["count"], 1)
+        self.assertEqual(meta["per_page"], 1)
+        self.assertNotIn("total", meta)
+        self.assertEqual(
+            CursorPaginator.decode_cursor(meta["next_cursor"]), ([1], "next")
+        )
+
+    def test_invalid_cursors_raise(self):
+        with self.assertRaises(InvalidArgument):
+            self.get_builder().cursor_paginate(2, "not a cursor")
+
+        with self.assertRaises(InvalidArgument):
+            self.get_builder().cursor_paginate(
+                2, CursorPaginator.encode_cursor(["Joe", 1])
+            )
+
+    def test_walks_ties_on_a_timestamp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+        schema = Schema(
+            connection="dev", connection_details=DATABASES, platform=SQLitePlatform
+        ).on("dev")
+        with schema.create_table_if_not_exists("cursor_events") as table:
+            table.increments("id")
+            table.timestamp("created_at")
+
+        try:
+            Event.builder.new().bulk_create(
+                [
+                    {"created_at": created_at}
+                    for created_at in ["2020-01-01 10:00:00"] * 3
+                    + ["2020-01-02 10:00:00"] * 3
+                ]
+            )
+
+            pages, cursor = [], None
+            while True:
+                page = Event.order_by("created_at").cursor_paginate(2, cursor)
+                pages.append([event.id for event in page])
+                if not page.has_more_pages():
+                    break
+                cursor = page.next_cursor
+
+            self.assertEqual(pages, [[1, 2], [3, 4], [5, 6]])
+
+            previous = Event.order_by("created_at").cursor_paginate(
+                2, page.previous_cursor
+            )
+            self.assertEqual([event.id for event in previous], [3, 4])
+        finally:
+            schema.drop_table_if_exists("cursor_events")
+
+    def test_raw_order_by_cannot_be_seeked(self):
+        with self.assertRaises(InvalidArgument):
+            self.get_builder().order_by_raw("name").cursor_paginate(2)
@@ -0,0 +1,80 @@
+import unittest
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from tests.integrations.config.database import DATABASES
+
+
+class TestSQLiteEagerWhereIn(unittest.TestCase):
+    def get_builder(self, table="users"):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def ids(self, results):
+        return sorted(result["id"] for result in results)
+
+    def test_large_key_sets_are_split_into_batches(self):
+        ids = [1, 2, 3, 4, 5]
+        expected = self.ids(self.get_builder().where_in("id", ids).get())
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            results = self.get_builder().get_where_in("id", ids, batch_size=2)
+
+        self.assertEqual(self.ids(results), expected)
+        self.assertEqual(len(logs.records), 3)
+        for record in logs.records:
+            self.assertIn('"users"."id" IN', record.query)
+
+    def test_batches_keep_the_other_constraints(self):
+        builder = self.get_builder().where("name", "Joe").order_by("id")
+        results = builder.get_where_in("id", range(1, 2001), batch_size=500)
+
+        expected = (
+            self.get_builder()
+            .where("name", "Joe")
+            .where_between("id", 1, 2000)
+            .order_by("id")
+            .get()
+        )
+
+        self.assertTrue(results)
+        self.assertEqual(
+            [result["id"] for result in results], [user["id"] for user in expected]
+        )
+
+    def test_batch_size_leaves_room_for_existing_bindings(self):
+        builder = self.get_builder().where("name", "Joe").where("age", ">", 18)
+
+        self.assertEqual(builder.get_where_in_batch_size(), 997)
+        self.assertEqual(builder.get_where_in_batch_size(100), 98)
+        self.assertEqual(len(builder._wheres), 2)
+
+    def test_batch_size_leaves_room_for_global_scope_bindings(self):
+        builder = self.get_builder().where("name", "Joe")
+        builder.set_global_scope(
+            "tenant", lambda query: query.where("tenant_id", 7), action="select"
+        )
+
+        self.assertEqual(builder.get_where_in_batch_size(), 997)
+        self.assertEqual(len(builder._wheres), 1)
+
+    def test_subqueries_survive_the_batch_size(self):
+        builder = self.get_builder().where_in(
+            "id", lambda query: query.table("users").select("id").where("name", "Joe")
+        )
+        sql = builder.to_sql()
+
+        self.assertEqual(builder.get_where_in_batch_size(), 998)
+        self.assertEqual(builder.to_sql(), sql)
+
+    def test_small_key_sets_use_a_single_statement(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            self.get_builder().get_where_in("id", [1, 2])
+            self.get_builder().get_where_in("id", [])
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("0 = 1", logs.records[1].query)
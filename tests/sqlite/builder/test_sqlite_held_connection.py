@@ -0,0 +1,97 @@
+import sqlite3
+import threading
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class TestSQLiteHeldConnection(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("hc_users") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        self.resolver = ConnectionResolver().set_connection_details(DATABASES)
+
+    def tearDown(self):
+        self.schema.drop_table_if_exists("hc_users")
+
+    def get_builder(self):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table="hc_users",
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_queries_in_the_block_share_one_physical_connection(self):
+        with mock.patch("sqlite3.connect", wraps=sqlite3.connect) as connect:
+            with self.resolver.connection("dev") as connection:
+                self.get_builder().create({"name": "Joe"})
+                self.get_builder().where("name", "Joe").update({"name": "Bob"})
+                self.assertEqual(self.get_builder().count(), 1)
+
+                self.assertTrue(connection.is_held())
+                self.assertIsNotNone(connection._connection)
+
+        self.assertEqual(connect.call_count, 1)
+        self.assertIsNone(connection._connection)
+        self.assertNotIn("dev", self.resolver.get_held_connections())
+
+    def test_transactions_run_on_the_held_connection(self):
+        with self.resolver.connection("dev") as connection:
+            with self.assertRaises(RuntimeError):
+                with self.resolver.transaction("dev"):
+                    self.get_builder().create({"name": "Joe"})
+                    raise RuntimeError()
+
+            with self.resolver.transaction("dev"):
+                self.get_builder().create({"name": "Bob"})
+
+            self.assertIsNotNone(connection._connection)
+            self.assertEqual(self.get_builder().get().pluck("name").all(), ["Bob"])
+
+    def test_nested_blocks_keep_the_outer_connection_open(self):
+        with self.resolver.connection("dev") as outer:
+            with self.resolver.connection("dev") as inner:
+                self.assertIs(inner, outer)
+
+            self.assertIsNotNone(outer._connection)
+
+        self.assertIsNone(outer._connection)
+
+    def test_connections_are_held_per_thread(self):
+        held = {}
+
+        def query():
+            held["other"] = dict(self.resolver.get_held_connections())
+            held["count"] = self.get_builder().count()
+
+        with self.resolver.connection("dev"):
+            thread = threading.Thread(target=query)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(held, {"other": {}, "count": 0})
+
+    def test_explicit_hold_and_release(self):
+        connection = self.resolver.hold_connection("dev")
+        self.assertIs(self.resolver.hold_connection("dev"), connection)
+
+        self.get_builder().create({"name": "Joe"})
+        self.assertIsNotNone(connection._connection)
+
+        self.resolver.release_connection("dev")
+        self.assertIsNone(connection._connection)
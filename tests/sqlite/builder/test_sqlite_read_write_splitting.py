@@ -0,0 +1,177 @@
+import os
+import tempfile
+import unittest
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.connections.ReplicaRouter import ReplicaRouter
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import has_many
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Post(Model):
+    __table__ = "rw_posts"
+    __connection__ = "split"
+    __timestamps__ = False
+
+
+class Phone(Model):
+    __table__ = "rw_phones"
+    __connection__ = "split"
+    __timestamps__ = False
+
+
+class User(Model):
+    __table__ = "rw_users"
+    __connection__ = "split"
+    __timestamps__ = False
+
+    @has_many("id", "user_id")
+    def posts(self):
+        return Post
+
+    @has_many("id", "user_id")
+    def phones(self):
+        return Phone
+
+
+class TestSQLiteReadWriteSplitting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.details = dict(DATABASES)
+        for host in ("primary", "replica-1", "replica-2"):
+            self.details[host] = {
+                "driver": "sqlite",
+                "database": os.path.join(self.directory.name, f"{host}.sqlite3"),
+            }
+            schema = Schema(
+                connection=host,
+                connection_details=self.details,
+                platform=SQLitePlatform,
+            ).on(host)
+
+            with schema.create_table_if_not_exists("rw_users") as table:
+                table.increments("id")
+                table.string("name", 50)
+
+            for table_name in ("rw_posts", "rw_phones"):
+                with schema.create_table_if_not_exists(table_name) as table:
+                    table.increments("id")
+                    table.integer("user_id")
+
+            QueryBuilder(
+                grammar=SQLiteGrammar,
+                connection=host,
+                table="rw_users",
+                connection_details=self.details,
+            ).on(host).create({"name": host})
+
+        self.details["split"] = {
+            "driver": "sqlite",
+            "write": {"database": self.details["primary"]["database"]},
+            "read": [
+                {"database": self.details["replica-1"]["database"]},
+                {"database": self.details["replica-2"]["database"]},
+            ],
+        }
+        ReplicaRouter.reset()
+        self.resolver = ConnectionResolver().set_connection_details(self.details)
+
+    def tearDown(self):
+        ReplicaRouter.reset()
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.directory.cleanup()
+
+    def get_builder(self):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="split",
+            table="rw_users",
+            connection_details=self.details,
+        ).on("split")
+
+    def test_reads_are_spread_round_robin_over_the_read_hosts(self):
+        hosts = [self.get_builder().first()["name"] for _ in range(4)]
+
+        self.assertEqual(hosts, ["replica-1", "replica-2", "replica-1", "replica-2"])
+        self.assertEqual(self.get_builder().count(), 1)
+
+        stats = self.resolver.get_replica_stats("split")
+        self.assertEqual(stats["read"][0]["routed"], 3)
+        self.assertEqual(stats["read"][1]["routed"], 2)
+        self.assertNotIn("write", stats)
+
+    def test_writes_and_locked_reads_go_to_the_write_host(self):
+        self.get_builder().create({"name": "Joe"})
+        self.get_builder().where("name", "primary").update({"name": "Bob"})
+
+        self.assertEqual(
+            self.get_builder().lock_for_update().get().pluck("name").all(),
+            ["Bob", "Joe"],
+        )
+        self.assertEqual(self.get_builder().first()["name"], "replica-1")
+
+    def test_a_builder_routes_each_query_again(self):
+        builder = self.get_builder()
+
+        self.assertEqual(builder.first()["name"], "replica-1")
+        builder.create({"name": "Joe"})
+
+        self.assertEqual(self.get_builder().lock_for_update().count(), 2)
+
+    def test_transactions_run_on_the_write_host(self):
+        with self.resolver.transaction("split"):
+            self.get_builder().create({"name": "Joe"})
+            self.assertEqual(
+                self.get_builder().get().pluck("name").all(), ["primary", "Joe"]
+            )
+
+    def test_sticky_connections_read_their_writes(self):
+        self.details["split"]["sticky"] = True
+
+        with self.resolver.sticky_scope():
+            self.assertEqual(self.get_builder().first()["name"], "replica-1")
+            self.get_builder().create({"name": "Joe"})
+            self.assertEqual(self.get_builder().count(), 2)
+
+        self.assertEqual(self.get_builder().count(), 1)
+
+    def test_eager_load_workers_read_the_writes_of_the_calling_thread(self):
+        self.details["split"].update({"sticky": True, "eager_load_workers": 2})
+
+        with self.resolver.sticky_scope():
+            User.create({"id": 2, "name": "Joe"})
+            Post.create({"user_id": 2})
+            Phone.create({"user_id": 2})
+
+            (user,) = User.with_("posts", "phones").where("id", 2).get()
+
+        self.assertEqual(user.posts.count(), 1)
+        self.assertEqual(user.phones.count(), 1)
+
+    def test_least_busy_strategy_skips_hosts_with_open_connections(self):
+        self.details["split"]["read_strategy"] = "least_busy"
+
+        builder = self.get_builder()
+        connection = builder.new_connection()
+        self.assertEqual(connection.database, self.details["replica-1"]["database"])
+
+        for _ in range(3):
+            self.assertEqual(self.get_builder().first()["name"], "replica-2")
+
+        connection.close_connection()
+        hosts = {self.get_builder().first()["name"] for _ in range(2)}
+        self.assertEqual(hosts, {"replica-1", "replica-2"})
+
+    def test_host_lists_expand_into_one_host_each(self):
+        details = {"read": {"host": ["10.0.0.1", "10.0.0.2"], "port": 5433}}
+
+        self.assertEqual(
+            ReplicaRouter.get_hosts(details, "read"),
+            [{"host": "10.0.0.1", "port": 5433}, {"host": "10.0.0.2", "port": 5433}],
+        )
+        self.assertEqual(ReplicaRouter.get_hosts(details, "write"), [])
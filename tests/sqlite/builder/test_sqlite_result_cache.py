@@ -0,0 +1,194 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.cache import MemoryResultCache, ResultCache
+from src.masoniteorm.connections import ConnectionResolver, SQLiteConnection
+from src.masoniteorm.exceptions import InvalidArgument
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class TestSQLiteResultCache(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("rc_countries") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        with self.schema.create_table_if_not_exists("rc_cities") as table:
+            table.increments("id")
+            table.integer("country_id")
+            table.string("name", 50)
+
+        self.get_builder("rc_countries").bulk_create(
+            [{"name": "Canada"}, {"name": "France"}]
+        )
+        self.get_builder("rc_cities").create({"country_id": 1, "name": "Montreal"})
+
+        self.previous_cache = QueryBuilder.get_result_cache()
+        self.cache = MemoryResultCache()
+        QueryBuilder.set_result_cache(self.cache)
+
+    def tearDown(self):
+        QueryBuilder.set_result_cache(self.previous_cache)
+        self.schema.drop_table_if_exists("rc_cities")
+        self.schema.drop_table_if_exists("rc_countries")
+
+    def get_builder(self, table="rc_countries"):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def count_queries(self, callback):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            callback()
+            self.get_builder().where_raw("1 = 0").get()
+
+        return len(logs.records) - 1
+
+    def test_remembered_reads_are_served_from_the_cache(self):
+        def read():
+            for _ in range(3):
+                names = self.get_builder().remember(60).order_by("id").get()
+                self.assertEqual(names.pluck("name").all(), ["Canada", "France"])
+                self.assertEqual(self.get_builder().remember(60).count(), 2)
+                self.assertEqual(
+                    self.get_builder().remember(60).first()["name"], "Canada"
+                )
+
+        self.assertEqual(self.count_queries(read), 3)
+        self.assertEqual(self.cache.stats()["hits"], 6)
+
+    def test_bindings_are_part_of_the_key(self):
+        canada = self.get_builder().remember(60).where("name", "Canada").first()
+        france = self.get_builder().remember(60).where("name", "France").first()
+
+        self.assertEqual((canada["id"], france["id"]), (1, 2))
+
+    def test_writes_forget_the_results_of_their_table(self):
+        self.assertEqual(self.get_builder().remember().count(), 2)
+        self.assertEqual(self.get_builder("rc_cities").remember().count(), 1)
+
+        self.get_builder().create({"name": "Japan"})
+        self.assertEqual(self.get_builder().remember().count(), 3)
+
+        self.get_builder().where("name", "Japan").update({"name": "Spain"})
+        self.assertEqual(
+            self.get_builder().remember().where("name", "Spain").count(), 1
+        )
+
+        self.get_builder().bulk_create([{"name": "Italy"}, {"name": "Peru"}])
+        self.assertEqual(self.get_builder().remember().count(), 5)
+
+        self.get_builder().where("name", "Peru").delete()
+        self.assertEqual(self.get_builder().remember().count(), 4)
+
+        self.assertEqual(
+            self.count_queries(
+                lambda: self.get_builder("rc_cities").remember().count()
+            ),
+            0,
+        )
+
+    def test_results_read_while_the_table_is_written_are_not_stored(self):
+        query = SQLiteConnection.query
+
+        def query_during_a_write(connection, *args, **kwargs):
+            result = query(connection, *args, **kwargs)
+            self.cache.invalidate_tags([ResultCache.table_tag("dev", "rc_countries")])
+            return result
+
+        with mock.patch.object(SQLiteConnection, "query", query_during_a_write):
+            self.assertEqual(self.get_builder().remember().count(), 2)
+
+        self.assertEqual(self.cache.stats()["stores"], 0)
+        self.get_builder().remember().count()
+        self.assertEqual(self.cache.stats()["stores"], 1)
+
+    def test_joined_tables_tag_the_result(self):
+        def cities():
+            return (
+                self.get_builder("rc_cities")
+                .remember()
+                .join("rc_countries", "rc_countries.id", "=", "rc_cities.country_id")
+                .select("rc_cities.name", "rc_countries.name as country")
+                .get()
+            )
+
+        self.assertEqual(cities().first()["country"], "Canada")
+        self.get_builder().where("id", 1).update({"name": "Quebec"})
+
+        self.assertEqual(cities().first()["country"], "Quebec")
+
+    def test_tables_read_through_subqueries_tag_the_result(self):
+        def countries_with_cities():
+            return (
+                self.get_builder()
+                .remember()
+                .where_in(
+                    "id",
+                    lambda query: query.table("rc_cities").select("country_id"),
+                )
+                .get()
+            )
+
+        def countries_with_a_city():
+            return (
+                self.get_builder()
+                .remember()
+                .where_exists(
+                    lambda query: query.table("rc_cities")
+                    .select("id")
+                    .where_column("rc_cities.country_id", "rc_countries.id")
+                )
+                .count()
+            )
+
+        self.assertEqual(countries_with_cities().count(), 1)
+        self.assertEqual(countries_with_a_city(), 1)
+        self.get_builder("rc_cities").create({"country_id": 2, "name": "Paris"})
+
+        self.assertEqual(countries_with_cities().count(), 2)
+        self.assertEqual(countries_with_a_city(), 2)
+
+    def test_raw_subqueries_need_explicit_tags(self):
+        subquery = 'EXISTS (SELECT 1 FROM "rc_cities")'
+
+        with self.assertRaises(InvalidArgument):
+            self.get_builder().remember().where_raw(subquery).get()
+
+        rows = self.get_builder().remember(tags=["cities"]).where_raw(subquery).get()
+        self.assertEqual(rows.count(), 2)
+        self.assertEqual(self.get_builder().remember().where_raw("1 = 1").count(), 2)
+
+    def test_custom_keys_and_tags(self):
+        self.get_builder().remember(key="countries", tags=["geography"]).get()
+        self.get_builder().create({"name": "Japan"})
+
+        self.assertEqual(self.cache.get("countries"), None)
+
+        self.get_builder().remember(key="countries", tags=["geography"]).get()
+        self.assertEqual(len(self.cache.get("countries")), 3)
+
+        self.cache.invalidate_tags(["geography"])
+        self.assertIsNone(self.cache.get("countries"))
+
+    def test_reads_inside_a_transaction_are_not_stored(self):
+        resolver = ConnectionResolver().set_connection_details(DATABASES)
+
+        with resolver.transaction("dev"):
+            self.get_builder().create({"name": "Japan"})
+            self.assertEqual(self.get_builder().remember().count(), 3)
+
+        self.assertEqual(self.cache.stats()["stores"], 0)
@@ -0,0 +1,68 @@
+import unittest
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from tests.integrations.config.database import DATABASES
+
+
+class User(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class TestSQLiteStreaming(unittest.TestCase):
+    def get_builder(self, table="users", model=User):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            model=model,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_chunk_keeps_bindings_parameterized(self):
+        builder = self.get_builder().where("name", "Joe")
+        chunks = list(builder.chunk(4))
+
+        self.assertTrue(chunks)
+        for users in chunks:
+            self.assertIsInstance(users, Collection)
+            self.assertLessEqual(users.count(), 4)
+            self.assertTrue(all(user.name == "Joe" for user in users))
+
+        self.assertEqual(
+            sum(users.count() for users in chunks),
+            self.get_builder().where("name", "Joe").count(),
+        )
+
+    def test_lazy_yields_one_model_at_a_time(self):
+        users = self.get_builder().where("name", "Joe").lazy(2)
+
+        first = next(users)
+        self.assertIsInstance(first, User)
+        self.assertEqual(first.name, "Joe")
+
+        self.assertEqual(
+            len(list(users)) + 1, self.get_builder().where("name", "Joe").count()
+        )
+
+    def test_cursor_yields_dictionaries_without_a_model(self):
+        rows = list(self.get_builder(model=None).where("id", 1).cursor())
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["name"], "bill")
+
+    def test_connection_is_released_when_the_stream_is_closed(self):
+        builder = self.get_builder()
+        users = builder.lazy(1)
+        next(users)
+
+        connection = builder.get_connection()
+        self.assertTrue(connection.open)
+
+        users.close()
+
+        self.assertFalse(connection.open)
+        self.assertIsNone(connection._connection)
@@ -0,0 +1,103 @@
+import unittest
+
+from src.masoniteorm.exceptions import InvalidArgument
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class TestSQLiteUpsert(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("upsert_products") as table:
+            table.string("sku", 20).primary()
+            table.string("name", 50)
+            table.integer("price")
+
+    def tearDown(self):
+        self.schema.drop_table_if_exists("upsert_products")
+
+    def get_builder(self):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table="upsert_products",
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def products(self):
+        return {
+            product["sku"]: (product["name"], product["price"])
+            for product in self.get_builder().order_by("sku").get()
+        }
+
+    def test_inserts_new_rows_and_updates_existing_ones(self):
+        affected = self.get_builder().upsert(
+            [{"sku": "A1", "name": "Chair", "price": 10}], unique_by=["sku"]
+        )
+        self.assertEqual(affected, 1)
+
+        affected = self.get_builder().upsert(
+            [
+                {"sku": "A1", "name": "Office chair", "price": 15},
+                {"sku": "B2", "name": "Desk", "price": 40},
+            ],
+            unique_by=["sku"],
+        )
+
+        self.assertEqual(affected, 2)
+        self.assertEqual(
+            self.products(), {"A1": ("Office chair", 15), "B2": ("Desk", 40)}
+        )
+
+    def test_only_updates_the_given_columns(self):
+        self.get_builder().upsert(
+            [{"sku": "A1", "name": "Chair", "price": 10}], unique_by=["sku"]
+        )
+        self.get_builder().upsert(
+            [{"sku": "A1", "name": "Office chair", "price": 15}],
+            unique_by=["sku"],
+            update=["price"],
+        )
+
+        self.assertEqual(self.products(), {"A1": ("Chair", 15)})
+
+    def test_empty_update_leaves_existing_rows_untouched(self):
+        self.get_builder().upsert(
+            [{"sku": "A1", "name": "Chair", "price": 10}], unique_by=["sku"]
+        )
+        affected = self.get_builder().upsert(
+            [
+                {"sku": "A1", "name": "Office chair", "price": 15},
+                {"sku": "B2", "name": "Desk", "price": 40},
+            ],
+            unique_by=["sku"],
+            update=[],
+        )
+
+        self.assertEqual(affected, 1)
+        self.assertEqual(self.products(), {"A1": ("Chair", 10), "B2": ("Desk", 40)})
+
+    def test_upserts_in_batches(self):
+        rows = [
+            {"sku": f"SKU{index}", "name": "Lamp", "price": index}
+            for index in range(1000)
+        ]
+
+        affected = self.get_builder().upsert(
+            rows, unique_by=["sku"], batch_size=300, transaction=True
+        )
+
+        self.assertEqual(affected, 1000)
+        self.assertEqual(self.get_builder().count(), 1000)
+
+    def test_requires_unique_columns(self):
+        with self.assertRaises(InvalidArgument):
+            self.get_builder().upsert([{"sku": "A1"}], unique_by=[])
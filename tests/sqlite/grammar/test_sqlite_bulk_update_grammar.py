@@ -0,0 +1,28 @@
+import unittest
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+
+
+class TestSQLiteBulkUpdateGrammar(unittest.TestCase):
+    def setUp(self):
+        self.builder = QueryBuilder(SQLiteGrammar, table="users")
+        self.rows = [
+            {"id": 1, "name": "Joe", "age": 5},
+            {"age": 35, "id": 2, "name": "Bill"},
+        ]
+
+    def test_can_compile_bulk_update(self):
+        to_sql = self.builder.bulk_update(self.rows, query=True).to_sql()
+
+        sql = """UPDATE "users" SET "name" = CASE "id" WHEN '1' THEN 'Joe' WHEN '2' THEN 'Bill' END, "age" = CASE "id" WHEN '1' THEN '5' WHEN '2' THEN '35' END WHERE "id" IN ('1', '2')"""
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_bulk_update_qmark(self):
+        to_sql = self.builder.bulk_update(
+            self.rows, columns=["age"], query=True
+        ).to_qmark()
+
+        sql = """UPDATE "users" SET "age" = CASE "id" WHEN '?' THEN '?' WHEN '?' THEN '?' END WHERE "id" IN ('?', '?')"""
+        self.assertEqual(to_sql, sql)
+        self.assertEqual(self.builder._bindings, [1, 5, 2, 35, 1, 2])
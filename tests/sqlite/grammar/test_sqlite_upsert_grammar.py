@@ -0,0 +1,35 @@
+import unittest
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+
+
+class TestSQLiteUpsertGrammar(unittest.TestCase):
+    def setUp(self):
+        self.builder = QueryBuilder(SQLiteGrammar, table="products")
+        self.rows = [
+            # These keys are intentionally out of order to show column to value alignment works
+            {"sku": "A1", "name": "Chair", "price": 10},
+            {"price": 12, "sku": "B2", "name": "Desk"},
+        ]
+
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(self.rows, ["sku"], query=True).to_sql()
+
+        sql = '''INSERT INTO "products" ("name", "price", "sku") VALUES ('Chair', '10', 'A1'), ('Desk', '12', 'B2') ON CONFLICT ("sku") DO UPDATE SET "name" = excluded."name", "price" = excluded."price"'''
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_upsert_qmark_with_update_columns(self):
+        to_sql = self.builder.upsert(
+            self.rows, ["sku"], update=["price"], query=True
+        ).to_qmark()
+
+        sql = '''INSERT INTO "products" ("name", "price", "sku") VALUES ('?', '?', '?'), ('?', '?', '?') ON CONFLICT ("sku") DO UPDATE SET "price" = excluded."price"'''
+        self.assertEqual(to_sql, sql)
+        self.assertEqual(self.builder._bindings, ["Chair", 10, "A1", "Desk", 12, "B2"])
+
+    def test_can_compile_upsert_without_updates(self):
+        to_sql = self.builder.upsert(self.rows, "sku", update=[], query=True).to_qmark()
+
+        sql = '''INSERT INTO "products" ("name", "price", "sku") VALUES ('?', '?', '?'), ('?', '?', '?') ON CONFLICT ("sku") DO NOTHING'''
+        self.assertEqual(to_sql, sql)
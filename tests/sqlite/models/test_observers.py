@@ -62,6 +62,28 @@ class Observer(Model):
 Observer.observe(UserObserver())
 
 
+class EventRecorder:
+    def __init__(self):
+        self.events = []
+
+    def __getattr__(self, event):
+        return lambda model: self.events.append(event)
+
+
+class RecordedObserver(Model):
+    __connection__ = "dev"
+    __table__ = "observers"
+    __timestamps__ = False
+    __observers__ = {}
+
+
+class FillableAndGuarded(Model):
+    __connection__ = "dev"
+    __table__ = "observers"
+    __fillable__ = ["name"]
+    __guarded__ = ["id"]
+
+
 class BaseTestQueryRelationships(unittest.TestCase):
     maxDiff = None
 
@@ -120,3 +142,20 @@ class BaseTestQueryRelationships(unittest.TestCase):
         self.assertEqual(TestM.observed_hydrating, 1)
         self.assertEqual(TestM.observed_hydrated, 1)
         DB.rollback("dev")
+
+    def test_hydrated_models_fire_the_boot_events_before_hydrating(self):
+        recorder = EventRecorder()
+        RecordedObserver.observe(recorder)
+
+        RecordedObserver.hydrate([{"id": 1, "name": "joe"}])
+
+        self.assertEqual(
+            recorder.events, ["booting", "booted", "hydrating", "hydrated"]
+        )
+
+    def test_hydrating_checks_fillable_and_guarded(self):
+        with self.assertRaises(AttributeError):
+            FillableAndGuarded.hydrate({"id": 1, "name": "joe"})
+
+        with self.assertRaises(AttributeError):
+            FillableAndGuarded.hydrate([{"id": 1, "name": "joe"}])
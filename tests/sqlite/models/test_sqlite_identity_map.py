@@ -0,0 +1,106 @@
+import unittest
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.models import Model
+from src.masoniteorm.models.IdentityMap import IdentityMap
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import belongs_to
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Author(Model):
+    __table__ = "im_authors"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Post(Model):
+    __table__ = "im_posts"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @belongs_to("author_id", "id")
+    def author(self):
+        return Author
+
+
+class TestSQLiteIdentityMap(unittest.TestCase):
+    def setUp(self):
+        self.resolver = ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("im_authors") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        with self.schema.create_table_if_not_exists("im_posts") as table:
+            table.increments("id")
+            table.integer("author_id")
+
+        self.get_builder("im_authors").bulk_create(
+            [{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bob"}]
+        )
+        self.get_builder("im_posts").bulk_create(
+            [{"id": id, "author_id": id % 2 + 1} for id in range(1, 11)]
+        )
+
+    def tearDown(self):
+        self.schema.drop_table_if_exists("im_posts")
+        self.schema.drop_table_if_exists("im_authors")
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_eager_loads_share_one_instance_per_row(self):
+        posts = Post.with_("author").get()
+        authors = {id(post.author) for post in posts}
+
+        self.assertEqual(len(authors), 2)
+        self.assertIsNone(IdentityMap.current())
+
+    def test_queries_without_an_identity_map_hydrate_new_models(self):
+        self.assertIsNot(Author.find(1), Author.find(1))
+
+    def test_identity_map_is_shared_across_the_queries_of_a_block(self):
+        with self.resolver.identity_map() as identity_map:
+            authors = Author.all()
+            self.assertIs(Author.find(1), authors[0])
+
+            with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+                posts = Post.with_("author").get()
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('"im_posts"', logs.records[0].query)
+        self.assertIs(posts[1].author, authors[0])
+        self.assertGreater(identity_map.hits, 0)
+        self.assertIsNone(IdentityMap.current())
+
+    def test_rows_with_different_values_get_their_own_model(self):
+        identity_map = IdentityMap()
+        first = identity_map.hydrate(Author, {"id": 1, "name": "Joe"})
+
+        self.assertIs(identity_map.hydrate(Author, {"id": 1}), first)
+        self.assertIsNot(
+            identity_map.hydrate(Author, {"id": 1, "name": "Joe", "pivot_id": 3}),
+            first,
+        )
+        self.assertIsNot(identity_map.hydrate(Author, {"id": 1, "name": "Bob"}), first)
+        self.assertIs(identity_map.get(Author, "1"), first)
+
+    def test_partial_rows_are_not_reused_to_skip_queries(self):
+        identity_map = IdentityMap()
+        identity_map.hydrate(Author, {"id": 1}, complete=False)
+
+        self.assertIsNone(identity_map.get(Author, 1))
@@ -0,0 +1,139 @@
+import gc
+import pickle
+import unittest
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.exceptions import LazyLoadingViolation
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import belongs_to, has_many
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Author(Model):
+    __table__ = "ll_authors"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @has_many("id", "author_id")
+    def posts(self):
+        return Post
+
+
+class Post(Model):
+    __table__ = "ll_posts"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @belongs_to("author_id", "id")
+    def author(self):
+        return Author
+
+
+class BatchedPost(Post):
+    __batch_lazy_loads__ = True
+
+
+class TestSQLiteLazyLoading(unittest.TestCase):
+    def setUp(self):
+        self.resolver = ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("ll_authors") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        with self.schema.create_table_if_not_exists("ll_posts") as table:
+            table.increments("id")
+            table.integer("author_id")
+
+        self.get_builder("ll_authors").bulk_create(
+            [{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bob"}, {"id": 3, "name": "Al"}]
+        )
+        self.get_builder("ll_posts").bulk_create(
+            [{"id": id, "author_id": id % 2 + 1} for id in range(1, 7)]
+        )
+
+    def tearDown(self):
+        self.schema.drop_table_if_exists("ll_posts")
+        self.schema.drop_table_if_exists("ll_authors")
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_detector_logs_repeated_lazy_loads(self):
+        posts = Post.all()
+
+        with self.assertLogs("masoniteorm.models.lazy_loads", "WARNING") as logs:
+            with self.resolver.detect_lazy_loads() as detector:
+                for post in posts:
+                    post.author
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("'Post.author' was lazy loaded 2 times", logs.output[0])
+        self.assertEqual(detector.report(), {"Post.author": 6})
+
+    def test_strict_detector_raises(self):
+        posts = Post.all()
+
+        with self.assertRaises(LazyLoadingViolation):
+            with self.resolver.detect_lazy_loads(threshold=3, strict=True):
+                for post in posts:
+                    post.author
+
+    def test_batch_lazy_loads_load_every_sibling_at_once(self):
+        posts = Post.all()
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            with self.resolver.batch_lazy_loads():
+                authors = [post.author.id for post in posts]
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('"ll_authors"."id" IN', logs.records[0].query)
+        self.assertEqual(authors, [post.author_id for post in posts])
+
+    def test_batch_lazy_loads_register_empty_relationships(self):
+        authors = Author.all()
+
+        with self.resolver.batch_lazy_loads():
+            posts = [author.posts.pluck("id").all() for author in authors]
+
+        self.assertEqual(posts, [[2, 4, 6], [1, 3, 5], []])
+        self.assertIsInstance(authors[2].posts, Collection)
+
+    def test_models_can_opt_in_to_batch_lazy_loads(self):
+        posts = BatchedPost.all()
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            for post in posts:
+                post.author
+
+        self.assertEqual(len(logs.records), 1)
+
+    def test_models_do_not_keep_their_collection_alive(self):
+        post = Post.all()[0]
+        gc.collect()
+
+        self.assertIsNone(post.get_siblings())
+        self.assertNotIn("_siblings", pickle.loads(pickle.dumps(post)).__dict__)
+
+        with self.resolver.batch_lazy_loads():
+            self.assertEqual(post.author.id, 2)
+
+    def test_models_outside_a_collection_load_alone(self):
+        with self.resolver.batch_lazy_loads():
+            post = Post.find(1)
+            self.assertEqual(post.author.id, 2)
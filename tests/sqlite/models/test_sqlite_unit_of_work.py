@@ -0,0 +1,214 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import ConnectionResolver, UnitOfWork
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.query.processors import SQLitePostProcessor
+from src.masoniteorm.relationships import belongs_to
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Author(Model):
+    __table__ = "uow_authors"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Book(Model):
+    __table__ = "uow_books"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @belongs_to("author_id", "id")
+    def author(self):
+        return Author
+
+
+class TestSQLiteUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        self.resolver = ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("uow_authors") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        with self.schema.create_table_if_not_exists("uow_books") as table:
+            table.increments("id")
+            table.integer("author_id")
+            table.string("title", 50)
+
+    def tearDown(self):
+        self.schema.drop_table_if_exists("uow_books")
+        self.schema.drop_table_if_exists("uow_authors")
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def statements(self, logs):
+        return [record.query.split(" (")[0] for record in logs.records]
+
+    def make(self, model_class, **attributes):
+        model = model_class()
+        for key, value in attributes.items():
+            setattr(model, key, value)
+        return model
+
+    def test_saves_are_flushed_as_bulk_inserts_parents_first(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            with self.resolver.session():
+                for index in range(1, 4):
+                    book = self.make(Book, id=index, author_id=1, title="book")
+                    book.save()
+                self.make(Author, id=1, name="Joe").save()
+                self.make(Author, id=2, name="Bill").save()
+
+                self.assertEqual(self.get_builder("uow_books").count(), 0)
+
+        self.assertEqual(
+            self.statements(logs)[-2:],
+            ['INSERT INTO "uow_authors"', 'INSERT INTO "uow_books"'],
+        )
+        self.assertEqual(self.get_builder("uow_authors").count(), 2)
+        self.assertEqual(self.get_builder("uow_books").count(), 3)
+
+    def test_generated_keys_are_read_back(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            with self.resolver.session():
+                joe = self.make(Author, name="Joe")
+                bill = self.make(Author, name="Bill")
+                joe.save()
+                bill.save()
+
+        self.assertEqual(self.statements(logs).count('INSERT INTO "uow_authors"'), 1)
+        self.assertEqual((joe.id, bill.id), (1, 2))
+
+        joe.name = "Joseph"
+        joe.save()
+        self.assertEqual(
+            self.get_builder("uow_authors").where("id", 1).first()["name"], "Joseph"
+        )
+        self.assertEqual(self.get_builder("uow_authors").count(), 2)
+
+    def test_generated_parent_keys_are_set_on_attached_children(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            with self.resolver.session():
+                joe = self.make(Author, name="Joe")
+                first = self.make(Book, title="first")
+                second = self.make(Book, title="second")
+                first.attach("author", joe)
+                second.attach("author", joe)
+
+                self.assertEqual(self.get_builder("uow_authors").count(), 0)
+
+        self.assertEqual(
+            self.statements(logs)[-2:],
+            ['INSERT INTO "uow_authors"', 'INSERT INTO "uow_books"'],
+        )
+        self.assertEqual(joe.id, 1)
+        self.assertEqual((first.author_id, second.author_id), (1, 1))
+        self.assertEqual(
+            self.get_builder("uow_books").order_by("id").get().pluck("author_id").all(),
+            [1, 1],
+        )
+
+    def test_returned_rows_are_matched_on_the_generated_keys(self):
+        # RETURNING gives the rows in an arbitrary order
+        creates = [{"name": "Joe"}, {"id": 7, "name": "Bill"}, {"name": "Jane"}]
+        returned = [
+            {"id": 9, "name": "Jane"},
+            {"id": 7, "name": "Bill"},
+            {"id": 8, "name": "Joe"},
+        ]
+
+        SQLitePostProcessor().process_bulk_insert_get_ids(None, returned, creates, "id")
+
+        self.assertEqual([create["id"] for create in creates], [8, 7, 9])
+
+    def test_rows_are_inserted_one_at_a_time_without_returning(self):
+        with mock.patch.object(SQLiteGrammar, "bulk_insert_returns_ids", False):
+            with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+                with self.resolver.session():
+                    joe = self.make(Author, name="Joe")
+                    bill = self.make(Author, name="Bill")
+                    joe.save()
+                    bill.save()
+
+        self.assertEqual(self.statements(logs).count('INSERT INTO "uow_authors"'), 2)
+        self.assertEqual((joe.id, bill.id), (1, 2))
+
+    def test_dirty_models_are_flushed_as_one_update(self):
+        self.get_builder("uow_authors").bulk_create(
+            [{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bill"}]
+        )
+        authors = Author.hydrate(
+            self.get_builder("uow_authors").order_by("id").get().all()
+        )
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            with self.resolver.session():
+                for author in authors:
+                    author.name = author.name.upper()
+                    author.save()
+
+        self.assertEqual(
+            self.statements(logs),
+            [
+                'UPDATE "uow_authors" SET "name" = CASE "id" WHEN ? THEN ? WHEN ? THEN ? END WHERE "id" IN'
+            ],
+        )
+        self.assertEqual(
+            [author["name"] for author in self.get_builder("uow_authors").get()],
+            ["JOE", "BILL"],
+        )
+        self.assertFalse(authors.first().is_dirty())
+
+    def test_deletes_run_children_first(self):
+        self.get_builder("uow_authors").bulk_create([{"id": 1, "name": "Joe"}])
+        self.get_builder("uow_books").bulk_create(
+            [{"id": 1, "author_id": 1, "title": "book"}]
+        )
+        author = Author.hydrate(self.get_builder("uow_authors").first())
+        book = Book.hydrate(self.get_builder("uow_books").first())
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            with self.resolver.session() as session:
+                session.delete(author, book)
+
+        self.assertEqual(
+            self.statements(logs),
+            [
+                'DELETE FROM "uow_books" WHERE "id" IN',
+                'DELETE FROM "uow_authors" WHERE "id" IN',
+            ],
+        )
+        self.assertEqual(self.get_builder("uow_authors").count(), 0)
+
+    def test_nothing_is_written_when_the_block_raises(self):
+        with self.assertRaises(ValueError):
+            with self.resolver.session():
+                self.make(Author, id=1, name="Joe").save()
+                raise ValueError()
+
+        self.assertIsNone(UnitOfWork.current())
+        self.assertEqual(self.get_builder("uow_authors").count(), 0)
+
+    def test_saving_outside_a_session_writes_right_away(self):
+        self.assertIsNone(UnitOfWork.current())
+        author = self.make(Author, id=1, name="Joe").save()
+
+        self.assertEqual(self.get_builder("uow_authors").count(), 1)
+        self.assertEqual(author.name, "Joe")
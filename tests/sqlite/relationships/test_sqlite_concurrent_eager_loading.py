@@ -0,0 +1,102 @@
+import threading
+import unittest
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.models import Model
+from src.masoniteorm.relationships import belongs_to, has_many
+from tests.integrations.config.database import DATABASES
+
+
+class Profile(Model):
+    __connection__ = "dev"
+
+
+class Articles(Model):
+    __connection__ = "dev"
+
+
+class Logo(Model):
+    __connection__ = "dev"
+
+
+class User(Model):
+    __connection__ = "dev"
+
+    @belongs_to("id", "user_id")
+    def profile(self):
+        return Profile
+
+    @has_many("id", "user_id")
+    def articles(self):
+        return Articles
+
+    @belongs_to("id", "article_id")
+    def logo(self):
+        return Logo
+
+
+class TestSQLiteConcurrentEagerLoading(unittest.TestCase):
+    def setUp(self):
+        details = dict(DATABASES)
+        details["dev"] = dict(DATABASES["dev"], eager_load_workers=3)
+        self.resolver = ConnectionResolver().set_connection_details(details)
+
+    def tearDown(self):
+        self.resolver.set_connection_details(DATABASES)
+
+    def load(self):
+        return User.with_("profile", "articles", "logo").where_in("id", [1, 2]).get()
+
+    def snapshot(self, users):
+        return [
+            (
+                user.id,
+                user.profile.id if user.profile else None,
+                user.articles.pluck("id").all(),
+                user.logo.id if user.logo else None,
+            )
+            for user in users
+        ]
+
+    def test_sibling_relationships_load_on_worker_threads(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            concurrent = self.load()
+
+        threads = [record.threadName for record in logs.records]
+        self.assertEqual(len(threads), 4)
+        self.assertEqual(threads[0], threading.current_thread().name)
+        self.assertNotIn(threading.current_thread().name, threads[1:])
+
+        self.resolver.set_connection_details(DATABASES)
+        self.assertEqual(self.snapshot(concurrent), self.snapshot(self.load()))
+
+    def test_workers_come_from_the_connection_details(self):
+        self.assertEqual(User.new_unbooted().get_builder().get_eager_load_workers(), 3)
+
+        self.resolver.set_connection_details(DATABASES)
+        self.assertEqual(User.new_unbooted().get_builder().get_eager_load_workers(), 1)
+
+    def test_transactions_load_relationships_one_at_a_time(self):
+        self.resolver.begin_transaction("dev")
+        try:
+            self.assertEqual(User.new_unbooted().get_builder().get_eager_load_workers(), 1)
+            with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+                self.load()
+        finally:
+            self.resolver.rollback("dev")
+
+        self.assertEqual(
+            {record.threadName for record in logs.records},
+            {threading.current_thread().name},
+        )
+
+    def test_held_connections_load_relationships_one_at_a_time(self):
+        with self.resolver.connection("dev"):
+            self.assertEqual(User.new_unbooted().get_builder().get_eager_load_workers(), 1)
+            with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+                self.load()
+
+        self.assertEqual(
+            {record.threadName for record in logs.records},
+            {threading.current_thread().name},
+        )
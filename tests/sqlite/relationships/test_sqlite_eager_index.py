@@ -0,0 +1,100 @@
+import unittest
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.models import Model
+from src.masoniteorm.relationships import belongs_to, has_many, has_one
+from src.masoniteorm.relationships.RelatedIndex import RelatedIndex
+from tests.integrations.config.database import DATABASES
+
+
+class Profile(Model):
+    __connection__ = "dev"
+
+
+class Articles(Model):
+    __connection__ = "dev"
+
+
+class User(Model):
+    __connection__ = "dev"
+
+    @has_one("user_id", "id")
+    def profile(self):
+        return Profile
+
+    @has_many("id", "user_id")
+    def articles(self):
+        return Articles
+
+    @belongs_to("user_id", "id")
+    def owner(self):
+        return User
+
+
+class TestSQLiteEagerIndex(unittest.TestCase):
+    def setUp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+
+    def stitch(self, key, parents, related_result):
+        related = getattr(User, key)
+        index = related.map_related(related_result)
+        for parent in parents:
+            related.register_related(key, parent, index)
+
+    def test_has_many_groups_related_rows_in_order(self):
+        users = User.hydrate([{"id": 1}, {"id": 2}, {"id": 3}])
+        articles = Articles.hydrate(
+            [
+                {"id": 10, "user_id": 2},
+                {"id": 11, "user_id": 1},
+                {"id": 12, "user_id": 2},
+            ]
+        )
+
+        self.stitch("articles", users, articles)
+
+        self.assertEqual(users[0].articles.pluck("id").all(), [11])
+        self.assertEqual(users[1].articles.pluck("id").all(), [10, 12])
+        self.assertIsInstance(users[2].articles, Collection)
+        self.assertTrue(users[2].articles.is_empty())
+
+    def test_has_one_and_belongs_to_take_the_first_match(self):
+        users = User.hydrate([{"id": 1, "user_id": 2}, {"id": 2, "user_id": None}])
+        profiles = Profile.hydrate([{"id": 5, "user_id": 1}, {"id": 6, "user_id": 1}])
+
+        self.stitch("profile", users, profiles)
+        self.stitch("owner", users, users)
+
+        self.assertEqual(users[0].profile.id, 5)
+        self.assertIsNone(users[1].profile)
+        self.assertEqual(users[0].owner.id, 2)
+        self.assertIsNone(users[1].owner)
+
+    def test_keys_match_loosely_like_collection_where(self):
+        index = RelatedIndex([{"user_id": "1"}, {"user_id": 2}], "user_id")
+
+        self.assertEqual(index.many(1).count(), 1)
+        self.assertEqual(index.one("2"), {"user_id": 2})
+        self.assertIsNone(index.one(None))
+
+    def test_callable_keys_index_composite_values(self):
+        records = [
+            {"record_type": "users", "record_id": 1},
+            {"record_type": "articles", "record_id": 1},
+        ]
+        index = RelatedIndex(
+            records, lambda record: (record["record_type"], record["record_id"])
+        )
+
+        self.assertEqual(index.one(("articles", "1")), records[1])
+        self.assertTrue(index.many(("profiles", 1)).is_empty())
+
+    def test_eager_loading_matches_lazy_loading(self):
+        users = User.with_("articles", "profile").get()
+
+        for user in users:
+            self.assertEqual(
+                user.articles.pluck("id").all(),
+                Articles.where("user_id", user.id).get().pluck("id").all(),
+            )
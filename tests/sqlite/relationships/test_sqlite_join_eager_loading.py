@@ -0,0 +1,188 @@
+import unittest
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.exceptions import InvalidArgument
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import belongs_to, has_many, has_one
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Profile(Model):
+    __table__ = "je_profiles"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Team(Model):
+    __table__ = "je_teams"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class User(Model):
+    __table__ = "je_users"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @has_one("user_id", "id")
+    def profile(self):
+        return Profile
+
+    @belongs_to("team_id", "id")
+    def team(self):
+        return Team
+
+    @belongs_to("former_team_id", "id")
+    def former_team(self):
+        return Team
+
+    @has_many("id", "user_id")
+    def profiles(self):
+        return Profile
+
+    @belongs_to("team_id", "id")
+    def captain(self):
+        return User
+
+    @belongs_to("name", "name")
+    def namesake(self):
+        return Team
+
+
+class TestSQLiteJoinEagerLoading(unittest.TestCase):
+    def setUp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("je_teams") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        with self.schema.create_table_if_not_exists("je_users") as table:
+            table.increments("id")
+            table.string("name", 50)
+            table.integer("team_id").nullable()
+            table.integer("former_team_id").nullable()
+
+        with self.schema.create_table_if_not_exists("je_profiles") as table:
+            table.increments("id")
+            table.integer("user_id")
+            table.string("name", 50)
+
+        self.get_builder("je_teams").bulk_create(
+            [{"id": 1, "name": "Red"}, {"id": 2, "name": "Blue"}]
+        )
+        self.get_builder("je_users").bulk_create(
+            [
+                {"id": 1, "name": "Joe", "team_id": 1, "former_team_id": 2},
+                {"id": 2, "name": "Bob", "team_id": None, "former_team_id": None},
+            ]
+        )
+        self.get_builder("je_profiles").bulk_create(
+            [{"id": 5, "user_id": 1, "name": "Joe's profile"}]
+        )
+
+    def tearDown(self):
+        for table in ["je_teams", "je_users", "je_profiles"]:
+            self.schema.drop_table_if_exists(table)
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_belongs_to_relationships_load_in_the_same_query(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            users = User.with_("team", strategy="join").order_by("je_users.id").get()
+
+        # The related columns are read from the schema once per table
+        queries = [
+            record.query
+            for record in logs.records
+            if not record.query.startswith("PRAGMA")
+        ]
+        self.assertEqual(len(queries), 1)
+        self.assertIn(
+            'LEFT JOIN "je_teams" ON "je_users"."team_id" = "je_teams"."id"',
+            queries[0],
+        )
+
+        joe, bob = users
+        self.assertEqual(joe.serialize()["name"], "Joe")
+        self.assertNotIn("team__name", joe.serialize())
+        self.assertEqual(joe.team.name, "Red")
+        self.assertEqual(joe.team.id, 1)
+        self.assertIsNone(bob.team)
+
+    def test_has_one_is_not_joined_because_it_can_match_several_rows(self):
+        self.get_builder("je_profiles").create(
+            {"id": 6, "user_id": 1, "name": "Joe's other profile"}
+        )
+
+        with self.assertRaises(InvalidArgument):
+            User.with_("profile", strategy="join")
+
+        users = User.with_("profile").order_by("je_users.id").limit(2).get()
+        self.assertEqual(users.pluck("id").all(), [1, 2])
+        self.assertIsNone(users[1].profile)
+
+    def test_first_and_query_strategy_eager_loads_combine(self):
+        user = (
+            User.with_("team", strategy="join")
+            .with_("profiles")
+            .where("je_users.id", 1)
+            .first()
+        )
+
+        self.assertEqual(user.team.name, "Red")
+        self.assertEqual(user.profiles.pluck("id").all(), [5])
+
+    def test_join_strategy_sql(self):
+        sql = User.with_("team", strategy="join").where("je_users.id", 1).to_sql()
+
+        self.assertEqual(
+            sql,
+            'SELECT "je_users".*, "je_teams"."id" AS team__id, "je_teams"."name" AS team__name '
+            'FROM "je_users" LEFT JOIN "je_teams" ON "je_users"."team_id" = "je_teams"."id" '
+            'WHERE "je_users"."id" = \'1\'',
+        )
+
+    def test_relationships_to_the_same_table_are_joined_under_aliases(self):
+        builder = User.with_("team", "former_team", strategy="join").order_by(
+            "je_users.id"
+        )
+        self.assertIn(
+            'LEFT JOIN "je_teams" AS "__former_team" '
+            'ON "je_users"."former_team_id" = "__former_team"."id"',
+            builder.to_sql(),
+        )
+
+        joe, bob = builder.get()
+        self.assertEqual(joe.team.name, "Red")
+        self.assertEqual(joe.former_team.name, "Blue")
+        self.assertIsNone(bob.team)
+        self.assertIsNone(bob.former_team)
+
+    def test_join_strategy_rejects_relationships_it_cannot_join(self):
+        with self.assertRaises(InvalidArgument):
+            User.with_("profiles", strategy="join")
+
+        with self.assertRaises(InvalidArgument):
+            User.with_("captain", strategy="join")
+
+        with self.assertRaises(InvalidArgument):
+            User.with_("namesake", strategy="join")
+
+        with self.assertRaises(InvalidArgument):
+            User.with_("team", strategy="subquery")
@@ -0,0 +1,162 @@
+import unittest
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import belongs_to, has_many
+from src.masoniteorm.relationships.LazyCollection import LazyCollection
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from src.masoniteorm.scopes import SoftDeletesMixin
+from tests.integrations.config.database import DATABASES
+
+
+class Author(Model):
+    __table__ = "lp_authors"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Post(Model):
+    __table__ = "lp_posts"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @belongs_to("author_id", "id")
+    def author(self):
+        return Author
+
+
+class Comment(Model, SoftDeletesMixin):
+    __table__ = "lp_comments"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Writer(Model):
+    __table__ = "lp_authors"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @has_many("id", "author_id")
+    def posts(self):
+        return Post
+
+    @has_many("id", "author_id")
+    def comments(self):
+        return Comment
+
+
+class TestSQLiteLazyRelationshipProxy(unittest.TestCase):
+    def setUp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("lp_authors") as table:
+            table.increments("id")
+
+        with self.schema.create_table_if_not_exists("lp_posts") as table:
+            table.increments("id")
+            table.integer("author_id")
+
+        with self.schema.create_table_if_not_exists("lp_comments") as table:
+            table.increments("id")
+            table.integer("author_id")
+            table.timestamp("deleted_at").nullable()
+
+        self.get_builder("lp_authors").bulk_create([{"id": 1}, {"id": 2}])
+        self.get_builder("lp_posts").bulk_create(
+            [{"id": 1, "author_id": 1}, {"id": 2, "author_id": 1}]
+        )
+        self.get_builder("lp_comments").bulk_create(
+            [
+                {"id": 1, "author_id": 1, "deleted_at": None},
+                {"id": 2, "author_id": 1, "deleted_at": "2024-01-01 00:00:00"},
+            ]
+        )
+
+    def tearDown(self):
+        for table in ["lp_authors", "lp_posts", "lp_comments"]:
+            self.schema.drop_table_if_exists(table)
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_accessing_a_to_many_relationship_does_not_query(self):
+        writer = Writer.find(1)
+
+        with self.assertNoLogs("masoniteorm.connection.queries", "DEBUG"):
+            posts = writer.posts
+
+        self.assertIsInstance(posts, LazyCollection)
+        self.assertIsInstance(posts, Collection)
+        self.assertFalse(posts.is_loaded())
+
+    def test_count_and_exists_run_aggregate_queries(self):
+        writer, other = Writer.find(1), Writer.find(2)
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            self.assertEqual(writer.posts.count(), 2)
+            self.assertTrue(writer.posts.exists())
+            self.assertEqual(other.posts.count(), 0)
+            self.assertFalse(other.posts.exists())
+
+        queries = [record.query for record in logs.records]
+        self.assertEqual(len(queries), 4)
+        self.assertIn("COUNT(*)", queries[0])
+        self.assertIn("LIMIT 1", queries[1])
+
+    def test_records_load_once_on_first_use(self):
+        posts = Writer.find(1).posts
+
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            self.assertEqual(sorted(post.id for post in posts), [1, 2])
+            self.assertEqual(posts.count(), 2)
+            self.assertEqual(posts[0].author_id, 1)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertTrue(posts.is_loaded())
+
+    def test_related_builder_is_made_once_per_relationship(self):
+        Writer.find(1).posts.count()
+        prototype = Writer.__dict__["posts"].__dict__["_related_prototype"]
+
+        Writer.find(2).posts.count()
+        self.assertIs(
+            Writer.__dict__["posts"].__dict__["_related_prototype"], prototype
+        )
+
+    def test_to_one_relationships_still_load_right_away(self):
+        self.assertEqual(Post.find(1).author.id, 1)
+        self.assertIsNone(Post.hydrate({"id": 3, "author_id": 9}).author)
+
+    def test_macros_of_the_related_model_are_available(self):
+        writer = Writer.find(1)
+
+        self.assertEqual(writer.related("comments").get().count(), 1)
+        self.assertEqual(writer.related("comments").with_trashed().get().count(), 2)
+        self.assertEqual(writer.related("comments").only_trashed().get().count(), 1)
+
+    def test_removing_a_scope_only_affects_one_access(self):
+        writer, other = Writer.find(1), Writer.find(1)
+
+        builder = writer.related("comments").remove_global_scope(
+            "_where_null", action="select"
+        )
+        self.assertEqual(builder.get().count(), 2)
+        writer.related("comments").with_trashed()
+
+        self.assertEqual(writer.related("comments").get().count(), 1)
+        self.assertEqual(other.related("comments").get().count(), 1)
+        self.assertEqual(other.comments.count(), 1)
@@ -0,0 +1,137 @@
+import unittest
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import belongs_to_many, has_many
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Comment(Model):
+    __table__ = "le_comments"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Tag(Model):
+    __table__ = "le_tags"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Post(Model):
+    __table__ = "le_posts"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @has_many("id", "post_id")
+    def comments(self):
+        return Comment
+
+    @belongs_to_many("post_id", "tag_id", "id", "id", table="le_post_tag")
+    def tags(self):
+        return Tag
+
+
+class TestSQLiteLimitedEagerLoading(unittest.TestCase):
+    def setUp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("le_posts") as table:
+            table.increments("id")
+
+        with self.schema.create_table_if_not_exists("le_comments") as table:
+            table.increments("id")
+            table.integer("post_id")
+
+        with self.schema.create_table_if_not_exists("le_tags") as table:
+            table.increments("id")
+
+        with self.schema.create_table_if_not_exists("le_post_tag") as table:
+            table.increments("id")
+            table.integer("post_id")
+            table.integer("tag_id")
+
+        self.get_builder("le_posts").bulk_create([{"id": 1}, {"id": 2}, {"id": 3}])
+        self.get_builder("le_comments").bulk_create(
+            [{"id": id, "post_id": 1 if id <= 5 else 2} for id in range(1, 8)]
+        )
+        self.get_builder("le_tags").bulk_create([{"id": id} for id in range(1, 5)])
+        self.get_builder("le_post_tag").bulk_create(
+            [{"id": id, "post_id": 1, "tag_id": id} for id in range(1, 5)]
+        )
+
+    def tearDown(self):
+        for table in ["le_posts", "le_comments", "le_tags", "le_post_tag"]:
+            self.schema.drop_table_if_exists(table)
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def comment_ids(self, posts):
+        return [post.comments.pluck("id").all() for post in posts]
+
+    def test_limit_applies_to_each_parent(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            posts = (
+                Post.with_(
+                    {"comments": lambda query: query.order_by("id", "desc").limit(3)}
+                )
+                .order_by("id")
+                .get()
+            )
+
+        self.assertEqual(self.comment_ids(posts), [[5, 4, 3], [7, 6], []])
+        self.assertIn(
+            'ROW_NUMBER() OVER (PARTITION BY "le_comments"."post_id" ORDER BY "id" DESC)',
+            logs.records[1].query,
+        )
+        self.assertNotIn("m_row_number", posts.first().comments.first().serialize())
+
+    def test_offset_applies_to_each_parent(self):
+        posts = (
+            Post.with_({"comments": lambda query: query.limit(2).offset(1)})
+            .order_by("id")
+            .get()
+        )
+
+        self.assertEqual(self.comment_ids(posts), [[2, 3], [7], []])
+
+    def test_limit_per_parent_survives_where_in_batches(self):
+        comments = (
+            Comment.order_by("id", "desc")
+            .limit(1)
+            .get_where_in("post_id", [1, 2, 3], batch_size=1)
+        )
+
+        self.assertEqual(comments.pluck("id").all(), [5, 7])
+
+    def test_belongs_to_many_limit_per_parent(self):
+        posts = (
+            Post.with_(
+                {"tags": lambda query: query.order_by("le_tags.id", "desc").limit(2)}
+            )
+            .order_by("id")
+            .get()
+        )
+
+        self.assertEqual(posts.first().tags.pluck("id").all(), [4, 3])
+        self.assertTrue(posts.last().tags.is_empty())
+
+    def test_without_limit_loads_every_related_record(self):
+        posts = Post.with_("comments").order_by("id").get()
+
+        self.assertEqual(self.comment_ids(posts), [[1, 2, 3, 4, 5], [6, 7], []])
@@ -0,0 +1,135 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import belongs_to_many
+from src.masoniteorm.relationships.BelongsToMany import BelongsToMany
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Tag(Model):
+    __table__ = "ps_tags"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class User(Model):
+    __table__ = "ps_users"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @belongs_to_many("user_id", "tag_id", "id", "id", table="ps_tag_user")
+    def tags(self):
+        return Tag
+
+
+class TestSQLitePivotSync(unittest.TestCase):
+    def setUp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("ps_users") as table:
+            table.increments("id")
+
+        with self.schema.create_table_if_not_exists("ps_tags") as table:
+            table.increments("id")
+
+        with self.schema.create_table_if_not_exists("ps_tag_user") as table:
+            table.increments("id")
+            table.integer("user_id")
+            table.integer("tag_id")
+            table.string("role", 20).nullable()
+
+        self.get_builder("ps_users").bulk_create([{"id": 1}, {"id": 2}])
+        self.get_builder("ps_tags").bulk_create([{"id": id} for id in range(1, 6)])
+        self.get_builder("ps_tag_user").bulk_create(
+            [
+                {"user_id": 1, "tag_id": 1, "role": "owner"},
+                {"user_id": 1, "tag_id": 2, "role": "owner"},
+                {"user_id": 2, "tag_id": 1, "role": "owner"},
+            ]
+        )
+        self.user = User.find(1)
+
+    def tearDown(self):
+        for table in ["ps_users", "ps_tags", "ps_tag_user"]:
+            self.schema.drop_table_if_exists(table)
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def tag_ids(self, user_id=1):
+        return sorted(
+            row["tag_id"]
+            for row in self.get_builder("ps_tag_user").where("user_id", user_id).get()
+        )
+
+    def test_sync_diffs_with_one_select_insert_and_delete(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            result = self.user.sync("tags", [2, 3, 4, Tag.hydrate({"id": 4})])
+
+        self.assertEqual(result, {"attached": [3, 4], "detached": [1]})
+        self.assertEqual(self.tag_ids(), [2, 3, 4])
+        self.assertEqual(self.tag_ids(user_id=2), [1])
+
+        queries = [record.query for record in logs.records]
+        self.assertEqual(len(queries), 3)
+        self.assertTrue(queries[0].startswith("SELECT"))
+        self.assertTrue(queries[1].startswith("INSERT"))
+        self.assertTrue(queries[2].startswith("DELETE"))
+
+    def test_attach_many_skips_attached_records_and_sets_extra_columns(self):
+        attached = self.user.attach_many("tags", [2, 3, 5], extra={"role": "viewer"})
+
+        self.assertEqual(attached, [3, 5])
+        self.assertEqual(self.tag_ids(), [1, 2, 3, 5])
+        self.assertEqual(
+            self.get_builder("ps_tag_user").where("tag_id", 5).first()["role"],
+            "viewer",
+        )
+
+    def test_detach_many(self):
+        self.assertEqual(User.tags.detach_many(self.user, [1, 5]), [1, 5])
+        self.assertEqual(self.tag_ids(), [2])
+
+        User.tags.detach_many(self.user)
+        self.assertEqual(self.tag_ids(), [])
+        self.assertEqual(self.tag_ids(user_id=2), [1])
+
+    def test_keys_are_split_under_the_parameter_limit(self):
+        self.user.attach_many("tags", [3, 4, 5])
+
+        # One binding goes to the user key, leaving two keys per statement
+        with mock.patch.object(SQLiteGrammar, "max_where_in_parameters", 3):
+            with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+                attached = self.user.attach_many("tags", [1, 2, 3, 4, 5])
+                User.tags.detach_many(self.user, [1, 2, 3, 4, 5])
+
+        queries = [record.query.split(" ")[0] for record in logs.records]
+        self.assertEqual(queries, ["SELECT"] * 3 + ["DELETE"] * 3)
+        self.assertEqual(attached, [])
+        self.assertEqual(self.tag_ids(), [])
+        self.assertEqual(self.tag_ids(user_id=2), [1])
+
+    def test_sync_rolls_back_when_a_statement_fails(self):
+        with mock.patch.object(
+            BelongsToMany, "_delete_pivot_rows", side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                self.user.sync("tags", [3])
+
+        self.assertEqual(self.tag_ids(), [1, 2])
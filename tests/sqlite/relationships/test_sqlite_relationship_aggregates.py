@@ -0,0 +1,273 @@
+import unittest
+
+from src.masoniteorm.config import load_config
+from src.masoniteorm.connections import ConnectionResolver
+from src.masoniteorm.exceptions import InvalidArgument
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from src.masoniteorm.relationships import (
+    belongs_to_many,
+    has_many,
+    has_many_through,
+    morph_many,
+    morph_to,
+    morph_to_many,
+)
+from src.masoniteorm.schema import Schema
+from src.masoniteorm.schema.platforms import SQLitePlatform
+from tests.integrations.config.database import DATABASES
+
+
+class Tag(Model):
+    __table__ = "ag_tags"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Comment(Model):
+    __table__ = "ag_comments"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class Like(Model):
+    __table__ = "ag_likes"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @morph_to("record_type", "record_id")
+    def record(self):
+        return
+
+    @morph_to_many("record_type", "record_id")
+    def records(self):
+        return
+
+
+class Post(Model):
+    __table__ = "ag_posts"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @belongs_to_many("post_id", "tag_id", "id", "id", table="ag_post_tag")
+    def tags(self):
+        return Tag
+
+    @morph_many("record_type", "record_id")
+    def likes(self):
+        return Like
+
+
+class Author(Model):
+    __table__ = "ag_authors"
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @has_many("id", "author_id")
+    def posts(self):
+        return Post
+
+    @has_many_through(None, "author_id", "id", "id", "post_id")
+    def comments(self):
+        return [Comment, Post]
+
+
+class TestSQLiteRelationshipAggregates(unittest.TestCase):
+    tables = [
+        "ag_authors",
+        "ag_posts",
+        "ag_tags",
+        "ag_post_tag",
+        "ag_comments",
+        "ag_likes",
+    ]
+
+    def setUp(self):
+        ConnectionResolver().set_connection_details(DATABASES)
+        self.DB = load_config().DB
+        self.morph_map = self.DB._morph_map
+        self.DB.morph_map({**(self.morph_map or {}), "ag_post": Post})
+
+        self.schema = Schema(
+            connection="dev",
+            connection_details=DATABASES,
+            platform=SQLitePlatform,
+        ).on("dev")
+
+        with self.schema.create_table_if_not_exists("ag_authors") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        with self.schema.create_table_if_not_exists("ag_posts") as table:
+            table.increments("id")
+            table.integer("author_id")
+            table.integer("votes")
+
+        with self.schema.create_table_if_not_exists("ag_tags") as table:
+            table.increments("id")
+            table.string("name", 50)
+
+        with self.schema.create_table_if_not_exists("ag_post_tag") as table:
+            table.increments("id")
+            table.integer("post_id")
+            table.integer("tag_id")
+
+        with self.schema.create_table_if_not_exists("ag_comments") as table:
+            table.increments("id")
+            table.integer("post_id")
+
+        with self.schema.create_table_if_not_exists("ag_likes") as table:
+            table.increments("id")
+            table.string("record_type", 50)
+            table.integer("record_id")
+
+        self.get_builder("ag_authors").bulk_create(
+            [{"id": 1, "name": "Joe"}, {"id": 2, "name": "Bob"}, {"id": 3, "name": "Al"}]
+        )
+        self.get_builder("ag_posts").bulk_create(
+            [
+                {"id": 1, "author_id": 1, "votes": 3},
+                {"id": 2, "author_id": 1, "votes": 5},
+                {"id": 3, "author_id": 2, "votes": 4},
+            ]
+        )
+        self.get_builder("ag_tags").bulk_create(
+            [{"id": 1, "name": "python"}, {"id": 2, "name": "orm"}]
+        )
+        self.get_builder("ag_post_tag").bulk_create(
+            [
+                {"id": 1, "post_id": 1, "tag_id": 1},
+                {"id": 2, "post_id": 1, "tag_id": 2},
+                {"id": 3, "post_id": 3, "tag_id": 2},
+            ]
+        )
+        self.get_builder("ag_comments").bulk_create(
+            [{"id": 1, "post_id": 1}, {"id": 2, "post_id": 2}, {"id": 3, "post_id": 3}]
+        )
+        self.get_builder("ag_likes").bulk_create(
+            [
+                {"id": 1, "record_type": "ag_post", "record_id": 2},
+                {"id": 2, "record_type": "ag_post", "record_id": 2},
+                {"id": 3, "record_type": "user", "record_id": 1},
+            ]
+        )
+
+    def tearDown(self):
+        self.DB.morph_map(self.morph_map)
+        for table in self.tables:
+            self.schema.drop_table_if_exists(table)
+
+    def get_builder(self, table):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def pluck(self, models, alias):
+        return [getattr(model, alias) for model in models]
+
+    def test_has_many_aggregates_match_in_both_modes(self):
+        for mode in ("subselect", "group"):
+            authors = (
+                Author.with_count("posts", mode=mode)
+                .with_sum("posts", "votes", mode=mode)
+                .with_avg("posts", "votes", mode=mode)
+                .with_min("posts", "votes", mode=mode)
+                .with_max("posts", "votes", mode=mode)
+                .with_exists("posts", mode=mode)
+                .order_by("id")
+                .get()
+            )
+
+            self.assertEqual(self.pluck(authors, "ag_posts_count"), [2, 1, 0])
+            self.assertEqual(self.pluck(authors, "posts_sum_votes"), [8, 4, None])
+            self.assertEqual(self.pluck(authors, "posts_avg_votes"), [4, 4, None])
+            self.assertEqual(self.pluck(authors, "posts_min_votes"), [3, 4, None])
+            self.assertEqual(self.pluck(authors, "posts_max_votes"), [5, 4, None])
+            self.assertEqual(self.pluck(authors, "posts_exists"), [True, True, False])
+            self.assertFalse(authors.first().is_dirty())
+
+    def test_group_mode_runs_one_query_per_aggregate(self):
+        with self.assertLogs("masoniteorm.connection.queries", "DEBUG") as logs:
+            authors = Author.with_sum("posts", "votes", mode="group").get()
+
+        queries = [record.query for record in logs.records]
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn("ag_posts", queries[0])
+        self.assertIn('GROUP BY "ag_posts"."author_id"', queries[1])
+        self.assertEqual(authors.count(), 3)
+
+    def test_callback_constrains_the_aggregate_query(self):
+        for mode in ("subselect", "group"):
+            authors = (
+                Author.with_aggregate(
+                    "posts",
+                    "count",
+                    callback=lambda query: query.where("ag_posts.votes", ">", 3),
+                    mode=mode,
+                )
+                .order_by("id")
+                .get()
+            )
+
+            self.assertEqual(self.pluck(authors, "ag_posts_count"), [1, 1, 0])
+
+    def test_belongs_to_many_aggregates(self):
+        for mode in ("subselect", "group"):
+            posts = (
+                Post.with_count("tags", mode=mode)
+                .with_exists(
+                    "tags",
+                    callback=lambda query: query.where("ag_tags.name", "python"),
+                    mode=mode,
+                )
+                .order_by("id")
+                .get()
+            )
+
+            self.assertEqual(self.pluck(posts, "ag_tags_count"), [2, 0, 1])
+            self.assertEqual(self.pluck(posts, "tags_exists"), [True, False, False])
+
+    def test_has_many_through_aggregates(self):
+        for mode in ("subselect", "group"):
+            authors = Author.with_count("comments", mode=mode).order_by("id").get()
+
+            self.assertEqual(self.pluck(authors, "comments_count"), [2, 1, 0])
+
+    def test_morph_many_aggregates(self):
+        for mode in ("subselect", "group"):
+            posts = Post.with_count("likes", mode=mode).order_by("id").get()
+
+            self.assertEqual(self.pluck(posts, "likes_count"), [0, 2, 0])
+
+    def test_morph_to_many_aggregates(self):
+        self.DB.morph_map({"ag_post": Post})
+        self.get_builder("ag_likes").create(
+            {"id": 4, "record_type": "ag_post", "record_id": 9}
+        )
+
+        for mode in ("subselect", "group"):
+            likes = Like.with_count("records", mode=mode).order_by("id").get()
+            self.assertEqual(self.pluck(likes, "records_count"), [1, 1, 0, 0])
+
+            likes = Like.with_exists("records", mode=mode).order_by("id").get()
+            self.assertEqual(
+                self.pluck(likes, "records_exists"), [True, True, False, False]
+            )
+
+        with self.assertRaises(InvalidArgument):
+            Like.with_sum("records", "votes")
+
+    def test_morph_to_aggregates_raise(self):
+        with self.assertRaises(InvalidArgument):
+            Like.with_count("record")
+
+    def test_invalid_aggregates_and_modes_raise(self):
+        with self.assertRaises(InvalidArgument):
+            Author.with_aggregate("posts", "median", "votes")
+
+        with self.assertRaises(InvalidArgument):
+            Author.with_count("posts", mode="join")